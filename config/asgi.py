@@ -20,8 +20,13 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 # is populated before importing code that may import ORM models.
 django_asgi_app = get_asgi_application()
 
+from players import draft_clock
 from players.routing import websocket_urlpatterns
 
+# Run this worker's pick clock from startup, so a running clock expires and
+# auto-picks even before any browser connects
+draft_clock.ensure_clock_task()
+
 application = ProtocolTypeRouter({
     "http": django_asgi_app,
     "websocket": AllowedHostsOriginValidator(
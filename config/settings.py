@@ -50,6 +50,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'players.middleware.RequestMetricsMiddleware',  # Per-view timing and query counts (/metrics)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -195,3 +196,45 @@ else:
             },
         },
     }
+
+# Process-local caches (players/cache_invalidation.py)
+# Broadcast invalidations to every Daphne worker over the channel layer when Redis is configured
+CACHE_INVALIDATION_BROADCAST = 'REDIS_URL' in os.environ
+
+# GeneralSetting cache (players/general_settings.py)
+# Reload settings at least this often (seconds) in case a broadcast is missed
+GENERAL_SETTINGS_CACHE_TTL = 300
+
+# Ranking aggregate cache (players/ranking_cache.py)
+# Recompute aggregates at least this often (seconds) in case a broadcast is missed
+RANKING_AGGREGATE_CACHE_TTL = 300
+
+# In-memory draft state (players/draft_state.py)
+# Rebuild it at least this often (seconds) in case a broadcast is missed
+DRAFT_STATE_CACHE_TTL = 300
+
+# Bootstrap bands on the player rankings analyze pages (players/ranking_stability.py)
+# Resamples per band, and worker processes used for large player pools (1 computes them in the web process)
+RANKING_BOOTSTRAP_RESAMPLES = 2000
+RANKING_BOOTSTRAP_WORKERS = int(os.environ.get('RANKING_BOOTSTRAP_WORKERS', '1'))
+
+# Draft simulator (players/draft_simulation.py)
+# Drafts played per simulation page, and worker processes used for large runs (1 plays them in the web process)
+DRAFT_SIMULATION_RUNS = 2000
+DRAFT_SIMULATION_WORKERS = int(os.environ.get('DRAFT_SIMULATION_WORKERS', '1'))
+
+# Pick clock (players/draft_clock.py)
+# Seconds between each worker's re-reads of the clock in case a clock message is missed
+DRAFT_CLOCK_RESYNC_SECONDS = 30
+
+# Division validation engine (players/validation_engine.py)
+# Recompute every validation at least this often (seconds) in case a write marked nothing dirty
+VALIDATION_ENGINE_TTL = 300
+
+# Validation triggers queued by ValidationMiddleware (players/validation_triggers.py)
+# Seconds to coalesce repeated triggers before running them on a worker thread (0 runs them inline)
+VALIDATION_TRIGGER_DEBOUNCE_SECONDS = 0.5
+
+# Request metrics (players/request_metrics.py)
+# Bearer token Prometheus uses to scrape /metrics; master password holders can always view it
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
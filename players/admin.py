@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Player, Team, Manager, Draft, PlayerRanking, ManagerDaughterRanking, SiblingRanking, DraftPick, TeamPreference, PracticeSlot, PracticeSlotRanking, GeneralSetting, ValidationCode, StarredDraftPick, DivisionValidationRegistry, Event, EventType, BackgroundCheck, Roster
+from .models import Player, Team, Manager, Draft, PlayerRanking, ManagerDaughterRanking, SiblingRanking, RankingEntry, RankingTally, DraftPick, DraftEvent, TeamPreference, PracticeSlot, PracticeSlotRanking, GeneralSetting, ValidationCode, StarredDraftPick, DivisionValidationRegistry, Event, EventType, BackgroundCheck, Roster
 
 
 @admin.register(Draft)
@@ -98,6 +98,20 @@ class SiblingRankingAdmin(admin.ModelAdmin):
     list_filter = ['manager']
 
 
+@admin.register(RankingEntry)
+class RankingEntryAdmin(admin.ModelAdmin):
+    list_display = ['kind', 'submission_id', 'manager', 'player', 'rank', 'suggested_round']
+    list_filter = ['kind', 'manager']
+    search_fields = ['player__first_name', 'player__last_name']
+
+
+@admin.register(RankingTally)
+class RankingTallyAdmin(admin.ModelAdmin):
+    list_display = ['kind', 'player', 'num_rankings', 'rank_sum', 'submission_borda']
+    list_filter = ['kind']
+    search_fields = ['player__first_name', 'player__last_name']
+
+
 @admin.register(DraftPick)
 class DraftPickAdmin(admin.ModelAdmin):
     list_display = ['round', 'pick', 'team', 'player', 'created_at', 'updated_at']
@@ -105,6 +119,13 @@ class DraftPickAdmin(admin.ModelAdmin):
     search_fields = ['player__first_name', 'player__last_name', 'team__name']
 
 
+@admin.register(DraftEvent)
+class DraftEventAdmin(admin.ModelAdmin):
+    list_display = ['seq', 'event_type', 'created_at']
+    list_filter = ['event_type']
+    readonly_fields = ['seq', 'event_type', 'payload', 'created_at']
+
+
 @admin.register(TeamPreference)
 class TeamPreferenceAdmin(admin.ModelAdmin):
     list_display = ['id', 'manager', 'created_at', 'updated_at']
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class PlayersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'players'
+
+    def ready(self):
+        # Register signal receivers (cache invalidation)
+        from . import signals  # noqa: F401
@@ -0,0 +1,193 @@
+"""
+Filterable, paged pool of the players not drafted yet.
+
+The draft board's pick modal and the "All Undrafted Players" table of the
+manager portal both used to get the whole pool at once: available_players_view
+returned every undrafted player on each open of the modal, and
+team_detail_view rendered a table row and a details modal per undrafted
+player into the page.  Both now fetch pages of the pool from here as they
+scroll.
+
+The pool comes from the shared draft state (players/draft_state.py), which
+keeps the undrafted set up to date pick by pick and reads every player's pool
+row (name, conflict, draftable, sibling requirement) with one query of the
+players table and one of the siblings table when it is built.  A request only filters, sorts and slices those rows in
+memory:
+
+- q: words that must each appear in the player's name
+- draftable / conflict: 'yes' or 'no' to keep only the draftable (or not)
+  players, or those with (or without) a conflict
+- sort: 'name' (last name, first name), or 'rank', the consensus order of
+  the player rankings (players/ranking_cache.py) with unranked players last
+- pages are keyed on the sort key of the last player sent, so players drafted
+  between two requests don't shift the pages that follow
+- sample: page_size players picked at random instead of a page (the board's
+  Random Pick button)
+"""
+import base64
+import json
+import random
+from bisect import bisect_right
+from collections import namedtuple
+
+from . import ranking_consensus, rankings
+from .draft_state import draft_states
+from .ranking_cache import ranking_aggregates
+
+SORT_NAME = 'name'
+SORT_RANK = 'rank'
+SORTS = (SORT_NAME, SORT_RANK)
+
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Sort position of players nobody ranked, after every ranked player
+UNRANKED = 1 << 30
+
+PoolQuery = namedtuple('PoolQuery', [
+    'terms', 'draftable', 'conflict', 'sort', 'after', 'page_size', 'sample', 'include', 'exclude', 'player_ids',
+])
+
+
+def _flag(params, name):
+    value = params.get(name, '').strip().lower()
+    if value in ('', 'any'):
+        return None
+    if value in ('yes', 'true', '1'):
+        return True
+    if value in ('no', 'false', '0'):
+        return False
+    raise ValueError(f'{name} must be yes or no')
+
+
+def _ids(value):
+    return [int(player_id) for player_id in value.split(',') if player_id.strip()]
+
+
+def parse_query(params):
+    """
+    PoolQuery from a request's GET parameters.  Raises ValueError, with a
+    message for the client, for a parameter it can't use.
+
+    Besides the filters above: include_player (comma-separated IDs of players
+    to list even if drafted, like the one being replaced when editing a pick),
+    exclude (IDs of players not to list, like a team's starred players), ids
+    (list only these players) and page_size (at most MAX_PAGE_SIZE).
+    """
+    sort = params.get('sort', '').strip() or SORT_NAME
+    if sort not in SORTS:
+        raise ValueError(f"sort must be one of: {', '.join(SORTS)}")
+
+    try:
+        page_size = int(params.get('page_size', PAGE_SIZE))
+        include = _ids(params.get('include_player', ''))
+        exclude = set(_ids(params.get('exclude', '')))
+        player_ids = set(_ids(params['ids'])) if params.get('ids', '').strip() else None
+    except ValueError:
+        raise ValueError('include_player, exclude, ids and page_size must be whole numbers')
+
+    after = None
+    cursor = params.get('after')
+    if cursor:
+        try:
+            cursor_sort, key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            after = tuple(key)
+        except (ValueError, TypeError):
+            raise ValueError('Invalid cursor')
+        if cursor_sort != sort:
+            raise ValueError('Invalid cursor')
+
+    return PoolQuery(
+        terms=params.get('q', '').casefold().split(),
+        draftable=_flag(params, 'draftable'),
+        conflict=_flag(params, 'conflict'),
+        sort=sort,
+        after=after,
+        page_size=max(1, min(page_size, MAX_PAGE_SIZE)),
+        sample=params.get('sample') == '1',
+        include=include,
+        exclude=exclude,
+        player_ids=player_ids,
+    )
+
+
+def consensus_ranks():
+    """{player_id: position} in the configured consensus order of the player rankings, 1 being the best ranked."""
+    aggregate = ranking_aggregates.get(rankings.KIND_PLAYER)
+    ranked_ids = aggregate.player_ids[aggregate.order(ranking_consensus.configured_method())].tolist()
+    return {player_id: position for position, player_id in enumerate(ranked_ids, start=1)}
+
+
+def _matches(player, query):
+    if player.id in query.exclude:
+        return False
+    if query.player_ids is not None and player.id not in query.player_ids:
+        return False
+    if query.draftable is not None and player.draftable != query.draftable:
+        return False
+    if query.conflict is not None and bool((player.conflict or '').strip()) != query.conflict:
+        return False
+    return all(term in player.search_name for term in query.terms)
+
+
+def page(query, with_ranks=False):
+    """
+    One page of the pool for a PoolQuery:
+
+    {'players': [{'id', 'first_name', 'last_name', 'conflict', 'draftable',
+    'has_sibling_requirement'(, 'consensus_rank')}], 'total': players matching
+    the filters, 'available_count': undrafted players, 'next_cursor': the
+    after of the next page, or None on the last}
+
+    consensus_rank (None for unranked players) is only included with_ranks,
+    so sorting by rank alone orders the pool without revealing the ranks.
+    """
+    state = draft_states.get()
+    players = [player for player in state.pool(query.include) if _matches(player, query)]
+
+    ranks = consensus_ranks() if with_ranks or query.sort == SORT_RANK else {}
+    if query.sort == SORT_RANK:
+        def sort_key(player):
+            return (ranks.get(player.id, UNRANKED),) + player.sort_name + (player.id,)
+    else:
+        def sort_key(player):
+            return player.sort_name + (player.id,)
+
+    next_cursor = None
+    if query.sample:
+        selected = random.sample(players, min(query.page_size, len(players)))
+    else:
+        keyed = sorted((sort_key(player), player) for player in players)
+        start = 0
+        if query.after is not None:
+            try:
+                start = bisect_right([key for key, player in keyed], query.after)
+            except TypeError:
+                raise ValueError('Invalid cursor')
+        keyed = keyed[start:start + query.page_size + 1]
+        if len(keyed) > query.page_size:
+            keyed = keyed[:query.page_size]
+            cursor = json.dumps([query.sort, list(keyed[-1][0])], separators=(',', ':'))
+            next_cursor = base64.urlsafe_b64encode(cursor.encode()).decode()
+        selected = [player for key, player in keyed]
+
+    rows = []
+    for player in selected:
+        row = {
+            'id': player.id,
+            'first_name': player.first_name,
+            'last_name': player.last_name,
+            'conflict': player.conflict,
+            'draftable': player.draftable,
+            'has_sibling_requirement': player.has_sibling_requirement,
+        }
+        if with_ranks:
+            row['consensus_rank'] = ranks.get(player.id)
+        rows.append(row)
+
+    return {
+        'players': rows,
+        'total': len(players),
+        'available_count': state.available_count(),
+        'next_cursor': next_cursor,
+    }
@@ -0,0 +1,126 @@
+"""
+Cross-worker invalidation for the process-local caches in this app.
+
+Each cache registers a name and a callback.  When a write happens, the
+signal handler calls broadcast_invalidation(name), which sends a message
+over the channel layer; every worker process (including the sender, unless
+it already brought its own cache up to date) runs the registered callback
+when it receives it.
+"""
+import asyncio
+import logging
+import threading
+import uuid
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_GROUP = 'cache_invalidation'
+INVALIDATION_MESSAGE_TYPE = 'cache.invalidate'
+
+_handlers = {}
+
+# Identifies this process's broadcasts
+_origin = uuid.uuid4().hex
+
+_listener_lock = threading.Lock()
+_listener_started = False
+
+
+def broadcast_enabled():
+    return getattr(settings, 'CACHE_INVALIDATION_BROADCAST', False)
+
+
+def register(name, callback):
+    """Run callback whenever an invalidation for name is received."""
+    _handlers[name] = callback
+
+
+def broadcast_invalidation(name, include_self=True):
+    """
+    Tell every worker to drop the cache registered under name; with
+    include_self=False this process ignores its own message.
+    """
+    if not broadcast_enabled():
+        return
+
+    from asgiref.sync import async_to_sync
+    from channels.layers import get_channel_layer
+
+    try:
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+        async_to_sync(channel_layer.group_send)(INVALIDATION_GROUP, {
+            'type': INVALIDATION_MESSAGE_TYPE,
+            'name': name,
+            'origin': None if include_self else _origin,
+        })
+    except Exception as e:
+        logger.error(f"Error broadcasting cache invalidation for '{name}': {str(e)}")
+
+
+def start_invalidation_listener():
+    """
+    Start a daemon thread that listens for invalidation broadcasts from other workers.
+
+    Only one listener runs per process; it is a no-op unless
+    CACHE_INVALIDATION_BROADCAST is enabled.
+    """
+    global _listener_started
+
+    if _listener_started or not broadcast_enabled():
+        return
+
+    with _listener_lock:
+        if _listener_started:
+            return
+        _listener_started = True
+
+    thread = threading.Thread(
+        target=asyncio.run,
+        args=(_listen_for_invalidations(),),
+        name='cache-invalidation',
+        daemon=True,
+    )
+    thread.start()
+
+
+def _invalidate_all():
+    for callback in list(_handlers.values()):
+        callback()
+
+
+async def _listen_for_invalidations():
+    from channels.layers import get_channel_layer
+
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+
+    # Group membership expires on the channel layer, so re-join periodically
+    rejoin_interval = getattr(channel_layer, 'group_expiry', 86400) / 2
+    channel_name = None
+
+    while True:
+        try:
+            if channel_name is None:
+                channel_name = await channel_layer.new_channel()
+            await channel_layer.group_add(INVALIDATION_GROUP, channel_name)
+
+            try:
+                message = await asyncio.wait_for(channel_layer.receive(channel_name), timeout=rejoin_interval)
+            except asyncio.TimeoutError:
+                continue
+
+            if message.get('type') == INVALIDATION_MESSAGE_TYPE and message.get('origin') != _origin:
+                callback = _handlers.get(message.get('name'))
+                if callback:
+                    callback()
+        except Exception as e:
+            # Messages may have been missed while disconnected
+            logger.error(f"Cache invalidation listener error: {str(e)}")
+            _invalidate_all()
+            channel_name = None
+            await asyncio.sleep(5)
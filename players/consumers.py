@@ -1,11 +1,14 @@
 import json
+from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
 
+from . import draft_clock, draft_events
+
 
 class DraftConsumer(AsyncWebsocketConsumer):
     async def connect(self):
         # Join draft updates group
-        self.group_name = 'draft_updates'
+        self.group_name = draft_events.GROUP_NAME
 
         await self.channel_layer.group_add(
             self.group_name,
@@ -14,6 +17,12 @@ class DraftConsumer(AsyncWebsocketConsumer):
 
         await self.accept()
 
+        # Restart this worker's pick clock task if it has stopped; new clients
+        # get the clock as it is now
+        draft_clock.ensure_clock_task()
+        clock = await database_sync_to_async(draft_clock.status)()
+        await self.send(text_data=json.dumps(clock))
+
     async def disconnect(self, close_code):
         # Leave draft updates group
         await self.channel_layer.group_discard(
@@ -22,47 +31,37 @@ class DraftConsumer(AsyncWebsocketConsumer):
         )
 
     async def receive(self, text_data):
-        # We don't expect to receive messages from clients in this implementation
-        pass
+        # Clients send {"type": "resume", "after": seq} after reconnecting (or
+        # noticing a gap) to get the events they missed
+        try:
+            data = json.loads(text_data)
+            after = int(data.get('after', 0)) if data.get('type') == 'resume' else None
+        except (ValueError, TypeError, AttributeError):
+            return
+        if after is None:
+            return
+
+        catch_up = await database_sync_to_async(draft_events.catch_up)(after)
+        await self.send(text_data=json.dumps(catch_up))
 
-    # Receive message from group
+    # Receive message from group: logged draft events (players/draft_events.py),
+    # sent on with their seq
     async def draft_update(self, event):
         # Send message to WebSocket
-        await self.send(text_data=json.dumps({
-            'type': 'draft_update',
-            'player_id': event['player_id'],
-            'player_name': event['player_name'],
-            'player_birthday': event.get('player_birthday'),
-            'player_school': event.get('player_school'),
-            'player_history': event.get('player_history'),
-            'player_conflict': event.get('player_conflict'),
-            'player_draftable': event.get('player_draftable'),
-            'team_name': event['team_name'],
-            'team_id': event.get('team_id'),
-            'round': event['round'],
-            'pick': event['pick']
-        }))
+        await self.send(text_data=json.dumps(event))
 
     async def undraft_update(self, event):
         # Send undraft message to WebSocket
-        await self.send(text_data=json.dumps({
-            'type': 'undraft_update',
-            'player_id': event['player_id'],
-            'player_name': event['player_name'],
-            'player_birthday': event.get('player_birthday'),
-            'player_school': event.get('player_school'),
-            'player_history': event.get('player_history'),
-            'player_conflict': event.get('player_conflict'),
-            'player_draftable': event.get('player_draftable'),
-            'team_name': event['team_name'],
-            'team_id': event.get('team_id'),
-            'round': event['round'],
-            'pick': event['pick']
-        }))
+        await self.send(text_data=json.dumps(event))
 
     async def draft_reset(self, event):
         # Send draft reset message to WebSocket
-        await self.send(text_data=json.dumps({
-            'type': 'draft_reset',
-            'message': event.get('message', 'Draft has been reset')
-        }))
+        await self.send(text_data=json.dumps(event))
+
+    async def draft_reorder(self, event):
+        # Send draft reorder message to WebSocket
+        await self.send(text_data=json.dumps(event))
+
+    # Pick clock changes (players/draft_clock.py); not logged, so no seq
+    async def draft_clock(self, event):
+        await self.send(text_data=json.dumps(event))
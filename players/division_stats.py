@@ -0,0 +1,113 @@
+"""
+Single-pass division statistics for the setup validations.
+
+The validators used to count the same tables independently (Team.objects.count()
+ran in six of them).  DivisionStats loads each group of counts with one
+conditional-aggregation query, the first time any count in that group is
+read, and the validation engine shares one instance across a refresh.
+"""
+from django.db.models import Count, Q
+from django.utils.functional import cached_property
+
+from .models import Player, Team, Manager, TeamPreference, PracticeSlot
+from . import rankings
+
+
+class DivisionStats:
+    """Division-wide counts, loaded lazily one aggregate query per group."""
+
+    @cached_property
+    def _players(self):
+        return Player.objects.aggregate(
+            total=Count('id'),
+            with_team=Count('id', filter=Q(team__isnull=False)),
+        )
+
+    @cached_property
+    def _teams(self):
+        return Team.objects.aggregate(
+            total=Count('id'),
+            with_manager=Count('id', filter=Q(manager__isnull=False)),
+            with_practice_slot=Count('id', filter=Q(practice_slot__isnull=False)),
+        )
+
+    @cached_property
+    def _managers(self):
+        return Manager.objects.aggregate(
+            total=Count('id'),
+            with_daughter=Count('id', filter=Q(daughter__isnull=False)),
+        )
+
+    # Players
+    @property
+    def player_count(self):
+        return self._players['total']
+
+    @property
+    def players_with_team(self):
+        return self._players['with_team']
+
+    @property
+    def players_without_team(self):
+        return self.player_count - self.players_with_team
+
+    # Teams
+    @property
+    def team_count(self):
+        return self._teams['total']
+
+    @property
+    def teams_with_manager(self):
+        return self._teams['with_manager']
+
+    @property
+    def teams_without_manager(self):
+        return self.team_count - self.teams_with_manager
+
+    @property
+    def teams_with_practice_slot(self):
+        return self._teams['with_practice_slot']
+
+    @property
+    def teams_without_practice_slot(self):
+        return self.team_count - self.teams_with_practice_slot
+
+    # Managers
+    @property
+    def manager_count(self):
+        return self._managers['total']
+
+    @property
+    def managers_with_daughter(self):
+        return self._managers['with_daughter']
+
+    @property
+    def managers_without_daughter(self):
+        return self.manager_count - self.managers_with_daughter
+
+    # Submissions
+    @cached_property
+    def team_preferences_count(self):
+        return TeamPreference.objects.count()
+
+    @cached_property
+    def practice_slot_count(self):
+        return PracticeSlot.objects.count()
+
+    @property
+    def required_player_ranking_length(self):
+        """A complete player ranking ranks (Number of Teams) x 2 players."""
+        return self.team_count * 2
+
+    @cached_property
+    def player_ranking_lengths(self):
+        return rankings.submission_lengths(rankings.KIND_PLAYER)
+
+    @property
+    def complete_player_rankings_count(self):
+        required = self.required_player_ranking_length
+        return sum(1 for length in self.player_ranking_lengths if length == required)
+
+    @cached_property
+    def daughter_ranking_lengths(self):
+        return rankings.submission_lengths(rankings.KIND_DAUGHTER)
@@ -0,0 +1,390 @@
+"""
+Pick clock with server-side auto-pick.
+
+Without a clock the draft board waits on whoever is slow.  The clock gives
+each pick of the draftable rounds pick_clock_seconds; when they run out, the
+server makes the pick for the team on the clock:
+
+1. a sibling the team owes: one it must draft with a player it already has
+2. its starred players (StarredDraftPick), in its star order
+3. the Borda consensus leader of the player rankings (players/ranking_cache.py)
+4. the first eligible player by name, if nobody ranked any eligible player
+
+A player is eligible if she is undrafted, draftable, not a manager's daughter
+(daughters are placed in their own slots), and, if she must be drafted with
+her siblings, none of them went to another team and the team has enough
+picks left in the draftable rounds to take them too.  The decision is made
+from the in-memory draft state (players/draft_state.py) and the cached
+ranking aggregate; the team's stars are its only query, so the board never
+waits on it.  The hat pick rounds are drawn from a hat, so the clock stops
+when it reaches them.
+
+The clock lives on the Draft row (the slot on the clock and its deadline),
+so every worker sees the same one, and is only written under the same row
+lock as the pick views.  Every change is sent to the ws/draft/ group as a
+draft_clock message, which DraftConsumer passes on to the board and the
+team pages for their countdowns.  Clock messages describe the clock as it
+is now rather than an event, so they carry no seq and aren't logged.
+
+Each worker process runs one asyncio task (run_clock, in a daemon thread
+started with the server in config/asgi.py, and again by start() or a
+DraftConsumer connect if it has stopped) that reads the clock from the Draft
+row, follows the clock messages on the same group and, when the deadline
+passes, calls expire(); a deadline that passed while no task ran (e.g.
+during a deploy) is expired as soon as one starts.  Several workers may try at
+once; expire() makes the pick only if the clock is still on that slot with
+that deadline, so only the first one does.  The tasks re-read the clock
+every DRAFT_CLOCK_RESYNC_SECONDS in case a message was missed.
+"""
+import asyncio
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from channels.db import database_sync_to_async
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from . import draft_events, ranking_consensus, rankings
+from .draft_state import draft_states
+from .models import Draft, DraftPick, Player, StarredDraftPick
+from .ranking_cache import ranking_aggregates
+
+logger = logging.getLogger(__name__)
+
+CLOCK_MESSAGE_TYPE = 'draft_clock'
+
+MIN_SECONDS = 5
+MAX_SECONDS = 3600
+
+# Seconds between the clock tasks' re-reads of the clock
+DEFAULT_RESYNC_SECONDS = 30
+
+# Why an auto-pick chose its player, sent with the pick event
+REASON_SIBLING = 'sibling'
+REASON_STARRED = 'starred'
+REASON_CONSENSUS = 'consensus'
+REASON_NAME = 'name'
+
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def _deadline_timestamp(draft):
+    return draft.clock_deadline.timestamp() if draft.clock_deadline else None
+
+
+def clock_message(draft, message=None):
+    """The draft_clock message describing a draft's clock (stopped if draft is None)."""
+    running = draft is not None and draft.clock_deadline is not None
+    state = draft_states.get()
+    team_id = state.slot_team(draft.clock_round, draft.clock_pick) if running else None
+    return {
+        'type': CLOCK_MESSAGE_TYPE,
+        'running': running,
+        'round': draft.clock_round if running else None,
+        'pick': draft.clock_pick if running else None,
+        'team_id': team_id,
+        'team_name': state.team_names.get(team_id) if team_id else None,
+        'deadline': _deadline_timestamp(draft) if running else None,
+        'seconds': draft.pick_clock_seconds if draft is not None else None,
+        # Lets clients correct for their own clock being off
+        'server_time': time.time(),
+        'message': message,
+    }
+
+
+def status():
+    """The draft_clock message for the current clock."""
+    return clock_message(Draft.objects.order_by('-created_at').first())
+
+
+def _broadcast(draft, message=None):
+    """Send the draft's clock to every connected client once the surrounding transaction commits."""
+    clock = clock_message(draft, message)
+
+    def send():
+        async_to_sync(get_channel_layer().group_send)(draft_events.GROUP_NAME, {**clock, 'server_time': time.time()})
+
+    transaction.on_commit(send)
+
+
+def _locked_draft():
+    """The current draft, locked until the surrounding transaction ends (serializes pick writes)."""
+    return Draft.objects.select_for_update().order_by('-created_at').first()
+
+
+def _filled_slots():
+    """(round, pick) of every slot with a player, from the database so picks made by other workers count."""
+    return set(DraftPick.objects.filter(player__isnull=False).values_list('round', 'pick'))
+
+
+def _draftable_slots(state):
+    """(round, pick, team_id) of the slots of the draftable rounds owned by a team, in board order."""
+    return [
+        (round_num, pick_num, team_id)
+        for round_num, round_picks in sorted(state.pick_assignments().items())
+        if round_num <= state.rounds_draftable
+        for pick_num, team_id in sorted(round_picks.items())
+    ]
+
+
+def next_slot(state, filled):
+    """(round, pick) of the first empty slot of the draftable rounds, or None."""
+    for round_num, pick_num, team_id in _draftable_slots(state):
+        if (round_num, pick_num) not in filled:
+            return round_num, pick_num
+    return None
+
+
+def _save_clock(draft, message=None):
+    # update() rather than save(): a Draft save rebuilds the draft state on every worker
+    Draft.objects.filter(pk=draft.pk).update(
+        pick_clock_seconds=draft.pick_clock_seconds,
+        clock_round=draft.clock_round,
+        clock_pick=draft.clock_pick,
+        clock_deadline=draft.clock_deadline,
+    )
+    _broadcast(draft, message)
+
+
+def _move_clock(draft, filled, restart=False):
+    """
+    Put the first empty slot on the clock, with a full clock if it changed
+    (or restart); stop the clock if there is none.  The draft must be locked.
+    """
+    slot = next_slot(draft_states.get(), filled)
+    if slot is None:
+        draft.clock_round = draft.clock_pick = draft.clock_deadline = None
+        _save_clock(draft, 'The draftable rounds are complete')
+    elif restart or (draft.clock_round, draft.clock_pick) != slot:
+        draft.clock_round, draft.clock_pick = slot
+        draft.clock_deadline = timezone.now() + timedelta(seconds=draft.pick_clock_seconds)
+        _save_clock(draft)
+
+
+def start(seconds):
+    """
+    Start the clock on the first empty pick with `seconds` per pick.  Raises
+    ValueError if there is no draft or no empty pick in the draftable rounds.
+    """
+    if not MIN_SECONDS <= seconds <= MAX_SECONDS:
+        raise ValueError(f'The pick clock must be between {MIN_SECONDS} and {MAX_SECONDS} seconds')
+
+    with transaction.atomic():
+        draft = _locked_draft()
+        if draft is None:
+            raise ValueError('No draft found. Please create a draft first.')
+        filled = _filled_slots()
+        if next_slot(draft_states.get(), filled) is None:
+            raise ValueError('There is no pick left in the draftable rounds to put on the clock')
+        draft.pick_clock_seconds = seconds
+        _move_clock(draft, filled, restart=True)
+        # Make sure this worker's task is there to run the clock out
+        transaction.on_commit(ensure_clock_task)
+    return draft
+
+
+def stop(message=None):
+    """Stop the clock."""
+    with transaction.atomic():
+        draft = _locked_draft()
+        if draft is not None and draft.clock_deadline is not None:
+            draft.clock_round = draft.clock_pick = draft.clock_deadline = None
+            _save_clock(draft, message)
+    return draft
+
+
+def advance():
+    """
+    After a pick or undraft: move a running clock to the first empty pick,
+    giving it a full clock if that changed.
+    """
+    # Cheap check first: most drafts run without the clock
+    if not Draft.objects.filter(clock_deadline__isnull=False).exists():
+        return
+
+    with transaction.atomic():
+        draft = _locked_draft()
+        if draft is not None and draft.clock_deadline is not None:
+            _move_clock(draft, _filled_slots())
+
+
+def _eligible(state, player_id, team_player_ids, picks_left):
+    """Whether team_id may be given player_id by an auto-pick (see the module docstring)."""
+    player = state.pool_players.get(player_id)
+    if player is None or player_id not in state.available or not player.draftable or state.is_daughter(player_id):
+        return False
+
+    owed = 0
+    for sibling_id in state.sibling_ids.get(player_id, ()):
+        if sibling_id in state.available:
+            owed += 1
+        elif sibling_id not in team_player_ids:
+            # Drafted by another team
+            return False
+    return owed <= picks_left
+
+
+def choose_player(state, team_id, starred_ids, picks_left):
+    """
+    (player_id, reason) the team on the clock is given when its time runs
+    out, or (None, None) if no player is eligible.  starred_ids is the team's
+    star list in order; picks_left counts its empty picks in the draftable
+    rounds after this one.
+    """
+    team_player_ids = set(state.team_player_ids(team_id))
+
+    def eligible(player_id):
+        return _eligible(state, player_id, team_player_ids, picks_left)
+
+    # Siblings of the team's players that must join them
+    for player_id in team_player_ids:
+        for sibling_id in state.sibling_ids.get(player_id, ()):
+            if eligible(sibling_id):
+                return sibling_id, REASON_SIBLING
+
+    for player_id in starred_ids:
+        if eligible(player_id):
+            return player_id, REASON_STARRED
+
+    aggregate = ranking_aggregates.get(rankings.KIND_PLAYER)
+    for player_id in aggregate.player_ids[aggregate.order(ranking_consensus.BORDA)].tolist():
+        if eligible(player_id):
+            return player_id, REASON_CONSENSUS
+
+    candidates = [player for player in state.pool() if eligible(player.id)]
+    if candidates:
+        return min(candidates, key=lambda player: player.sort_name + (player.id,)).id, REASON_NAME
+    return None, None
+
+
+def expire(round_num, pick_num, deadline):
+    """
+    Auto-pick for the slot on the clock if its deadline (a timestamp) has
+    passed and the clock hasn't moved on meanwhile, then move the clock on.
+    Returns the new DraftPick, or None if there was nothing to do.
+    """
+    with transaction.atomic():
+        draft = _locked_draft()
+        if (
+            draft is None or draft.clock_deadline is None
+            or (draft.clock_round, draft.clock_pick) != (round_num, pick_num)
+            or _deadline_timestamp(draft) != deadline
+            or timezone.now() < draft.clock_deadline
+        ):
+            return None
+
+        filled = _filled_slots()
+        if (round_num, pick_num) in filled:
+            # Picked some way that didn't move the clock
+            _move_clock(draft, filled)
+            return None
+
+        state = draft_states.get()
+        team_id = state.slot_team(round_num, pick_num)
+        starred_ids = list(StarredDraftPick.objects.filter(team_id=team_id).order_by('order', 'id').values_list('player_id', flat=True))
+        picks_left = sum(
+            1 for slot in _draftable_slots(state)
+            if slot[2] == team_id and slot[:2] > (round_num, pick_num) and slot[:2] not in filled
+        )
+
+        # This worker's state may not have a pick made on another one yet; the
+        # unique player constraint catches that, and a rebuilt state won't
+        draft_pick = None
+        for _ in range(2):
+            player_id, reason = choose_player(state, team_id, starred_ids, picks_left)
+            if player_id is None:
+                break
+            try:
+                with transaction.atomic():
+                    draft_pick = DraftPick.objects.create(round=round_num, pick=pick_num, player_id=player_id, team_id=team_id)
+                break
+            except IntegrityError:
+                draft_states.bump()
+                state = draft_states.get()
+
+        if draft_pick is None:
+            draft.clock_round = draft.clock_pick = draft.clock_deadline = None
+            _save_clock(draft, 'No eligible player is left to auto-pick; the clock has stopped')
+            return None
+
+        # Log the auto-pick and broadcast it like a pick from the board
+        player = Player.objects.get(id=player_id)
+        draft_events.publish(draft_events.PICK, {
+            **draft_events.player_fields(player),
+            'team_name': state.team_names.get(team_id),
+            'team_id': team_id,
+            'round': round_num,
+            'pick': pick_num,
+            'auto_pick': reason,
+        })
+
+        filled.add((round_num, pick_num))
+        _move_clock(draft, filled)
+    return draft_pick
+
+
+def _clock_slot():
+    """(round, pick, deadline) of the slot on the clock, or None if it is stopped."""
+    draft = Draft.objects.order_by('-created_at').first()
+    if draft is None or draft.clock_deadline is None:
+        return None
+    return draft.clock_round, draft.clock_pick, _deadline_timestamp(draft)
+
+
+async def run_clock():
+    """Follow the clock and auto-pick when it runs out (one task per worker process)."""
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+
+    resync = getattr(settings, 'DRAFT_CLOCK_RESYNC_SECONDS', DEFAULT_RESYNC_SECONDS)
+    channel_name = None
+    clock = None
+
+    while True:
+        try:
+            if channel_name is None:
+                channel_name = await channel_layer.new_channel()
+                await channel_layer.group_add(draft_events.GROUP_NAME, channel_name)
+                clock = await database_sync_to_async(_clock_slot)()
+
+            timeout = resync if clock is None else min(resync, max(0.0, clock[2] - time.time()))
+            try:
+                message = await asyncio.wait_for(channel_layer.receive(channel_name), timeout=timeout)
+            except asyncio.TimeoutError:
+                if clock is not None and time.time() >= clock[2]:
+                    await database_sync_to_async(expire)(*clock)
+                # Group membership expires on the channel layer, so re-join with each re-read
+                await channel_layer.group_add(draft_events.GROUP_NAME, channel_name)
+                clock = await database_sync_to_async(_clock_slot)()
+                continue
+
+            if message.get('type') == CLOCK_MESSAGE_TYPE:
+                clock = (message['round'], message['pick'], message['deadline']) if message.get('running') else None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Draft clock error: {str(e)}")
+            channel_name = None
+            await asyncio.sleep(5)
+
+
+def ensure_clock_task():
+    """
+    Start this process's clock task in a daemon thread with its own event
+    loop, unless it is already running, so the clock doesn't depend on a
+    browser being connected.
+    """
+    global _thread
+
+    with _thread_lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _thread = threading.Thread(target=asyncio.run, args=(run_clock(),), name='draft-clock', daemon=True)
+        _thread.start()
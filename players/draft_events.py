@@ -0,0 +1,114 @@
+"""
+Sequence-numbered log of draft events for WebSocket clients.
+
+Team pages follow the draft live over the ws/draft/ socket (DraftConsumer in
+players/consumers.py).  A manager whose phone drops off wifi used to miss
+every pick made meanwhile and had to reload the whole team page.  Instead,
+every pick, undraft and reset is appended to the draft_events table before it
+is sent, and the message carries the event's seq:
+
+- clients remember the last seq they applied; a message whose seq isn't the
+  next one means they missed some
+- on reconnect (or a gap) they ask for the events after their last seq, with
+  a {"type": "resume", "after": N} socket message or GET /api/draft/events/
+  ?after=N, and apply only those
+- a reset makes every earlier event irrelevant (clients reload on it), so
+  publishing one deletes the events before it
+- a reorder (a new draft order, or the managers' daughters placed in their
+  rounds) moves picks around the board; it carries the new slot map and
+  clients reload on it too
+- a client that missed more than CATCH_UP_LIMIT events is told to reload
+- a pick or undraft may be sent with the last seq its client knows of; it is
+  refused if conflicting_events() finds the slot or player changed since,
+  or the draft was reset or reordered
+
+Messages keep the fields DraftConsumer always sent, so their payloads are the
+same as before plus seq.
+"""
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+from .models import DraftEvent, DraftPick
+
+GROUP_NAME = 'draft_updates'
+
+PICK = 'draft_update'
+UNDRAFT = 'undraft_update'
+RESET = 'draft_reset'
+REORDER = 'draft_reorder'
+
+# Missed events returned by one catch-up; clients further behind reload
+CATCH_UP_LIMIT = 500
+
+
+def player_fields(player):
+    """Fields of a picked or undrafted player sent with pick and undraft events."""
+    return {
+        'player_id': player.id,
+        'player_name': f"{player.first_name} {player.last_name}",
+        'player_birthday': str(player.birthday) if player.birthday else None,
+        'player_school': player.school,
+        'player_history': player.history,
+        'player_conflict': player.conflict,
+        'player_draftable': player.draftable,
+    }
+
+
+def publish(event_type, payload):
+    """
+    Append an event to the log and, once the surrounding transaction commits,
+    send it with its seq to every connected client.
+    """
+    event = DraftEvent.objects.create(event_type=event_type, payload=payload)
+    if event_type == RESET:
+        DraftEvent.objects.filter(seq__lt=event.seq).delete()
+
+    message = event.message()
+    transaction.on_commit(lambda: async_to_sync(get_channel_layer().group_send)(GROUP_NAME, message))
+    return event
+
+
+def slot_map():
+    """The payload field of a reorder event: [round, pick, team_id, player_id] of every pick on the board."""
+    return [list(slot) for slot in DraftPick.objects.order_by('round', 'pick').values_list('round', 'pick', 'team_id', 'player_id')]
+
+
+def latest_seq():
+    """Seq of the last event, or 0 if there is none; pages render with it to start catching up from."""
+    return DraftEvent.objects.order_by('-seq').values_list('seq', flat=True).first() or 0
+
+
+def conflicting_events(seq, round_num, pick_num, player_ids=()):
+    """
+    Events after seq that a pick or undraft based on the draft as of seq would
+    silently overwrite: changes to the (round, pick) slot, picks and undrafts
+    of any of player_ids, and resets and reorders.
+    """
+    slot = (str(round_num), str(pick_num))
+    return [
+        event for event in DraftEvent.objects.filter(seq__gt=seq).order_by('seq')
+        if event.event_type in (RESET, REORDER)
+        or (str(event.payload.get('round')), str(event.payload.get('pick'))) == slot
+        or event.payload.get('player_id') in player_ids
+    ]
+
+
+def events_after(seq, limit=CATCH_UP_LIMIT):
+    """
+    (messages, complete): the messages of the events after seq, oldest first,
+    and whether that is all of them (False if there are more than limit).
+    """
+    events = list(DraftEvent.objects.filter(seq__gt=seq).order_by('seq')[:limit + 1])
+    return [event.message() for event in events[:limit]], len(events) <= limit
+
+
+def catch_up(seq):
+    """The catch-up response for a client whose last applied event is seq."""
+    messages, complete = events_after(seq)
+    return {
+        'type': 'catch_up',
+        'events': messages,
+        'complete': complete,
+        'last_seq': messages[-1]['seq'] if messages else seq,
+    }
@@ -0,0 +1,81 @@
+"""
+Draft order priority formula.
+
+The draft order is set from the rankings: every team's manager has a daughter,
+and the teams whose daughters the managers rank highest pick last.  A team's
+priority score (lowest picks first) is:
+
+- elite daughter (ranked in the player rankings): her overall Borda score
+  minus half her Borda score in the manager's daughter rankings
+- otherwise: minus her Borda score in the manager's daughter rankings, so
+  every non-elite daughter's team picks before the elite ones
+
+Each daughter is then drafted by her team in the median round the managers
+suggested for her (round 1 if none).  set_draft_order_and_daughters_view
+applies this, export_priority_scores_view exports it, and the draft simulator
+(players/draft_simulation.py) evaluates it without saving anything.
+"""
+from . import rankings
+from .models import Team
+from .ranking_cache import ranking_aggregates
+
+
+def team_priorities():
+    """
+    [{'team', 'daughter', 'classification', 'priority_score', 'overall_borda',
+    'daughter_borda', 'median_round'}] for every team whose manager has a
+    daughter, in draft order (lowest priority score first).
+    """
+    teams_with_daughters = Team.objects.filter(
+        manager__isnull=False,
+        manager__daughter__isnull=False
+    ).select_related('manager', 'manager__daughter').distinct()
+
+    # Borda counts for all players in player_rankings (higher rank = higher score)
+    player_aggregate = ranking_aggregates.get(rankings.KIND_PLAYER)
+    player_borda_scores = player_aggregate.by_player(player_aggregate.submission_borda)
+
+    # Borda counts for manager's daughters in manager_daughter_rankings, and the
+    # median of their suggested rounds (round 1 if not given)
+    daughter_aggregate = ranking_aggregates.get(rankings.KIND_DAUGHTER)
+    daughter_borda_scores = daughter_aggregate.by_player(daughter_aggregate.submission_borda)
+    daughter_median_rounds = daughter_aggregate.by_player(daughter_aggregate.median_rounds(missing=1))
+
+    priorities = []
+    for team in teams_with_daughters:
+        daughter = team.manager.daughter
+        daughter_borda = daughter_borda_scores.get(daughter.id, 0)
+
+        if daughter.id in player_borda_scores:
+            # Elite daughter - picks later (higher score = picks later)
+            priority_score = player_borda_scores[daughter.id] - (daughter_borda * 0.5)
+            classification = "Elite Daughter"
+        else:
+            # Non-elite daughter - picks earlier
+            # Negative score to ensure they sort before elite daughters
+            # Lower daughter rank (worse) = more negative = picks earlier
+            priority_score = -(daughter_borda)
+            classification = "Non-Elite Daughter"
+
+        priorities.append({
+            'team': team,
+            'daughter': daughter,
+            'classification': classification,
+            'priority_score': priority_score,
+            'overall_borda': player_borda_scores.get(daughter.id, 0),
+            'daughter_borda': daughter_borda,
+            'median_round': daughter_median_rounds.get(daughter.id, 1),
+        })
+
+    # Lowest score picks first
+    priorities.sort(key=lambda item: item['priority_score'])
+    return priorities
+
+
+def snake_pick(round_num, draft_position, total_teams):
+    """Pick number within a round of the team at draft_position (1-based) in a snake draft."""
+    # Odd rounds: pick = draft_position
+    # Even rounds: pick = (total_teams - draft_position + 1)
+    if round_num % 2 == 1:
+        return draft_position
+    return total_teams - draft_position + 1
@@ -0,0 +1,276 @@
+"""
+Monte Carlo simulation of the draft.
+
+Whether the draft order priority formula (players/draft_priority.py) is fair
+depends on how the draft actually plays out, which the order alone doesn't
+show.  The simulator plays the full snake draft many times and reports:
+
+- each team's expected strength: the mean (and spread) of the consensus
+  points of the players it ends up with, a player ranked at position k of R
+  ranked players being worth R - k + 1 points and an unranked one nothing
+- how often each team ends up the strongest
+- each player's pick position: the mean overall pick and the band covering
+  the middle CONFIDENCE of the drafts
+- draft order fairness: the spread of the teams' expected strengths and how
+  strongly expected strength follows the draft position
+
+Each team drafts its starred players (StarredDraftPick) first, in its star
+order, then the best player left by its own view of the consensus ranking of
+the player rankings: every draft, every team sees each player's consensus
+position plus Gaussian noise (noise, in positions), so teams disagree the way
+managers do.  Managers' daughters are fixed at their team's pick in their
+round, as set_draft_order_and_daughters_view places them.  Sibling pairs and
+the draftable flag are not modelled.
+
+The drafts of a chunk are played side by side: each pick is one argmin over a
+drafts x players matrix, so the Python loop runs once per pick, not once per
+pick per draft.  Chunks are spread over a process pool for large runs.
+
+load_inputs() reads the database (with function-level imports); the rest only
+does NumPy work, so worker processes can import this module without Django.
+"""
+import math
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DEFAULT_RUNS = 2000
+MAX_RUNS = 100_000
+
+# Standard deviation, in consensus positions, of a team's view of each player
+DEFAULT_NOISE = 5.0
+
+# Drafts played side by side per chunk
+CHUNK_RUNS = 250
+
+# Drafts x teams x players below which a process pool costs more than it saves
+PARALLEL_MIN_CELLS = 20_000_000
+
+# Share of drafts inside a player's pick band (the 5th to 95th percentile picks)
+CONFIDENCE = 0.9
+
+# Cost of a starred player (plus its star order), below any consensus position
+STARRED_COST = -1e9
+
+ORDER_PRIORITY = 'priority'
+ORDER_CURRENT = 'current'
+ORDER_LABELS = {
+    ORDER_PRIORITY: 'Priority formula',
+    ORDER_CURRENT: 'Current draft order',
+}
+
+# team_ids: teams in draft order; per player: player_ids, positions (consensus
+# position), values (strength points) and in_pool (False for fixed picks);
+# fixed: {overall pick index: player index}; starred: teams x players star
+# order (-1 if not starred)
+SimulationInputs = namedtuple('SimulationInputs', [
+    'team_ids', 'player_ids', 'positions', 'values', 'in_pool', 'fixed', 'starred', 'num_rounds',
+])
+
+# Totals over all drafts: per team strength_sum, strength_squares and
+# strongest (drafts it was strongest in); pick_counts is players x overall picks
+SimulationResult = namedtuple('SimulationResult', [
+    'inputs', 'runs', 'strength_sum', 'strength_squares', 'strongest', 'pick_counts',
+])
+
+
+def load_inputs(order=ORDER_PRIORITY):
+    """
+    SimulationInputs for the current players, player rankings and star lists,
+    with the teams in the order of the priority formula or of the saved draft
+    (order).  The saved order keeps the daughter picks already on the board.
+    Raises ValueError if there is no order to simulate.
+    """
+    from . import ranking_consensus, rankings
+    from .draft_priority import snake_pick, team_priorities
+    from .draft_state import parse_team_ids
+    from .models import Draft, DraftPick, Manager, Player, StarredDraftPick
+    from .ranking_cache import ranking_aggregates
+
+    player_ids = list(Player.objects.order_by('id').values_list('id', flat=True))
+    index = {player_id: position for position, player_id in enumerate(player_ids)}
+
+    # (round, pick, player_id) of each daughter's fixed pick
+    fixed_picks = []
+    if order == ORDER_PRIORITY:
+        priorities = team_priorities()
+        team_ids = [item['team'].id for item in priorities]
+        for draft_position, item in enumerate(priorities, start=1):
+            round_num = int(item['median_round'])
+            fixed_picks.append((round_num, snake_pick(round_num, draft_position, len(team_ids)), item['daughter'].id))
+    elif order == ORDER_CURRENT:
+        draft = Draft.objects.order_by('-created_at').first()
+        team_ids = parse_team_ids(draft.order) if draft else []
+        daughter_ids = Manager.objects.filter(daughter__isnull=False).values('daughter_id')
+        fixed_picks = list(DraftPick.objects.filter(player_id__in=daughter_ids).values_list('round', 'pick', 'player_id'))
+    else:
+        raise ValueError(f"order must be one of: {', '.join(ORDER_LABELS)}")
+
+    if not team_ids:
+        raise ValueError('There is no draft order to simulate')
+    num_teams = len(team_ids)
+
+    fixed_picks = [
+        (round_num, pick_num, player_id) for round_num, pick_num, player_id in fixed_picks
+        if round_num >= 1 and 1 <= pick_num <= num_teams and player_id in index
+    ]
+    num_rounds = max([math.ceil(len(player_ids) / num_teams)] + [round_num for round_num, _, _ in fixed_picks])
+    fixed = {(round_num - 1) * num_teams + pick_num - 1: index[player_id] for round_num, pick_num, player_id in fixed_picks}
+    in_pool = np.ones(len(player_ids), dtype=bool)
+    in_pool[list(fixed.values())] = False
+
+    # Consensus positions in the configured order; unranked players tie after the ranked ones
+    aggregate = ranking_aggregates.get(rankings.KIND_PLAYER)
+    ranked_ids = aggregate.player_ids[aggregate.order(ranking_consensus.configured_method())].tolist()
+    positions = np.full(len(player_ids), len(ranked_ids) + 1, dtype=np.float64)
+    values = np.zeros(len(player_ids), dtype=np.float64)
+    for position, player_id in enumerate(ranked_ids, start=1):
+        if player_id in index:
+            positions[index[player_id]] = position
+            values[index[player_id]] = len(ranked_ids) - position + 1
+
+    team_index = {team_id: position for position, team_id in enumerate(team_ids)}
+    starred = np.full((num_teams, len(player_ids)), -1, dtype=np.int64)
+    star_rows = StarredDraftPick.objects.filter(team_id__in=team_ids).order_by('team_id', 'order', 'id').values_list('team_id', 'player_id')
+    star_counts = {}
+    for team_id, player_id in star_rows:
+        if player_id in index:
+            star_order = star_counts.get(team_id, 0)
+            starred[team_index[team_id], index[player_id]] = star_order
+            star_counts[team_id] = star_order + 1
+
+    return SimulationInputs(
+        team_ids=team_ids,
+        player_ids=np.array(player_ids, dtype=np.int64),
+        positions=positions,
+        values=values,
+        in_pool=in_pool,
+        fixed=fixed,
+        starred=starred,
+        num_rounds=num_rounds,
+    )
+
+
+def slot_teams(num_teams, num_rounds):
+    """Index into team_ids of the team making each overall pick of a snake draft."""
+    forward = np.arange(num_teams)
+    return np.concatenate([forward if round_index % 2 == 0 else forward[::-1] for round_index in range(num_rounds)])
+
+
+def simulate(inputs, runs=DEFAULT_RUNS, noise=DEFAULT_NOISE, workers=1, seed=0):
+    """SimulationResult of `runs` drafts, played in chunks over up to `workers` processes."""
+    num_teams, num_players = inputs.starred.shape
+    chunk_sizes = [min(CHUNK_RUNS, runs - start) for start in range(0, runs, CHUNK_RUNS)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    jobs = [(inputs, size, noise, chunk_seed) for size, chunk_seed in zip(chunk_sizes, seeds)]
+
+    if workers > 1 and len(jobs) > 1 and runs * num_teams * num_players >= PARALLEL_MIN_CELLS:
+        # Spawned rather than forked: the web process runs threads
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=context) as executor:
+            chunks = list(executor.map(_simulate_chunk, *zip(*jobs)))
+    else:
+        chunks = [_simulate_chunk(*job) for job in jobs]
+
+    strength_sum, strength_squares, strongest, pick_counts = (sum(totals) for totals in zip(*chunks))
+    return SimulationResult(inputs, runs, strength_sum, strength_squares, strongest, pick_counts)
+
+
+def _simulate_chunk(inputs, runs, noise, seed):
+    """(strength_sum, strength_squares, strongest, pick_counts) over `runs` drafts played side by side."""
+    rng = np.random.default_rng(seed)
+    num_teams, num_players = inputs.starred.shape
+    teams = slot_teams(num_teams, inputs.num_rounds)
+
+    # Every team's view of every player in every draft: lowest cost first,
+    # starred players before all others in star order
+    costs = inputs.positions + rng.normal(0.0, noise, size=(num_teams, runs, num_players))
+    starred = inputs.starred[:, None, :]
+    costs = np.where(starred >= 0, STARRED_COST + starred, costs)
+
+    taken = np.tile(~inputs.in_pool, (runs, 1))
+    strength = np.zeros((runs, num_teams))
+    pick_counts = np.zeros((num_players, len(teams)), dtype=np.int64)
+    rows = np.arange(runs)
+    remaining = int(inputs.in_pool.sum())
+
+    for slot, team in enumerate(teams):
+        player = inputs.fixed.get(slot)
+        if player is not None:
+            strength[:, team] += inputs.values[player]
+            pick_counts[player, slot] += runs
+            continue
+        if remaining == 0:
+            continue
+
+        picks = np.where(taken, np.inf, costs[team]).argmin(axis=1)
+        taken[rows, picks] = True
+        strength[:, team] += inputs.values[picks]
+        pick_counts[:, slot] += np.bincount(picks, minlength=num_players)
+        remaining -= 1
+
+    strongest = np.bincount(strength.argmax(axis=1), minlength=num_teams)
+    return strength.sum(axis=0), (strength ** 2).sum(axis=0), strongest, pick_counts
+
+
+def team_rows(result):
+    """[{'team_id', 'draft_position', 'mean_strength', 'std_strength', 'strongest_share'}] in draft order."""
+    mean = result.strength_sum / result.runs
+    std = np.sqrt(np.maximum(result.strength_squares / result.runs - mean ** 2, 0))
+    return [{
+        'team_id': team_id,
+        'draft_position': position + 1,
+        'mean_strength': float(mean[position]),
+        'std_strength': float(std[position]),
+        'strongest_share': float(result.strongest[position] / result.runs),
+    } for position, team_id in enumerate(result.inputs.team_ids)]
+
+
+def fairness(result):
+    """
+    {'spread': strongest minus weakest expected strength, 'std': standard
+    deviation of the expected strengths, 'position_correlation': correlation
+    of expected strength with draft position (positive: later picks end up
+    stronger; None with fewer than two teams or equal strengths)}
+    """
+    mean = result.strength_sum / result.runs
+    correlation = None
+    if len(mean) > 1 and mean.std() > 0:
+        correlation = float(np.corrcoef(np.arange(len(mean)), mean)[0, 1])
+    return {
+        'spread': float(mean.max() - mean.min()) if len(mean) else 0.0,
+        'std': float(mean.std()) if len(mean) else 0.0,
+        'position_correlation': correlation,
+    }
+
+
+def player_rows(result):
+    """
+    [{'player_id', 'mean_pick', 'pick_low', 'pick_high', 'first_round_share',
+    'fixed'}] per drafted player, earliest mean pick first; picks are overall
+    and 1-based, and pick_low/pick_high bound the middle CONFIDENCE of drafts.
+    """
+    counts = result.pick_counts
+    drafted = counts.sum(axis=1)
+    picks = np.arange(1, counts.shape[1] + 1)
+    num_teams = len(result.inputs.team_ids)
+
+    tail = result.runs * (1 - CONFIDENCE) / 2
+    running = counts.cumsum(axis=1)
+    low = np.argmax(running > tail, axis=1) + 1
+    high = np.argmax(running >= result.runs - tail, axis=1) + 1
+    mean = (counts * picks).sum(axis=1) / np.maximum(drafted, 1)
+    first_round = counts[:, :num_teams].sum(axis=1) / result.runs
+
+    rows = [{
+        'player_id': int(result.inputs.player_ids[index]),
+        'mean_pick': float(mean[index]),
+        'pick_low': int(low[index]),
+        'pick_high': int(high[index]),
+        'first_round_share': float(first_round[index]),
+        'fixed': not result.inputs.in_pool[index],
+    } for index in np.flatnonzero(drafted)]
+    rows.sort(key=lambda row: (row['mean_pick'], row['player_id']))
+    return rows
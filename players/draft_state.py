@@ -0,0 +1,356 @@
+"""
+In-memory state of the current draft, shared by the draft views.
+
+run_draft_view, export_draft_board, available_players_view, team_detail_view,
+undrafted_daughters_api and validate_draft_assignment_view each used to parse
+Draft.order, rebuild the snake-order grid of which team owns each pick and
+re-read every DraftPick, and two of them ran one query per manager to see
+whether her daughter was drafted.  DraftState holds all of that, built from
+one read of each table:
+
+- the pick grid: the team owning each (round, pick) slot and the player
+  picked there, in two flat arrays indexed by slot
+- every DraftPick by id, each team's picks and how often each player is
+  drafted, so the available players are a set kept up to date
+- the managers' daughters and the player names shown on the board
+- each player's row of the available-player pool (players/available_pool.py)
+  and the siblings she must be drafted with, for the pick clock's auto-pick
+  (players/draft_clock.py); her sibling requirement comes from the one read
+  of the siblings table
+
+draft_states.get() returns the current state, tagged with a version:
+
+- a DraftPick save or delete (players/signals.py) is applied to the state in
+  place once it commits, an O(1) update that moves it to the next version
+- any other write it depends on (the draft, players, managers, teams) bumps
+  the version, so the next read rebuilds it, as does a write to an older
+  state than the current version
+- other workers are told through the cache invalidation broadcast over the
+  Redis channel layer (players/cache_invalidation.py) and rebuild their copy
+  on their next read; a TTL is the safety net for a missed broadcast
+
+The grid and names only change on a rebuild; the picks are mutated under the
+cache's lock, and the read methods below copy what they return under it.
+"""
+import json
+import threading
+import time
+from array import array
+from collections import namedtuple
+
+from django.conf import settings
+
+from . import cache_invalidation
+from .models import Draft, DraftPick, Manager, Player, Team
+
+CACHE_NAME = 'draft_state'
+
+# Seconds before the state is rebuilt even without a new version
+DEFAULT_TTL = 300
+
+Pick = namedtuple('Pick', ['round', 'pick', 'player_id', 'team_id'])
+Daughter = namedtuple('Daughter', ['player_id', 'first_name', 'last_name', 'manager_first_name', 'manager_last_name'])
+PoolPlayer = namedtuple('PoolPlayer', [
+    'id', 'first_name', 'last_name', 'conflict', 'draftable', 'has_sibling_requirement', 'search_name', 'sort_name',
+])
+
+
+def parse_team_ids(order):
+    """Team IDs of a Draft.order value (a JSON list or comma-separated IDs)."""
+    order = (order or '').strip()
+    if order.startswith('['):
+        return [int(team_id) for team_id in json.loads(order)]
+    return [int(team_id.strip()) for team_id in order.split(',') if team_id.strip()]
+
+
+class DraftState:
+    """One worker's picture of the draft, built by load()."""
+
+    __slots__ = (
+        'version', 'loaded_at', 'lock',
+        'draft_id', 'rounds_draftable', 'total_rounds', 'picks_per_round',
+        'final_round_number', 'final_round_pick_count', 'width',
+        'slot_teams', 'slot_players',
+        'picks', 'team_picks', 'drafted', 'available',
+        'player_names', 'pool_players', 'sibling_ids', 'team_names', 'daughters',
+    )
+
+    def __init__(self, version, lock):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.lock = lock
+
+        self.draft_id = None
+        self.rounds_draftable = 0
+        self.total_rounds = 0
+        self.picks_per_round = 0
+        self.final_round_number = 0
+        self.final_round_pick_count = 0
+        self.width = 0
+        self.slot_teams = array('l')
+        self.slot_players = array('l')
+
+        self.picks = {}
+        self.team_picks = {}
+        self.drafted = {}
+        self.available = set()
+
+        self.player_names = {}
+        self.pool_players = {}
+        self.sibling_ids = {}
+        self.team_names = {}
+        self.daughters = {}
+
+    @classmethod
+    def load(cls, version, lock):
+        state = cls(version, lock)
+
+        siblings = {}
+        for player_id, sibling_id in Player.siblings.through.objects.values_list('from_player_id', 'to_player_id'):
+            siblings.setdefault(player_id, []).append(sibling_id)
+
+        # A player must be drafted with her siblings if she has any and didn't ask to be separated
+        players = Player.objects.values_list(
+            'id', 'first_name', 'last_name', 'conflict', 'draftable', 'requests_separate_team_from_sibling'
+        )
+        for player_id, first_name, last_name, conflict, draftable, separate in players:
+            state.player_names[player_id] = f"{first_name} {last_name}"
+            has_sibling_requirement = player_id in siblings and not separate
+            if has_sibling_requirement:
+                state.sibling_ids[player_id] = tuple(siblings[player_id])
+            state.pool_players[player_id] = PoolPlayer(
+                player_id, first_name, last_name, conflict, draftable, has_sibling_requirement,
+                f"{first_name} {last_name}".casefold(), (last_name.casefold(), first_name.casefold()),
+            )
+        state.available = set(state.player_names)
+        state.team_names = dict(Team.objects.values_list('id', 'name'))
+
+        # In manager order, as the draft page lists them
+        daughters = Manager.objects.filter(daughter__isnull=False).values_list(
+            'daughter_id', 'daughter__first_name', 'daughter__last_name', 'first_name', 'last_name'
+        )
+        state.daughters = {daughter[0]: Daughter(*daughter) for daughter in daughters}
+
+        draft = Draft.objects.order_by('-created_at').first()
+        if draft is not None:
+            state._build_grid(draft)
+
+        for pick in DraftPick.objects.values_list('id', 'round', 'pick', 'player_id', 'team_id'):
+            state._add_pick(pick[0], Pick(*pick[1:]))
+        return state
+
+    def _build_grid(self, draft):
+        self.draft_id = draft.id
+        self.rounds_draftable = draft.rounds_draftable
+        self.total_rounds = draft.rounds_draftable + draft.rounds_nondraftable
+        self.picks_per_round = draft.picks_per_round
+        self.final_round_pick_count = draft.final_round_picks or draft.picks_per_round
+
+        ordered_teams = parse_team_ids(draft.order)
+        final_round_teams = []
+        if draft.final_round_draft_order:
+            self.final_round_number = self.total_rounds + 1
+            final_round_teams = [int(team_id) for team_id in draft.final_round_draft_order.split(',') if team_id]
+
+        self.width = max(self.picks_per_round, len(final_round_teams))
+        num_rounds = self.final_round_number or self.total_rounds
+        self.slot_teams = array('l', [0]) * (num_rounds * self.width)
+        self.slot_players = array('l', [0]) * (num_rounds * self.width)
+
+        for round_num in range(1, self.total_rounds + 1):
+            # The last regular round may only have some of its picks
+            num_picks = self.final_round_pick_count if round_num == self.total_rounds else self.picks_per_round
+            for pick_num in range(1, min(num_picks, len(ordered_teams)) + 1):
+                # Snake draft: even rounds pick in reverse order
+                team_index = pick_num - 1 if round_num % 2 == 1 else len(ordered_teams) - pick_num
+                self.slot_teams[self._slot(round_num, pick_num)] = ordered_teams[team_index]
+
+        for pick_num, team_id in enumerate(final_round_teams, start=1):
+            self.slot_teams[self._slot(self.final_round_number, pick_num)] = team_id
+
+    def _slot(self, round_num, pick_num):
+        """Index of a (round, pick) in the grid arrays, or None if it is off the grid."""
+        if not (1 <= pick_num <= self.width) or round_num < 1:
+            return None
+        slot = (round_num - 1) * self.width + pick_num - 1
+        return slot if slot < len(self.slot_teams) else None
+
+    # Updates (under the cache's lock)
+
+    def _add_pick(self, pick_id, pick):
+        self.picks[pick_id] = pick
+        if pick.team_id is not None:
+            self.team_picks.setdefault(pick.team_id, set()).add(pick_id)
+        if pick.player_id is not None:
+            self.drafted[pick.player_id] = self.drafted.get(pick.player_id, 0) + 1
+            self.available.discard(pick.player_id)
+            slot = self._slot(pick.round, pick.pick)
+            if slot is not None:
+                self.slot_players[slot] = pick.player_id
+
+    def _remove_pick(self, pick_id):
+        pick = self.picks.pop(pick_id, None)
+        if pick is None:
+            return
+        if pick.team_id is not None:
+            self.team_picks.get(pick.team_id, set()).discard(pick_id)
+        if pick.player_id is not None:
+            remaining = self.drafted.pop(pick.player_id, 1) - 1
+            if remaining > 0:
+                self.drafted[pick.player_id] = remaining
+            elif pick.player_id in self.player_names:
+                self.available.add(pick.player_id)
+            slot = self._slot(pick.round, pick.pick)
+            if slot is not None and self.slot_players[slot] == pick.player_id:
+                self.slot_players[slot] = 0
+
+    def save_pick(self, pick_id, pick):
+        """Apply a saved DraftPick (new, or changed from what this state has)."""
+        self._remove_pick(pick_id)
+        self._add_pick(pick_id, pick)
+
+    def delete_pick(self, pick_id):
+        self._remove_pick(pick_id)
+
+    # Reads
+
+    @property
+    def has_draft(self):
+        return self.draft_id is not None
+
+    def pick_assignments(self):
+        """{round: {pick: team_id}} for every slot of the grid owned by a team."""
+        assignments = {}
+        num_rounds = self.final_round_number or self.total_rounds
+        for round_num in range(1, num_rounds + 1):
+            assignments[round_num] = {}
+            for pick_num in range(1, self.width + 1):
+                team_id = self.slot_teams[self._slot(round_num, pick_num)]
+                if team_id:
+                    assignments[round_num][pick_num] = team_id
+        return assignments
+
+    def slot_team(self, round_num, pick_num):
+        """ID of the team owning a (round, pick) slot, or None."""
+        slot = self._slot(round_num, pick_num)
+        return (self.slot_teams[slot] or None) if slot is not None else None
+
+    def board(self):
+        """{round: {pick: {'player_name', 'player_id'}}} of every pick with a player."""
+        with self.lock:
+            picks = list(self.picks.values())
+        board = {}
+        for pick in picks:
+            round_picks = board.setdefault(pick.round, {})
+            if pick.player_id is not None:
+                round_picks[pick.pick] = {
+                    'player_name': self.player_names.get(pick.player_id, ''),
+                    'player_id': pick.player_id,
+                }
+        return board
+
+    def available_ids(self):
+        """IDs of the players not drafted yet."""
+        with self.lock:
+            return set(self.available)
+
+    def pool(self, include=()):
+        """PoolPlayer rows of the players not drafted yet, plus those of include (drafted or not)."""
+        with self.lock:
+            player_ids = self.available.union(include)
+        return [self.pool_players[player_id] for player_id in player_ids if player_id in self.pool_players]
+
+    def available_count(self):
+        return len(self.available)
+
+    def drafted_ids(self):
+        with self.lock:
+            return set(self.drafted)
+
+    def drafted_count(self):
+        return len(self.drafted)
+
+    def player_count(self):
+        return len(self.player_names)
+
+    def is_drafted(self, player_id):
+        return player_id in self.drafted
+
+    def is_daughter(self, player_id):
+        return player_id in self.daughters
+
+    def team_player_ids(self, team_id):
+        """IDs of the players a team drafted, in pick order."""
+        with self.lock:
+            picks = [self.picks[pick_id] for pick_id in self.team_picks.get(team_id, ())]
+        return [pick.player_id for pick in sorted(picks, key=lambda pick: (pick.round, pick.pick)) if pick.player_id is not None]
+
+    def undrafted_daughters(self):
+        """Daughter tuples of the managers' daughters not drafted yet, in manager order."""
+        with self.lock:
+            return [daughter for daughter in self.daughters.values() if daughter.player_id not in self.drafted]
+
+
+class DraftStateCache:
+    def __init__(self):
+        self._version = 0
+        self._state = None
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+
+    def _ttl(self):
+        return getattr(settings, 'DRAFT_STATE_CACHE_TTL', DEFAULT_TTL)
+
+    def _is_current(self, state):
+        return (
+            state is not None
+            and state.version == self._version
+            and time.monotonic() - state.loaded_at < self._ttl()
+        )
+
+    def version(self):
+        return self._version
+
+    def get(self):
+        """The current DraftState, rebuilt only if something it depends on changed since it was built."""
+        state = self._state
+        if self._is_current(state):
+            return state
+
+        with self._build_lock:
+            # Another thread may have rebuilt it while this one waited
+            state = self._state
+            if not self._is_current(state):
+                # Read the version first: a write during the rebuild bumps it
+                # again, so this state is never mistaken for the newer data
+                state = DraftState.load(self._version, self._lock)
+                self._state = state
+
+        cache_invalidation.start_invalidation_listener()
+        return state
+
+    def _apply(self, update):
+        with self._lock:
+            state = self._state
+            current = self._is_current(state)
+            self._version += 1
+            if current:
+                update(state)
+                state.version = self._version
+
+    def pick_saved(self, pick_id, round_num, pick_num, player_id, team_id):
+        """Apply a committed DraftPick save to the current state."""
+        self._apply(lambda state: state.save_pick(pick_id, Pick(round_num, pick_num, player_id, team_id)))
+
+    def pick_deleted(self, pick_id):
+        """Apply a committed DraftPick delete to the current state."""
+        self._apply(lambda state: state.delete_pick(pick_id))
+
+    def bump(self):
+        """Advance the version so the next read rebuilds the state."""
+        with self._lock:
+            self._version += 1
+
+
+draft_states = DraftStateCache()
+cache_invalidation.register(CACHE_NAME, draft_states.bump)
@@ -0,0 +1,122 @@
+"""
+Process-local, typed cache of the general_settings table.
+
+Every page reads a handful of GeneralSetting rows (visibility toggles, display
+timezone, master password, roster rules).  Instead of one query per key, the
+whole table is loaded once per process and served from memory.
+
+The cache is invalidated by:
+- post_save/post_delete signals on GeneralSetting (see players/signals.py)
+- a broadcast over the channel layer so every Daphne worker drops stale values
+  (see players/cache_invalidation.py)
+- a TTL safety net in case a broadcast is missed
+"""
+import json
+import logging
+import threading
+import time
+
+import pytz
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from . import cache_invalidation
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = 'general_settings'
+
+# Seconds before the cache is reloaded even without an invalidation
+DEFAULT_TTL = 300
+
+_MISSING = object()
+
+
+class GeneralSettingsCache:
+    """In-memory snapshot of GeneralSetting rows with typed accessors."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (raw values, parsed values, loaded_at) swapped as a unit so readers never mix snapshots
+        self._state = None
+
+    def _ttl(self):
+        return getattr(settings, 'GENERAL_SETTINGS_CACHE_TTL', DEFAULT_TTL)
+
+    def _current_state(self):
+        """Return the current snapshot, loading it from the database if needed."""
+        state = self._state
+        if state is not None and time.monotonic() - state[2] < self._ttl():
+            return state
+
+        from .models import GeneralSetting
+
+        with self._lock:
+            state = self._state
+            if state is None or time.monotonic() - state[2] >= self._ttl():
+                values = dict(GeneralSetting.objects.values_list('key', 'value'))
+                state = (values, {}, time.monotonic())
+                self._state = state
+
+        cache_invalidation.start_invalidation_listener()
+        return state
+
+    async def _acurrent_state(self):
+        """Async variant of _current_state(); only hops to a thread when the snapshot must be loaded."""
+        state = self._state
+        if state is not None and time.monotonic() - state[2] < self._ttl():
+            return state
+        return await sync_to_async(self._current_state)()
+
+    def invalidate(self):
+        """Drop the in-memory snapshot so the next read reloads from the database."""
+        with self._lock:
+            self._state = None
+
+    def _parse(self, kind, key, parser, default, state=None):
+        """Parse and memoize a typed value; fall back to default on missing/invalid values."""
+        values, parsed, _ = state or self._current_state()
+        cache_key = (kind, key)
+        result = parsed.get(cache_key, _MISSING)
+        if result is _MISSING:
+            raw = values.get(key)
+            try:
+                result = parser(raw) if raw is not None else None
+            except (ValueError, TypeError, json.JSONDecodeError, pytz.UnknownTimeZoneError):
+                logger.warning(f"Invalid {kind} value for general setting '{key}': {raw!r}")
+                result = None
+            parsed[cache_key] = result
+        return default if result is None else result
+
+    def get(self, key, default=None):
+        """Return the raw string value for key."""
+        return self._current_state()[0].get(key, default)
+
+    async def aget(self, key, default=None):
+        """Async variant of get()."""
+        return (await self._acurrent_state())[0].get(key, default)
+
+    def exists(self, key):
+        return key in self._current_state()[0]
+
+    def get_bool(self, key, default=False):
+        """Return True/False for a 'true'/'false' setting."""
+        return self._parse('bool', key, lambda raw: raw.strip().lower() == 'true', default)
+
+    def get_int(self, key, default=0):
+        return self._parse('int', key, lambda raw: int(raw.strip()), default)
+
+    async def aget_int(self, key, default=0):
+        """Async variant of get_int()."""
+        state = await self._acurrent_state()
+        return self._parse('int', key, lambda raw: int(raw.strip()), default, state)
+
+    def get_json(self, key, default=None):
+        return self._parse('json', key, json.loads, default)
+
+    def get_timezone(self, key='display_timezone', default=pytz.UTC):
+        return self._parse('timezone', key, lambda raw: pytz.timezone(raw.strip()), default)
+
+
+general_settings = GeneralSettingsCache()
+cache_invalidation.register(CACHE_NAME, general_settings.invalidate)
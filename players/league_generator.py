@@ -0,0 +1,443 @@
+"""
+Deterministic synthetic league generator for load testing.
+
+Builds a complete division with bulk inserts: players (with sibling links),
+one manager per team (each with a daughter in the league), teams, team
+preferences, practice slots and practice slot rankings, full PlayerRanking /
+ManagerDaughterRanking / SiblingRanking submissions (with their ranking
+entries), a snake draft with picks, and a season of games with a roster for
+each team.
+
+The same seed and sizes always produce the same league (apart from database
+ids).  10k players and 500 teams take a few seconds, so realistic and
+multi-division sizes can be generated for `manage.py bench` and manual load
+testing.  Use `manage.py generate_league` to run it against the configured
+database.
+"""
+import json
+import math
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import ranking_codec, rankings
+from .models import (
+    Player, Team, Manager, PlayerRanking, ManagerDaughterRanking, SiblingRanking, RankingEntry, RankingTally,
+    TeamPreference, PracticeSlot, PracticeSlotRanking, Draft, DraftPick, GeneralSetting, EventType, Event, Roster,
+)
+
+MAX_PLAYERS = 10000
+MAX_TEAMS = 500
+
+BATCH_SIZE = 2000
+
+FIRST_NAMES = [
+    'Emma', 'Olivia', 'Ava', 'Isabella', 'Sophia', 'Mia', 'Charlotte', 'Amelia',
+    'Harper', 'Evelyn', 'Abigail', 'Emily', 'Elizabeth', 'Sofia', 'Avery', 'Ella',
+    'Madison', 'Scarlett', 'Victoria', 'Aria', 'Grace', 'Chloe', 'Camila', 'Penelope',
+    'Riley', 'Layla', 'Lillian', 'Nora', 'Zoey', 'Mila', 'Aubrey', 'Hannah', 'Lily',
+    'Addison', 'Eleanor', 'Natalie', 'Luna', 'Savannah', 'Brooklyn', 'Leah', 'Zoe',
+    'Stella', 'Hazel', 'Ellie', 'Paisley', 'Audrey', 'Skylar', 'Violet', 'Claire', 'Bella',
+]
+
+PARENT_FIRST_NAMES = [
+    'James', 'Michael', 'Robert', 'David', 'William', 'Richard', 'Joseph', 'Thomas',
+    'Sarah', 'Jessica', 'Jennifer', 'Ashley', 'Amanda', 'Megan', 'Rachel', 'Laura',
+]
+
+LAST_NAMES = [
+    'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
+    'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson',
+    'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin', 'Lee', 'Thompson', 'White',
+    'Harris', 'Clark', 'Lewis', 'Robinson', 'Walker', 'Hall', 'Allen', 'Young',
+    'King', 'Wright', 'Hill', 'Green', 'Adams', 'Baker', 'Nelson', 'Carter', 'Mitchell',
+    'Roberts', 'Turner', 'Phillips', 'Campbell', 'Parker', 'Evans', 'Edwards', 'Collins', 'Stewart', 'Morris',
+]
+
+SCHOOLS = [
+    'Washington Elementary', 'Lincoln Elementary', 'Roosevelt Elementary', 'Jefferson Elementary',
+    'Madison Elementary', 'Franklin Elementary', 'Wilson Elementary', 'Kennedy Elementary',
+    'Monroe Elementary', 'Jackson Elementary',
+]
+
+TEAM_ADJECTIVES = [
+    'Blazing', 'Thunder', 'Lightning', 'Golden', 'Crimson', 'Electric', 'Mighty', 'Wild',
+    'Fearless', 'Flying', 'Shooting', 'Storm', 'Diamond', 'Silver', 'Rocket', 'Atomic',
+]
+
+TEAM_NOUNS = [
+    'Comets', 'Avalanche', 'Hornets', 'Falcons', 'Panthers', 'Sparks', 'Tigers', 'Wildcats',
+    'Hurricanes', 'Stars', 'Eagles', 'Dragons', 'Bolts', 'Cyclones', 'Jaguars', 'Foxes',
+]
+
+PRACTICE_DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+PRACTICE_TIMES = ['5:00 PM', '5:30 PM', '6:00 PM', '6:30 PM']
+
+FIELD_POSITIONS = ['P', 'C', '1B', '2B', '3B', 'SS', 'LF', 'CF-L', 'CF-R', 'RF']
+INNINGS = 6
+
+
+class LeagueGenerator:
+    """
+    Generate one synthetic division.
+
+    players/teams: league size (up to MAX_PLAYERS / MAX_TEAMS).
+    sibling_rate: fraction of players who have a sibling in the league.
+    draft_progress: fraction of the draft already picked (1.0 = complete,
+        and every player is assigned to the team that picked them).
+    weeks: length of the season; every team plays one game per week.
+    """
+
+    def __init__(self, players=200, teams=12, seed=0, sibling_rate=0.05, draft_progress=1.0, weeks=10,
+                 season_start=date(2026, 3, 7), log=None):
+        if teams < 2 or teams > MAX_TEAMS:
+            raise ValueError(f'Number of teams must be between 2 and {MAX_TEAMS}')
+        if players < teams * 2 or players > MAX_PLAYERS:
+            raise ValueError(f'Number of players must be between 2 per team and {MAX_PLAYERS}')
+        if not 0 <= draft_progress <= 1:
+            raise ValueError('Draft progress must be between 0 and 1')
+
+        self.num_players = players
+        self.num_teams = teams
+        self.seed = seed
+        self.sibling_rate = sibling_rate
+        self.draft_progress = draft_progress
+        self.weeks = weeks
+        self.season_start = season_start
+        self.log = log or (lambda message: None)
+        self.rng = random.Random(seed)
+
+    def generate(self):
+        """Create the league in one transaction and return a summary of what was created."""
+        from .validation_engine import validation_engine
+        from .general_settings import general_settings
+        from .ranking_cache import ranking_aggregates
+        from .draft_state import draft_states
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            self._step('managers and teams', self._create_managers_and_teams)
+            self._step('players', self._create_players)
+            self._step('team preferences', self._create_team_preferences)
+            self._step('rankings', self._create_rankings)
+            self._step('draft', self._create_draft)
+            self._step('season', self._create_season)
+
+            GeneralSetting.objects.update_or_create(key='player_rankings_public', defaults={'value': 'true'})
+
+        # bulk_create sends no signals
+        validation_engine.mark_all_dirty()
+        general_settings.invalidate()
+        ranking_aggregates.bump()
+        draft_states.bump()
+
+        summary = {
+            'seed': self.seed,
+            'players': len(self.players),
+            'siblings': len(self.sibling_pairs),
+            'teams': len(self.teams),
+            'managers': len(self.managers),
+            'practice_slots': len(self.practice_slots),
+            'player_rankings': len(self.managers),
+            'draft_picks': len(self.draft_picks),
+            'events': len(self.events),
+            'rosters': len(self.rosters),
+            'seconds': round(time.perf_counter() - started, 2),
+        }
+        self.log(f"Generated league in {summary['seconds']}s")
+        return summary
+
+    def _step(self, name, create):
+        started = time.perf_counter()
+        create()
+        self.log(f'  {name}: {time.perf_counter() - started:.2f}s')
+
+    # Managers and teams
+
+    def _create_managers_and_teams(self):
+        rng = self.rng
+
+        slots = []
+        for i in range(self.num_teams):
+            day = PRACTICE_DAYS[i % len(PRACTICE_DAYS)]
+            practice_time = PRACTICE_TIMES[(i // len(PRACTICE_DAYS)) % len(PRACTICE_TIMES)]
+            field = i // (len(PRACTICE_DAYS) * len(PRACTICE_TIMES)) + 1
+            slots.append(PracticeSlot(practice_slot=f'{day} {practice_time} - Field {field}'))
+        self.practice_slots = PracticeSlot.objects.bulk_create(slots, batch_size=BATCH_SIZE)
+
+        # Daughters are linked once the players exist
+        managers = []
+        for i in range(self.num_teams):
+            first_name = rng.choice(PARENT_FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+            managers.append(Manager(
+                first_name=first_name,
+                last_name=last_name,
+                email=f'{first_name.lower()}.{last_name.lower()}{i + 1}@example.com',
+                phone=f'555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}',
+                passed_background_check=rng.random() < 0.9,
+                board_member=rng.random() < 0.1,
+            ))
+        self.managers = Manager.objects.bulk_create(managers, batch_size=BATCH_SIZE)
+
+        # Every team has been given a practice slot
+        names = [f'{adjective} {noun}' for adjective in TEAM_ADJECTIVES for noun in TEAM_NOUNS]
+        rng.shuffle(names)
+        shuffled_slots = rng.sample(self.practice_slots, len(self.practice_slots))
+        teams = []
+        for i, manager in enumerate(self.managers):
+            name = names[i % len(names)]
+            if i >= len(names):
+                name = f'{name} {i // len(names) + 1}'
+            teams.append(Team(
+                name=name,
+                manager=manager,
+                manager_secret=f'{self.seed}-{i + 1}-{rng.getrandbits(40):010x}',
+                practice_slot=shuffled_slots[i],
+                colors=rng.choice(['Red/White', 'Blue/Gold', 'Black/Orange', 'Green/White', 'Purple/Silver']),
+            ))
+        self.teams = Team.objects.bulk_create(teams, batch_size=BATCH_SIZE)
+
+    # Players
+
+    def _create_players(self):
+        rng = self.rng
+        # Two-year birthday band for a 7U division
+        oldest = date(self.season_start.year - 8, 9, 1)
+
+        players = []
+        for i in range(self.num_players):
+            first_name = rng.choice(FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+            players.append(Player(
+                first_name=first_name,
+                # Suffix keeps (first, last, birthday) unique, which player import relies on
+                last_name=f'{last_name}-{i + 1}',
+                birthday=oldest + timedelta(days=rng.randint(0, 729)),
+                school=rng.choice(SCHOOLS),
+                history=rng.choice(['New', 'Returning']),
+                conflict=rng.choice(PRACTICE_DAYS) if rng.random() < 0.15 else None,
+                parent_phone_1=f'555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}',
+                parent_email_1=f'{first_name.lower()}.{last_name.lower()}{i + 1}@example.com',
+                jersey_size=rng.choice(['XS', 'S', 'M']),
+                attended_try_out=rng.random() < 0.9,
+                draftable=rng.random() < 0.97,
+            ))
+        self.players = players
+
+        pair_count = int(self.num_players * self.sibling_rate / 2)
+        candidates = rng.sample(players, pair_count * 2)
+        self.sibling_pairs = list(zip(candidates[0::2], candidates[1::2]))
+        for a, b in self.sibling_pairs:
+            if rng.random() < 0.2:
+                a.requests_separate_team_from_sibling = True
+                b.requests_separate_team_from_sibling = True
+
+        # Each manager's daughter is a distinct player
+        for manager, daughter in zip(self.managers, rng.sample(players, self.num_teams)):
+            manager.daughter = daughter
+
+        # Decide the draft up front so drafted players are inserted with their team
+        self._plan_draft()
+
+        Player.objects.bulk_create(players, batch_size=BATCH_SIZE)
+        self.player_ids = [player.id for player in players]
+
+        Sibling = Player.siblings.through
+        links = []
+        for a, b in self.sibling_pairs:
+            # Symmetrical: one row in each direction
+            links.append(Sibling(from_player_id=a.id, to_player_id=b.id))
+            links.append(Sibling(from_player_id=b.id, to_player_id=a.id))
+        Sibling.objects.bulk_create(links, batch_size=BATCH_SIZE)
+
+        Manager.objects.bulk_update(self.managers, ['daughter'], batch_size=BATCH_SIZE)
+
+    # Submissions
+
+    def _create_team_preferences(self):
+        rng = self.rng
+
+        slot_ids = [slot.id for slot in self.practice_slots]
+        PracticeSlotRanking.objects.bulk_create([
+            PracticeSlotRanking(team=team, rankings=json.dumps([
+                {'rank': rank, 'slot_id': slot_id}
+                for rank, slot_id in enumerate(rng.sample(slot_ids, len(slot_ids)), start=1)
+            ]))
+            for team in self.teams
+        ], batch_size=BATCH_SIZE)
+
+        preferences = []
+        for manager in self.managers:
+            ordered = rng.sample(self.teams, len(self.teams))
+            preferences.append(TeamPreference(manager=manager, preferences={
+                'team_ids': [str(team.id) for team in ordered],
+                'team_names': [team.name for team in ordered],
+            }))
+        TeamPreference.objects.bulk_create(preferences, batch_size=BATCH_SIZE)
+
+    # Rankings
+
+    def _create_rankings(self):
+        rng = self.rng
+        rounds = self._rounds()
+
+        def ranking(ordered, with_round=False):
+            """Packed submission ranking the given players in order."""
+            if not with_round:
+                return ranking_codec.encode(ordered)
+            return ranking_codec.encode(ordered, rng.choices(range(1, rounds + 1), k=len(ordered)))
+
+        # A complete player ranking ranks (Number of Teams) x 2 players
+        required = self.num_teams * 2
+        submissions = {
+            rankings.KIND_PLAYER: PlayerRanking.objects.bulk_create([
+                PlayerRanking(manager=manager, ranking=ranking(rng.sample(self.player_ids, required)))
+                for manager in self.managers
+            ], batch_size=BATCH_SIZE),
+        }
+
+        daughter_ids = [manager.daughter_id for manager in self.managers]
+        submissions[rankings.KIND_DAUGHTER] = ManagerDaughterRanking.objects.bulk_create([
+            ManagerDaughterRanking(manager=manager, ranking=ranking(rng.sample(daughter_ids, len(daughter_ids)), with_round=True))
+            for manager in self.managers
+        ], batch_size=BATCH_SIZE)
+
+        sibling_ids = [player.id for pair in self.sibling_pairs for player in pair]
+        if sibling_ids:
+            submissions[rankings.KIND_SIBLING] = SiblingRanking.objects.bulk_create([
+                SiblingRanking(manager=manager, ranking=ranking(rng.sample(sibling_ids, len(sibling_ids)), with_round=True))
+                for manager in self.managers
+            ], batch_size=BATCH_SIZE)
+
+        # bulk_create skips the signal that writes ranking entries
+        player_ids = set(self.player_ids)
+        for kind, created in submissions.items():
+            rankings.sync_entries(kind, created, player_ids)
+
+    # Draft
+
+    def _rounds(self):
+        return math.ceil(self.num_players / self.num_teams)
+
+    def _plan_draft(self):
+        rng = self.rng
+        num_teams = self.num_teams
+
+        self.draft_order = rng.sample(self.teams, num_teams)
+
+        # Each team takes its manager's daughter with its first pick; everyone else in a random order
+        daughters = {team.id: team.manager.daughter for team in self.teams}
+        daughter_set = set(map(id, daughters.values()))
+        pool = [player for player in self.players if id(player) not in daughter_set]
+        rng.shuffle(pool)
+
+        self.planned_picks = []
+        for index in range(round(self.num_players * self.draft_progress)):
+            round_num, pick_index = divmod(index, num_teams)
+            round_num += 1
+            # Snake draft: even rounds pick in reverse
+            team = self.draft_order[pick_index if round_num % 2 == 1 else num_teams - 1 - pick_index]
+
+            player = daughters.pop(team.id, None) or pool.pop()
+            self.planned_picks.append((round_num, pick_index + 1, team, player))
+            if self.draft_progress == 1:
+                player.team = team
+
+    def _create_draft(self):
+        num_teams = self.num_teams
+        rounds = self._rounds()
+        final_round_picks = self.num_players - (rounds - 1) * num_teams
+
+        self.draft = Draft.objects.create(
+            rounds_draftable=rounds,
+            picks_per_round=num_teams,
+            order=','.join(str(team.id) for team in self.draft_order),
+            final_round_picks=final_round_picks if final_round_picks < num_teams else None,
+        )
+
+        self.draft_picks = DraftPick.objects.bulk_create([
+            DraftPick(
+                round=round_num,
+                pick=pick_num,
+                player=player,
+                team=team,
+                player_assigned_to_team=self.draft_progress == 1,
+            )
+            for round_num, pick_num, team, player in self.planned_picks
+        ], batch_size=BATCH_SIZE)
+
+        drafted = {pick.player_id for pick in self.draft_picks}
+        self.undrafted_ids = [player_id for player_id in self.player_ids if player_id not in drafted]
+
+    # Season
+
+    def _create_season(self):
+        rng = self.rng
+        teams = self.teams
+        num_teams = len(teams)
+
+        game_type, _ = EventType.objects.get_or_create(
+            name='Game',
+            defaults={'bootstrap_icon_id': 'bi-trophy', 'color': '#0d6efd'}
+        )
+
+        # Round-robin pairings (circle method), one game per team per week
+        rotation = list(teams) + ([None] if num_teams % 2 else [])
+        events = []
+        for week in range(self.weeks):
+            game_day = self.season_start + timedelta(weeks=week)
+            half = len(rotation) // 2
+            for slot, (home, away) in enumerate(zip(rotation[:half], reversed(rotation[half:]))):
+                if home is None or away is None:
+                    continue
+                if week % 2:
+                    home, away = away, home
+                start = timezone.make_aware(datetime.combine(game_day, datetime.min.time()) + timedelta(hours=9 + slot % 4))
+                events.append(Event(
+                    event_type=game_type,
+                    home_team=home,
+                    away_team=away,
+                    name=f'{home.name} vs {away.name}',
+                    location=f'Field {slot // 4 + 1}',
+                    timestamp=start,
+                ))
+            rotation = [rotation[0]] + [rotation[-1]] + rotation[1:-1]
+        self.events = Event.objects.bulk_create(events, batch_size=BATCH_SIZE)
+
+        players_by_team = {}
+        for player in self.players:
+            if player.team_id:
+                players_by_team.setdefault(player.team_id, []).append(str(player.id))
+
+        rosters = []
+        for event in self.events:
+            for team in (event.home_team, event.away_team):
+                team_players = players_by_team.get(team.id, [])
+                innings = {}
+                for inning in range(1, INNINGS + 1):
+                    on_field = rng.sample(team_players, min(len(FIELD_POSITIONS), len(team_players)))
+                    innings[f'inning_{inning}'] = dict(zip(FIELD_POSITIONS, on_field))
+                rosters.append(Roster(
+                    event=event,
+                    team=team,
+                    lineup=rng.sample(team_players, len(team_players)),
+                    **innings
+                ))
+        self.rosters = Roster.objects.bulk_create(rosters, batch_size=BATCH_SIZE)
+
+
+def generate_league(**options):
+    """Generate a league with LeagueGenerator(**options) and return its summary."""
+    return LeagueGenerator(**options).generate()
+
+
+def clear_league():
+    """Delete every league row the generator creates (players, teams, managers, drafts, events, ...)."""
+    with transaction.atomic():
+        for model in (Roster, Event, DraftPick, Draft, PracticeSlotRanking, TeamPreference, RankingEntry, RankingTally,
+                      PlayerRanking, ManagerDaughterRanking, SiblingRanking, Team, Manager, PracticeSlot, Player):
+            model.objects.all().delete()
@@ -0,0 +1,329 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext, setup_databases, teardown_databases
+from datetime import datetime
+import io
+import json
+import math
+import statistics
+import time
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the hot pages and APIs against a synthetic league in a throwaway database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--players',
+            type=int,
+            default=200,
+            help='Number of players in the synthetic league (default: 200)',
+        )
+        parser.add_argument(
+            '--teams',
+            type=int,
+            default=12,
+            help='Number of teams in the synthetic league (default: 12)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Timed requests per scenario (default: 20)',
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=2,
+            help='Untimed requests per scenario before timing (default: 2)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for the synthetic league (default: 0)',
+        )
+        parser.add_argument(
+            '--only',
+            nargs='+',
+            metavar='SCENARIO',
+            help='Only run these scenarios',
+        )
+        parser.add_argument(
+            '--output',
+            default='bench-results.json',
+            help='Write results to this JSON file (default: bench-results.json)',
+        )
+        parser.add_argument(
+            '--compare',
+            metavar='BASELINE',
+            help='Compare against a saved results file and fail on regressions',
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.2,
+            help='Allowed p95 slowdown vs the baseline, as a fraction (default: 0.2 = 20%%)',
+        )
+        parser.add_argument(
+            '--min-delta-ms',
+            type=float,
+            default=2.0,
+            help='Ignore p95 slowdowns smaller than this many milliseconds (default: 2)',
+        )
+
+    def handle(self, *args, **options):
+        scenarios = SCENARIOS
+        if options['only']:
+            unknown = set(options['only']) - {name for name, _ in SCENARIOS}
+            if unknown:
+                raise CommandError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+            scenarios = [(name, run) for name, run in SCENARIOS if name in options['only']]
+
+        baseline = None
+        if options['compare']:
+            try:
+                with open(options['compare']) as f:
+                    baseline = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                raise CommandError(f"Could not read baseline {options['compare']}: {e}")
+
+        # Throwaway database: the players schema is built straight from the models
+        # (skipping data migrations), and nothing is broadcast to other workers
+        with override_settings(
+            MIGRATION_MODULES={'players': None},
+            CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+            CACHE_INVALIDATION_BROADCAST=False,
+            VALIDATION_TRIGGER_DEBOUNCE_SECONDS=0,
+            ALLOWED_HOSTS=['testserver'],
+            DEBUG=False,
+        ):
+            self.stdout.write('Creating throwaway database...')
+            old_config = setup_databases(verbosity=0, interactive=False, aliases={'default'})
+            try:
+                self._reset_caches()
+
+                started = time.perf_counter()
+                league = build_league(options['players'], options['teams'], options['seed'])
+                self.stdout.write(
+                    f"Built league: {options['players']} players, {options['teams']} teams "
+                    f"in {time.perf_counter() - started:.1f}s"
+                )
+
+                results = {}
+                for name, run in scenarios:
+                    results[name] = self._run_scenario(name, run, league, options['iterations'], options['warmup'])
+            finally:
+                teardown_databases(old_config, verbosity=0)
+                self._reset_caches()
+
+        report = {
+            'meta': {
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'players': options['players'],
+                'teams': options['teams'],
+                'iterations': options['iterations'],
+                'seed': options['seed'],
+                'database': connection.vendor,
+            },
+            'results': results,
+        }
+
+        with open(options['output'], 'w') as f:
+            json.dump(report, f, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"\nResults written to {options['output']}"))
+
+        if baseline is not None:
+            regressions = self._compare(results, baseline, options['threshold'], options['min_delta_ms'])
+            if regressions:
+                raise CommandError(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+            self.stdout.write(self.style.SUCCESS('No regressions against baseline'))
+
+    def _reset_caches(self):
+        # Process-local caches may still hold rows from another database
+        from players.general_settings import general_settings
+        from players.ranking_cache import ranking_aggregates
+        from players import validation_routes
+
+        general_settings.invalidate()
+        validation_routes.invalidate()
+        ranking_aggregates.bump()
+
+    def _run_scenario(self, name, run, league, iterations, warmup):
+        from players import master_password
+
+        client = Client()
+        client.cookies[master_password.COOKIE_NAME] = master_password.issue_token()
+
+        for i in range(warmup):
+            run(client, league, i)
+
+        timings = []
+        query_counts = []
+        errors = 0
+        for i in range(warmup, warmup + iterations):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = run(client, league, i)
+                timings.append((time.perf_counter() - started) * 1000)
+            query_counts.append(len(queries))
+            if not _is_success(response):
+                errors += 1
+
+        result = {
+            'p50_ms': round(_percentile(timings, 0.50), 2),
+            'p95_ms': round(_percentile(timings, 0.95), 2),
+            'mean_ms': round(statistics.mean(timings), 2),
+            'max_ms': round(max(timings), 2),
+            'queries': int(statistics.median(query_counts)),
+            'max_queries': max(query_counts),
+            'errors': errors,
+        }
+
+        line = (
+            f"{name:<34} p50 {result['p50_ms']:>8.1f}ms  p95 {result['p95_ms']:>8.1f}ms  "
+            f"queries {result['queries']:>5}"
+        )
+        if errors:
+            self.stdout.write(self.style.WARNING(f"{line}  ({errors} failed responses)"))
+        else:
+            self.stdout.write(line)
+        return result
+
+    def _compare(self, results, baseline, threshold, min_delta_ms):
+        """Print a comparison against the baseline and return the names of regressed scenarios."""
+        self.stdout.write(f"\nComparison against baseline from {baseline.get('meta', {}).get('created_at', 'unknown')}:")
+
+        regressions = []
+        for name, result in results.items():
+            before = baseline.get('results', {}).get(name)
+            if before is None:
+                self.stdout.write(f"{name:<34} (not in baseline)")
+                continue
+
+            problems = []
+            delta_ms = result['p95_ms'] - before['p95_ms']
+            if delta_ms > min_delta_ms and result['p95_ms'] > before['p95_ms'] * (1 + threshold):
+                problems.append(f"p95 {before['p95_ms']:.1f} -> {result['p95_ms']:.1f}ms")
+            if result['queries'] > before['queries']:
+                problems.append(f"queries {before['queries']} -> {result['queries']}")
+            if result['errors'] > before.get('errors', 0):
+                problems.append(f"errors {before.get('errors', 0)} -> {result['errors']}")
+
+            change = (result['p95_ms'] / before['p95_ms'] - 1) * 100 if before['p95_ms'] else 0
+            line = f"{name:<34} p95 {change:>+7.1f}%  queries {before['queries']:>5} -> {result['queries']:<5}"
+            if problems:
+                regressions.append(name)
+                self.stdout.write(self.style.ERROR(f"{line}  REGRESSION: {'; '.join(problems)}"))
+            else:
+                self.stdout.write(line)
+
+        return regressions
+
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def _is_success(response):
+    if response.status_code >= 400:
+        return False
+    if response.get('Content-Type', '').startswith('application/json'):
+        data = response.json()
+        if isinstance(data, dict) and data.get('success') is False:
+            return False
+    return True
+
+
+def build_league(num_players, num_teams, seed):
+    """Generate a half-drafted synthetic league; returns the ids the scenarios need."""
+    from players.league_generator import LeagueGenerator
+
+    try:
+        generator = LeagueGenerator(players=num_players, teams=num_teams, seed=seed, draft_progress=0.5)
+    except ValueError as e:
+        raise CommandError(str(e))
+    generator.generate()
+
+    return {
+        'undrafted_ids': generator.undrafted_ids,
+        'next_pick_index': len(generator.draft_picks),
+        'team_names': [team.name for team in generator.teams],
+        'team_secrets': [team.manager_secret for team in generator.teams],
+        'rosters': [(roster.team.manager_secret, roster.id) for roster in generator.rosters],
+        # Alternating between the two files updates every player on each import
+        'import_files': [_import_file(generator.players, ''), _import_file(generator.players, ' (updated)')],
+    }
+
+
+def _import_file(players, school_suffix):
+    """An enrollment spreadsheet with every player in the league (so the import deletes nobody)."""
+    import pandas as pd
+
+    df = pd.DataFrame([{
+        'Enrollment Type': 'Player',
+        'Enrollee Last Name': player.last_name,
+        'Enrollee First Name': player.first_name,
+        'Enrollee Birthday': player.birthday.isoformat(),
+        'Customer Phone Number': player.parent_phone_1,
+        'Customer Email Address': player.parent_email_1,
+        'School': f'{player.school}{school_suffix}',
+    } for player in players])
+
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False, engine='openpyxl')
+    return buffer.getvalue()
+
+
+# Scenarios: each makes one request, varying it by iteration number where that matters
+
+def _get(url):
+    return lambda client, league, i: client.get(url)
+
+
+def _team_detail(client, league, i):
+    secrets = league['team_secrets']
+    return client.get(f'/teams/{secrets[i % len(secrets)]}/')
+
+
+def _roster(client, league, i):
+    team_secret, roster_id = league['rosters'][i % len(league['rosters'])]
+    return client.get(f'/teams/{team_secret}/roster/{roster_id}/')
+
+
+def _make_pick(client, league, i):
+    # Fill the open picks in order, each with a different undrafted player
+    num_teams = len(league['team_names'])
+    undrafted = league['undrafted_ids']
+    round_index, pick_index = divmod(league['next_pick_index'] + i, num_teams)
+    return client.post('/draft/make-pick/', json.dumps({
+        'round': round_index + 1,
+        'pick': pick_index + 1,
+        'player_id': undrafted[i % len(undrafted)],
+        'team_name': league['team_names'][i % num_teams],
+    }), content_type='application/json')
+
+
+def _import_players(client, league, i):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+
+    upload = SimpleUploadedFile('bench_players.xlsx', league['import_files'][i % 2])
+    return client.post('/api/import-players/', {'excel_file': upload})
+
+
+SCENARIOS = [
+    ('run_draft', _get('/draft/run/')),
+    ('team_detail', _team_detail),
+    ('available_players', _get('/draft/available-players/')),
+    ('make_pick', _make_pick),
+    ('player_rankings_analyze', _get('/player_rankings/analyze/')),
+    ('player_rankings_analyze_public', _get('/player_rankings/analyze/public/')),
+    ('manager_daughter_rankings_analyze', _get('/manager_daughter_rankings/analyze/')),
+    ('sibling_rankings_analyze', _get('/sibling_rankings/analyze/')),
+    ('calendar_events_api', _get('/calendar/api/events/')),
+    ('import_players', _import_players),
+    ('roster', _roster),
+]
@@ -1,7 +1,7 @@
 from django.core.management.base import BaseCommand
+from players import ranking_codec
 from players.models import Manager, Player, PlayerRanking
 import random
-import json
 from datetime import date, timedelta
 
 
@@ -76,13 +76,13 @@ class Command(BaseCommand):
             shuffled = list(players)
             random.shuffle(shuffled)
 
-            # Create ranking data in the correct format: [{"player_id": 1, "rank": 1}, ...]
-            ranking_data = [{"player_id": p.id, "rank": idx + 1} for idx, p in enumerate(shuffled)]
+            # Create ranking data in the packed format: the player IDs in ranked order
+            ranking_data = ranking_codec.encode([p.id for p in shuffled])
 
             # Create the PlayerRanking record
             PlayerRanking.objects.create(
                 manager=mgr,
-                ranking=json.dumps(ranking_data)
+                ranking=ranking_data
             )
 
             created_count += 1
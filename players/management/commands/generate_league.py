@@ -0,0 +1,87 @@
+from django.core.management.base import BaseCommand, CommandError
+from players.league_generator import LeagueGenerator, MAX_PLAYERS, MAX_TEAMS, clear_league
+from players.models import Player
+from datetime import date
+
+
+class Command(BaseCommand):
+    help = 'Generate a deterministic synthetic league (players, managers, teams, rankings, draft, season) for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--players',
+            type=int,
+            default=200,
+            help=f'Number of players, up to {MAX_PLAYERS} (default: 200)',
+        )
+        parser.add_argument(
+            '--teams',
+            type=int,
+            default=12,
+            help=f'Number of teams, up to {MAX_TEAMS} (default: 12)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed; the same seed and sizes always generate the same league (default: 0)',
+        )
+        parser.add_argument(
+            '--siblings',
+            type=float,
+            default=0.05,
+            help='Fraction of players with a sibling in the league (default: 0.05)',
+        )
+        parser.add_argument(
+            '--draft-progress',
+            type=float,
+            default=1.0,
+            help='Fraction of the draft already picked; 1 assigns every player to a team (default: 1)',
+        )
+        parser.add_argument(
+            '--weeks',
+            type=int,
+            default=10,
+            help='Weeks of games in the season (default: 10)',
+        )
+        parser.add_argument(
+            '--season-start',
+            type=date.fromisoformat,
+            default=date(2026, 3, 7),
+            help='Date of the first game, YYYY-MM-DD (default: 2026-03-07)',
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Delete all existing players, managers, teams, drafts, rankings and events first',
+        )
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            self.stdout.write(self.style.WARNING('Deleting existing league data...'))
+            clear_league()
+        elif Player.objects.exists():
+            raise CommandError('The database already has players. Use --clear to replace them.')
+
+        try:
+            generator = LeagueGenerator(
+                players=options['players'],
+                teams=options['teams'],
+                seed=options['seed'],
+                sibling_rate=options['siblings'],
+                draft_progress=options['draft_progress'],
+                weeks=options['weeks'],
+                season_start=options['season_start'],
+                log=self.stdout.write,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        summary = generator.generate()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"\nCreated {summary['players']} players ({summary['siblings']} sibling pairs), "
+            f"{summary['teams']} teams with managers, {summary['practice_slots']} practice slots, "
+            f"{summary['player_rankings']} sets of rankings, {summary['draft_picks']} draft picks, "
+            f"{summary['events']} games and {summary['rosters']} rosters"
+        ))
@@ -12,7 +12,9 @@ Examples:
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from players import cache_invalidation, draft_state
 from players.models import Player
+from players.validation_engine import validation_engine
 import pandas as pd
 from datetime import datetime
 
@@ -173,6 +175,11 @@ class Command(BaseCommand):
                 Player.objects.bulk_create(players_to_create)
                 self.stdout.write(self.style.SUCCESS(f'✓ Successfully imported {len(players_to_create)} players'))
 
+            # bulk_create sends no signals, so tell the running workers the draft's player pool
+            # and the validations that read players changed
+            cache_invalidation.broadcast_invalidation(draft_state.CACHE_NAME)
+            validation_engine.mark_dirty(Player)
+
             self.stdout.write(self.style.SUCCESS('=' * 80))
             self.stdout.write(self.style.SUCCESS('Import completed successfully!'))
 
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from players import ranking_tallies, rankings
+from players.models import RankingTally
+from players.ranking_cache import ranking_aggregates
+
+
+class Command(BaseCommand):
+    help = 'Recompute the running ranking tallies from the stored ranking entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--kind',
+            choices=list(rankings.SUBMISSION_MODELS),
+            help='Only rebuild this kind of ranking (default: all)',
+        )
+
+    def handle(self, *args, **options):
+        kinds = [options['kind']] if options['kind'] else list(rankings.SUBMISSION_MODELS)
+
+        for kind in kinds:
+            ranking_tallies.rebuild(kind)
+            ranking_aggregates.bump(kind)
+            count = RankingTally.objects.filter(kind=kind).count()
+            self.stdout.write(f"Rebuilt {kind} rankings: {count} ranked players")
+
+        self.stdout.write(self.style.SUCCESS('\nRanking tallies rebuilt'))
@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from players.models import Player
+from players.validation_engine import validation_engine
 
 
 class Command(BaseCommand):
@@ -11,6 +12,8 @@ class Command(BaseCommand):
             draftable=True,
             attended_try_out=False
         )
+        # QuerySet.update() sends no signals, so tell the running workers' validation engines
+        validation_engine.mark_dirty(Player)
         
         self.stdout.write(
             self.style.SUCCESS(
@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from players.models import Player
+from players.validation_engine import validation_engine
 
 
 class Command(BaseCommand):
@@ -8,6 +9,8 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         # Update all players to set attended_try_out to False
         updated_count = Player.objects.update(attended_try_out=False)
+        # QuerySet.update() sends no signals, so tell the running workers' validation engines
+        validation_engine.mark_dirty(Player)
 
         self.stdout.write(
             self.style.SUCCESS(f'Successfully reset attended_try_out to False for {updated_count} players')
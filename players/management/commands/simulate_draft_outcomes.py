@@ -0,0 +1,120 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+import json
+import os
+import time
+
+from players import draft_simulation
+from players.models import Player, Team
+
+
+class Command(BaseCommand):
+    help = 'Play the draft many times (Monte Carlo) and report team strength, pick positions and draft order fairness'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--order',
+            choices=list(draft_simulation.ORDER_LABELS),
+            default=draft_simulation.ORDER_PRIORITY,
+            help='Team order to simulate: the priority formula or the saved draft order (default: priority)',
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=getattr(settings, 'DRAFT_SIMULATION_RUNS', draft_simulation.DEFAULT_RUNS),
+            help='Number of drafts to play',
+        )
+        parser.add_argument(
+            '--noise',
+            type=float,
+            default=draft_simulation.DEFAULT_NOISE,
+            help='Standard deviation, in consensus positions, of each team\'s view of a player (default: 5)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Worker processes for large runs (default: one per CPU)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed (default: 0)',
+        )
+        parser.add_argument(
+            '--players',
+            type=int,
+            default=30,
+            help='Number of players to list, earliest mean pick first (default: 30, 0 for all)',
+        )
+        parser.add_argument(
+            '--output',
+            help='Also write the full results to this JSON file',
+        )
+
+    def handle(self, *args, **options):
+        if not 1 <= options['runs'] <= draft_simulation.MAX_RUNS:
+            raise CommandError(f"--runs must be between 1 and {draft_simulation.MAX_RUNS}")
+        if options['noise'] < 0:
+            raise CommandError('--noise must not be negative')
+
+        try:
+            inputs = draft_simulation.load_inputs(options['order'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        started = time.perf_counter()
+        result = draft_simulation.simulate(
+            inputs, runs=options['runs'], noise=options['noise'], workers=options['workers'], seed=options['seed']
+        )
+        elapsed = time.perf_counter() - started
+
+        teams = Team.objects.in_bulk(inputs.team_ids)
+        team_rows = draft_simulation.team_rows(result)
+        player_rows = draft_simulation.player_rows(result)
+        fairness = draft_simulation.fairness(result)
+
+        self.stdout.write(
+            f"{draft_simulation.ORDER_LABELS[options['order']]}: {options['runs']} drafts of "
+            f"{len(inputs.team_ids)} teams x {inputs.num_rounds} rounds in {elapsed:.2f}s\n"
+        )
+
+        self.stdout.write(f"{'Pos':>3}  {'Team':<24} {'Expected strength':>18} {'Std':>8} {'Strongest':>10}")
+        for row in team_rows:
+            team = teams.get(row['team_id'])
+            self.stdout.write(
+                f"{row['draft_position']:>3}  {(team.name if team else row['team_id'])!s:<24.24} "
+                f"{row['mean_strength']:>18.1f} {row['std_strength']:>8.1f} {row['strongest_share']:>9.1%}"
+            )
+
+        correlation = fairness['position_correlation']
+        self.stdout.write(
+            f"\nFairness: spread {fairness['spread']:.1f}, std {fairness['std']:.1f}, "
+            f"correlation with draft position {'n/a' if correlation is None else f'{correlation:+.2f}'}\n"
+        )
+
+        listed = player_rows[:options['players']] if options['players'] else player_rows
+        players = Player.objects.in_bulk([row['player_id'] for row in listed])
+        self.stdout.write(f"{'Player':<28} {'Mean pick':>10} {'90% band':>10} {'Round 1':>8}")
+        for row in listed:
+            player = players.get(row['player_id'])
+            name = f"{player.first_name} {player.last_name}" if player else row['player_id']
+            if row['fixed']:
+                name = f"{name} (fixed)"
+            self.stdout.write(
+                f"{name!s:<28.28} {row['mean_pick']:>10.1f} {row['pick_low']:>4}-{row['pick_high']:<5} {row['first_round_share']:>7.1%}"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump({
+                    'order': options['order'],
+                    'runs': options['runs'],
+                    'noise': options['noise'],
+                    'seed': options['seed'],
+                    'teams': team_rows,
+                    'fairness': fairness,
+                    'players': player_rows,
+                }, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"\nResults written to {options['output']}"))
@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from players.models import Player, DraftPick
+from players.validation_engine import validation_engine
 
 
 class Command(BaseCommand):
@@ -11,6 +12,8 @@ class Command(BaseCommand):
 
         # Unassociate players from teams
         Player.objects.all().update(team=None)
+        # QuerySet.update() sends no signals, so tell the running workers' validation engines
+        validation_engine.mark_dirty(Player)
 
         # Reset the player_assigned_to_team flag on all draft picks
         flag_reset_count = DraftPick.objects.filter(player_assigned_to_team=True).update(player_assigned_to_team=False)
@@ -0,0 +1,84 @@
+"""
+Signed, expiring master password tokens.
+
+verify_master_password_view stores a signed token in the master_password
+cookie instead of the password itself.  The token embeds the current
+password version; MasterPasswordMiddleware checks the HMAC signature and
+compares the version against the general settings cache, so no database
+query is needed.  set_master_password bumps the version, which revokes
+every token issued for the old password.
+"""
+from django.core import signing
+from django.db import transaction
+
+from .general_settings import general_settings
+
+COOKIE_NAME = 'master_password'
+TOKEN_SALT = 'players.master_password'
+TOKEN_MAX_AGE = 30 * 24 * 60 * 60  # 30 days
+
+VERSION_KEY = 'master_password_version'
+
+
+def get_password_version():
+    return general_settings.get_int(VERSION_KEY, 0)
+
+
+async def aget_password_version():
+    return await general_settings.aget_int(VERSION_KEY, 0)
+
+
+def bump_password_version():
+    """Increment the stored password version; tokens for earlier versions stop validating."""
+    from .models import GeneralSetting
+
+    with transaction.atomic():
+        setting = GeneralSetting.objects.select_for_update().filter(key=VERSION_KEY).first()
+        try:
+            version = int(setting.value) + 1 if setting else 1
+        except ValueError:
+            version = 1
+
+        GeneralSetting.objects.update_or_create(key=VERSION_KEY, defaults={'value': str(version)})
+    return version
+
+
+def issue_token(version=None):
+    """Return a signed token for the current (or given) password version."""
+    if version is None:
+        version = get_password_version()
+    return signing.dumps({'v': version}, salt=TOKEN_SALT)
+
+
+def token_version(token):
+    """Return the password version embedded in a valid, unexpired token, or None."""
+    if not token:
+        return None
+    try:
+        payload = signing.loads(token, salt=TOKEN_SALT, max_age=TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        # Also covers SignatureExpired and legacy plaintext password cookies
+        return None
+    return payload.get('v') if isinstance(payload, dict) else None
+
+
+def is_valid_token(token):
+    version = token_version(token)
+    return version is not None and version == get_password_version()
+
+
+async def ais_valid_token(token):
+    version = token_version(token)
+    return version is not None and version == await aget_password_version()
+
+
+def set_token_cookie(response, version=None):
+    """Attach the signed token cookie to response."""
+    response.set_cookie(
+        COOKIE_NAME,
+        issue_token(version),
+        max_age=TOKEN_MAX_AGE,
+        httponly=False,  # Allow JavaScript to read/remove it (settings page "Remove Cookie")
+        samesite='Lax'
+    )
+    return response
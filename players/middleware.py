@@ -1,40 +1,100 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
 from django.urls import resolve
 from django.shortcuts import render
-from .models import DivisionValidationRegistry, ValidationCode, GeneralSetting
+from . import master_password, request_metrics, validation_routes, validation_triggers
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 
+class RequestMetricsMiddleware:
+    """
+    Record wall time, DB query count and DB time for every request, per resolved URL name.
+
+    Metrics are aggregated in memory (players/request_metrics.py) and served at /metrics.
+    Place it as early as possible so the timing covers the rest of the middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = request_metrics.start_request()
+        start = time.perf_counter()
+        response = None
+        try:
+            response = self.get_response(request)
+            return response
+        finally:
+            self._observe(request, response, start, request_metrics.finish_request(token))
+
+    async def __acall__(self, request):
+        token = request_metrics.start_request()
+        start = time.perf_counter()
+        response = None
+        try:
+            response = await self.get_response(request)
+            return response
+        finally:
+            self._observe(request, response, start, request_metrics.finish_request(token))
+
+    def _observe(self, request, response, start, collector):
+        try:
+            resolver_match = getattr(request, 'resolver_match', None)
+            request_metrics.request_metrics.observe(
+                view=resolver_match.view_name if resolver_match else None,
+                method=request.method,
+                duration=time.perf_counter() - start,
+                query_count=collector.count,
+                db_duration=collector.duration,
+                # An exception escaping here becomes a 500 further up the stack
+                status=response.status_code if response is not None else 500,
+            )
+        except Exception as e:
+            logger.error(f"Error recording request metrics: {str(e)}")
+
+
 class ValidationMiddleware:
     """
     Middleware to enforce validation logic based on DivisionValidationRegistry configuration.
 
     This middleware:
     1. Runs "validations to run on page load" before GET requests are processed
-    2. Runs "validation code triggers" after POST/PUT/PATCH/DELETE requests are processed
+    2. Queues "validation code triggers" after POST/PUT/PATCH/DELETE requests are processed
 
-    All validation lookups are done in real-time (no caching) to ensure current configuration is used.
+    Registry and validation code lookups are served from an in-memory route table
+    (players/validation_routes.py) that is rebuilt whenever either table is written.
+
+    Supports both sync and async request handling; under ASGI the async path
+    only leaves the event loop when the route table has to be rebuilt.
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
         # Get the current URL path
         path = request.path
 
-        # Skip validation for admin, static, and media URLs
-        if path.startswith('/admin/') or path.startswith('/static/') or path.startswith('/media/'):
-            return self.get_response(request)
-
-        # Skip validation for the division_validation_registry page itself to avoid circular dependencies
-        if path == '/division_validation_registry/':
-            return self.get_response(request)
-
-        # Skip validation for draft API endpoints
-        if path.startswith('/draft/available-players/') or path.startswith('/draft/make-pick/'):
+        if self._is_skipped_path(path):
             return self.get_response(request)
 
         # === BEFORE REQUEST: Run "validations to run on page load" for GET requests ===
@@ -48,59 +108,122 @@ class ValidationMiddleware:
         response = self.get_response(request)
 
         # === AFTER REQUEST: Run "validation code triggers" for CRUD operations ===
-        if request.method in ['POST', 'PUT', 'PATCH', 'DELETE']:
-            # Only run triggers if the response was successful (2xx status code)
-            if 200 <= response.status_code < 300:
-                self._run_validation_triggers(path, request)
+        if self._should_run_triggers(request, response):
+            self._run_validation_triggers(path, request)
 
         return response
 
-    def _run_page_load_validations(self, path):
+    async def __acall__(self, request):
+        path = request.path
+
+        if self._is_skipped_path(path):
+            return await self.get_response(request)
+
+        # === BEFORE REQUEST: Run "validations to run on page load" for GET requests ===
+        if request.method == 'GET':
+            validation_error = await self._arun_page_load_validations(path)
+            if validation_error:
+                # Block the page from loading and show error message
+                return self._render_validation_error(request, validation_error)
+
+        # Process the request
+        response = await self.get_response(request)
+
+        # === AFTER REQUEST: Run "validation code triggers" for CRUD operations ===
+        if self._should_run_triggers(request, response):
+            await self._arun_validation_triggers(path, request)
+
+        return response
+
+    def _is_skipped_path(self, path):
+        """Check if the given path bypasses validation entirely."""
+        # Skip validation for admin, static, and media URLs
+        if path.startswith('/admin/') or path.startswith('/static/') or path.startswith('/media/'):
+            return True
+
+        # Skip validation for the division_validation_registry page itself to avoid circular dependencies
+        if path == '/division_validation_registry/':
+            return True
+
+        # Skip validation for draft API endpoints
+        if path.startswith('/draft/available-players/') or path.startswith('/draft/make-pick/') or path.startswith('/draft/clock/'):
+            return True
+        if path.startswith('/teams/') and path.endswith('/available-players/'):
+            return True
+
+        return False
+
+    def _should_run_triggers(self, request, response):
+        """Only run triggers for CRUD operations with a successful (2xx) response."""
+        return request.method in ['POST', 'PUT', 'PATCH', 'DELETE'] and 200 <= response.status_code < 300
+
+    def _check_page_load_validations(self, route_table, path):
         """
-        Run validations that must pass before the page can load.
+        Check the page's load validations against the route table.
 
         Returns: Error message string if validation fails, None if all validations pass
         """
-        from django.db import connection
+        route = route_table.lookup(path)
 
-        try:
-            # Look up validation registry for this page (real-time, no cache)
-            registry = DivisionValidationRegistry.objects.filter(page=path).first()
+        if not route or not route.page_load:
+            # No validations configured for this page
+            return None
 
-            if not registry:
-                # No validations configured for this page
-                return None
+        # Run each validation
+        for validation_code in route.page_load:
+            validation = route_table.codes.get(validation_code)
 
-            # Get the list of validations to run on page load
-            validations_to_run = registry.validations_to_run_on_page_load or []
+            if not validation:
+                logger.warning(f"Validation code '{validation_code}' not found in database")
+                continue
 
-            if not validations_to_run:
-                # No validations configured
-                return None
+            # Check if validation value is True (validation passed)
+            validation_passed = validation.value
 
-            # Fetch all validation codes in a single query to reduce DB hits
-            validation_codes = ValidationCode.objects.filter(code__in=validations_to_run).in_bulk(field_name='code')
+            if not validation_passed:
+                # Validation failed - return the error message
+                error_message = validation.error_message or f"Validation '{validation_code}' failed"
+                logger.info(f"Page load validation failed for {path}: {validation_code}")
+                return error_message
 
-            # Run each validation
-            for validation_code in validations_to_run:
-                validation = validation_codes.get(validation_code)
+        # All validations passed
+        return None
 
-                if not validation:
-                    logger.warning(f"Validation code '{validation_code}' not found in database")
-                    continue
+    async def _arun_page_load_validations(self, path):
+        """Async variant of _run_page_load_validations()."""
+        try:
+            route_table = await validation_routes.aget_route_table()
+            return self._check_page_load_validations(route_table, path)
+        except Exception as e:
+            logger.error(f"Error running page load validations for {path}: {str(e)}")
+            return None  # Don't block page on middleware errors
+
+    async def _arun_validation_triggers(self, path, request):
+        """Async variant of _run_validation_triggers()."""
+        try:
+            route = (await validation_routes.aget_route_table()).lookup(path)
 
-                # Check if validation value is True (validation passed)
-                # (ValidationCode.value is now a BooleanField)
-                validation_passed = validation.value
+            if not route or not route.triggers:
+                return
 
-                if not validation_passed:
-                    # Validation failed - return the error message
-                    error_message = validation.error_message or f"Validation '{validation_code}' failed"
-                    logger.info(f"Page load validation failed for {path}: {validation_code}")
-                    return error_message
+            # Enqueueing may run triggers inline (debounce disabled), which touches the ORM
+            await sync_to_async(validation_triggers.enqueue)(route.triggers)
+            logger.info(f"Validation triggers {list(route.triggers)} queued for {path}")
 
-            # All validations passed
-            return None
+        except Exception as e:
+            logger.error(f"Error running validation triggers for {path}: {str(e)}")
+
+    def _run_page_load_validations(self, path):
+        """
+        Run validations that must pass before the page can load.
+
+        Returns: Error message string if validation fails, None if all validations pass
+        """
+        from django.db import connection
+
+        try:
+            # Look up validation route for this page (in-memory, rebuilt on writes)
+            return self._check_page_load_validations(validation_routes.get_route_table(), path)
 
         except Exception as e:
             logger.error(f"Error running page load validations for {path}: {str(e)}")
@@ -113,41 +236,23 @@ class ValidationMiddleware:
 
     def _run_validation_triggers(self, path, request):
         """
-        Run validation triggers after CRUD operations.
+        Queue validation triggers after CRUD operations.
 
         These validations call Python validation functions which update the validation_codes table.
+        They run on a background thread after a short debounce window, so repeated writes
+        to the same page only run each trigger once (see players/validation_triggers.py).
         """
         from django.db import connection
 
         try:
-            # Look up validation registry for this page (real-time, no cache)
-            registry = DivisionValidationRegistry.objects.filter(page=path).first()
-
-            if not registry:
-                return
+            # Look up validation route for this page (in-memory, rebuilt on writes)
+            route = validation_routes.get_route_table().lookup(path)
 
-            # Get the list of validation code triggers
-            validation_triggers = registry.validation_code_triggers or []
-
-            if not validation_triggers:
+            if not route or not route.triggers:
                 return
 
-            # Import views module to access validation functions
-            from . import views
-
-            # Run each validation trigger
-            for validation_code in validation_triggers:
-                # Check if Python validation function exists
-                if not hasattr(views, validation_code):
-                    logger.warning(f"Validation function '{validation_code}' not found in views")
-                    continue
-
-                # Call the Python validation function
-                # The function will update the ValidationCode.value field to "true" or "false"
-                validation_function = getattr(views, validation_code)
-                validation_function()
-
-                logger.info(f"Validation trigger '{validation_code}' executed for {path}")
+            validation_triggers.enqueue(route.triggers)
+            logger.info(f"Validation triggers {list(route.triggers)} queued for {path}")
 
         except Exception as e:
             logger.error(f"Error running validation triggers for {path}: {str(e)}")
@@ -222,6 +327,9 @@ class MasterPasswordMiddleware:
     - player_rankings/analyze/public/
     - calendar/
     - try_out_check_in/
+
+    Supports both sync and async request handling; the password is read from the
+    in-memory general settings cache, so the async path normally stays on the event loop.
     """
 
     # Define exempt URL patterns
@@ -248,24 +356,32 @@ class MasterPasswordMiddleware:
         '/api/update-manager/',
         '/api/search-players/',
         '/api/toggle-try-out-attendance/',
+        '/api/player-rankings/pool/',
+        '/api/manager-daughter-rankings/pool/',
+        '/api/sibling-rankings/pool/',
+        '/api/draft/events/',
     ]
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
         path = request.path
 
         # Check if this path is exempt
         if self._is_exempt_path(path):
             return self.get_response(request)
 
-        # Check if user has valid master password cookie
-        cookie_password = request.COOKIES.get('master_password')
-        db_password = self._get_master_password_from_db()
-
-        # If cookie exists and matches database password, allow access
-        if cookie_password and cookie_password == db_password:
+        # Check if user has a valid master password token (signature check, no query)
+        if master_password.is_valid_token(request.COOKIES.get(master_password.COOKIE_NAME)):
             return self.get_response(request)
 
         # User needs to be challenged - inject password requirement flag
@@ -273,6 +389,19 @@ class MasterPasswordMiddleware:
 
         return self.get_response(request)
 
+    async def __acall__(self, request):
+        path = request.path
+
+        if not self._is_exempt_path(path):
+            # Check if user has a valid master password token
+            token = request.COOKIES.get(master_password.COOKIE_NAME)
+
+            if not await master_password.ais_valid_token(token):
+                # User needs to be challenged - inject password requirement flag
+                request.needs_master_password_challenge = True
+
+        return await self.get_response(request)
+
     def _is_exempt_path(self, path):
         """Check if the given path is exempt from master password authentication."""
         # Check standard exempt paths
@@ -286,14 +415,3 @@ class MasterPasswordMiddleware:
             return True
 
         return False
-
-    def _get_master_password_from_db(self):
-        """Retrieve master password from database."""
-        try:
-            setting = GeneralSetting.objects.filter(key='master_password').first()
-            if setting:
-                return setting.value
-            else:
-                return 'wusarocks'  # Default fallback
-        except:
-            return 'wusarocks'  # Default fallback on error
@@ -0,0 +1,78 @@
+# Generated by Django 4.2.27 on 2026-10-16 23:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+import json
+
+
+def backfill_ranking_entries(apps, schema_editor):
+    """Create a ranking entry for every ranked player in the existing JSON rankings"""
+    Player = apps.get_model('players', 'Player')
+    RankingEntry = apps.get_model('players', 'RankingEntry')
+    player_ids = set(Player.objects.values_list('id', flat=True))
+
+    def to_int(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    for kind, model_name in [('player', 'PlayerRanking'), ('daughter', 'ManagerDaughterRanking'), ('sibling', 'SiblingRanking')]:
+        entries = []
+        for submission in apps.get_model('players', model_name).objects.all():
+            try:
+                ranking_data = json.loads(submission.ranking)
+            except (json.JSONDecodeError, TypeError):
+                continue
+            if not isinstance(ranking_data, list):
+                continue
+
+            seen = set()
+            for item in ranking_data:
+                if not isinstance(item, dict):
+                    continue
+                player_id = to_int(item.get('player_id'))
+                rank = to_int(item.get('rank'))
+                # Skip incomplete items, deleted players and repeats within a submission
+                if not player_id or not rank or player_id not in player_ids or player_id in seen:
+                    continue
+                seen.add(player_id)
+                entries.append(RankingEntry(
+                    kind=kind,
+                    submission_id=submission.id,
+                    manager_id=submission.manager_id,
+                    player_id=player_id,
+                    rank=rank,
+                    suggested_round=to_int(item.get('round')) or None,
+                ))
+        RankingEntry.objects.bulk_create(entries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0065_add_email_settings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankingEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('player', 'Player Ranking'), ('daughter', 'Manager Daughter Ranking'), ('sibling', 'Sibling Ranking')], max_length=20)),
+                ('submission_id', models.IntegerField()),
+                ('rank', models.IntegerField()),
+                ('suggested_round', models.IntegerField(blank=True, null=True)),
+                ('manager', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ranking_entries', to='players.manager')),
+                ('player', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ranking_entries', to='players.player')),
+            ],
+            options={
+                'verbose_name': 'Ranking Entry',
+                'verbose_name_plural': 'Ranking Entries',
+                'db_table': 'ranking_entries',
+                'indexes': [models.Index(fields=['kind', 'player'], name='ranking_entry_kind_player'), models.Index(fields=['kind', 'manager'], name='ranking_entry_kind_manager')],
+                'unique_together': {('kind', 'submission_id', 'player')},
+            },
+        ),
+        migrations.RunPython(backfill_ranking_entries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.27 on 2026-10-16 23:56
+
+from django.db import migrations, models
+import django.db.models.deletion
+from collections import Counter, defaultdict
+
+
+def backfill_ranking_tallies(apps, schema_editor):
+    """Total up the existing ranking entries per kind and player"""
+    RankingEntry = apps.get_model('players', 'RankingEntry')
+    RankingTally = apps.get_model('players', 'RankingTally')
+
+    entries = list(RankingEntry.objects.values_list('kind', 'submission_id', 'player_id', 'rank', 'suggested_round'))
+    submission_sizes = Counter((kind, submission_id) for kind, submission_id, _, _, _ in entries)
+
+    tallies = {}
+    rank_counts = defaultdict(Counter)
+    round_counts = defaultdict(Counter)
+    for kind, submission_id, player_id, rank, round_num in entries:
+        key = (kind, player_id)
+        if key not in tallies:
+            tallies[key] = RankingTally(kind=kind, player_id=player_id)
+        tally = tallies[key]
+        tally.num_rankings += 1
+        tally.rank_sum += rank
+        tally.submission_borda += submission_sizes[(kind, submission_id)] - rank + 1
+        rank_counts[key][str(rank)] += 1
+        round_counts[key][str(round_num or 0)] += 1
+
+    for key, tally in tallies.items():
+        tally.rank_counts = dict(rank_counts[key])
+        tally.round_counts = dict(round_counts[key])
+    RankingTally.objects.bulk_create(tallies.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0066_ranking_entries'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankingTally',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('player', 'Player Ranking'), ('daughter', 'Manager Daughter Ranking'), ('sibling', 'Sibling Ranking')], max_length=20)),
+                ('num_rankings', models.IntegerField(default=0)),
+                ('rank_sum', models.IntegerField(default=0)),
+                ('submission_borda', models.IntegerField(default=0)),
+                ('rank_counts', models.JSONField(default=dict)),
+                ('round_counts', models.JSONField(default=dict)),
+                ('player', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ranking_tallies', to='players.player')),
+            ],
+            options={
+                'verbose_name': 'Ranking Tally',
+                'verbose_name_plural': 'Ranking Tallies',
+                'db_table': 'ranking_tallies',
+                'unique_together': {('kind', 'player')},
+            },
+        ),
+        migrations.RunPython(backfill_ranking_tallies, migrations.RunPython.noop),
+    ]
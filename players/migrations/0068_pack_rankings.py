@@ -0,0 +1,80 @@
+# Generated by Django 4.2.27 on 2026-10-17 09:20
+
+from django.db import migrations
+import json
+
+SUBMISSION_MODELS = ['PlayerRanking', 'ManagerDaughterRanking', 'SiblingRanking']
+
+
+def to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def pack_rankings(apps, schema_editor):
+    """
+    Rewrite legacy rankings ([{"rank", "player_id", "round"}, ...]) as packed
+    ones ({"ids": [...], "rounds": [...]}).  Rankings whose ranks aren't their
+    positions once sorted are left in the legacy format, which is still read.
+    """
+    for model_name in SUBMISSION_MODELS:
+        model = apps.get_model('players', model_name)
+        changed = []
+        for submission in model.objects.only('id', 'ranking'):
+            try:
+                ranking_data = json.loads(submission.ranking)
+            except (json.JSONDecodeError, TypeError):
+                continue
+            if not isinstance(ranking_data, list) or not all(isinstance(item, dict) for item in ranking_data):
+                continue
+
+            items = sorted(ranking_data, key=lambda item: to_int(item.get('rank')) or 0)
+            ranks = [to_int(item.get('rank')) for item in items]
+            player_ids = [to_int(item.get('player_id')) for item in items]
+            if ranks != list(range(1, len(items) + 1)) or not all(player_ids) or len(set(player_ids)) != len(player_ids):
+                continue
+
+            packed = {'ids': player_ids}
+            if any('round' in item for item in items):
+                packed['rounds'] = [to_int(item.get('round')) or None for item in items]
+            submission.ranking = json.dumps(packed, separators=(',', ':'))
+            changed.append(submission)
+        model.objects.bulk_update(changed, ['ranking'], batch_size=500)
+
+
+def unpack_rankings(apps, schema_editor):
+    """Rewrite packed rankings in the legacy format."""
+    for model_name in SUBMISSION_MODELS:
+        model = apps.get_model('players', model_name)
+        changed = []
+        for submission in model.objects.only('id', 'ranking'):
+            try:
+                ranking_data = json.loads(submission.ranking)
+            except (json.JSONDecodeError, TypeError):
+                continue
+            if not isinstance(ranking_data, dict):
+                continue
+
+            rounds = ranking_data.get('rounds')
+            items = []
+            for position, player_id in enumerate(ranking_data.get('ids') or []):
+                item = {'rank': position + 1, 'player_id': player_id}
+                if rounds is not None:
+                    item['round'] = rounds[position] if position < len(rounds) else None
+                items.append(item)
+            submission.ranking = json.dumps(items)
+            changed.append(submission)
+        model.objects.bulk_update(changed, ['ranking'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0067_ranking_tallies'),
+    ]
+
+    operations = [
+        migrations.RunPython(pack_rankings, unpack_rankings),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.27 on 2026-10-17 00:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0068_pack_rankings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DraftEvent',
+            fields=[
+                ('seq', models.BigAutoField(primary_key=True, serialize=False)),
+                ('event_type', models.CharField(choices=[('draft_update', 'Pick'), ('undraft_update', 'Undraft'), ('draft_reset', 'Reset')], max_length=20)),
+                ('payload', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'draft_events',
+                'ordering': ['seq'],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.27 on 2026-10-17 00:23
+
+from django.db import migrations, models
+
+
+def remove_duplicate_picks(apps, schema_editor):
+    """
+    Make the existing picks satisfy the new constraints: of several picks in
+    one slot keep the last one saved, and of several picks of one player keep
+    the earliest slot and empty the others.
+    """
+    DraftPick = apps.get_model('players', 'DraftPick')
+
+    seen_slots = set()
+    duplicate_slots = []
+    for pick_id, round_num, pick_num in DraftPick.objects.order_by('-updated_at', '-id').values_list('id', 'round', 'pick'):
+        if (round_num, pick_num) in seen_slots:
+            duplicate_slots.append(pick_id)
+        seen_slots.add((round_num, pick_num))
+    DraftPick.objects.filter(id__in=duplicate_slots).delete()
+
+    seen_players = set()
+    duplicate_players = []
+    for pick_id, player_id in DraftPick.objects.filter(player__isnull=False).order_by('round', 'pick').values_list('id', 'player_id'):
+        if player_id in seen_players:
+            duplicate_players.append(pick_id)
+        seen_players.add(player_id)
+    DraftPick.objects.filter(id__in=duplicate_players).update(player=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0069_draft_events'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_picks, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='draftpick',
+            constraint=models.UniqueConstraint(fields=('round', 'pick'), name='unique_draft_pick_slot'),
+        ),
+        migrations.AddConstraint(
+            model_name='draftpick',
+            constraint=models.UniqueConstraint(fields=('player',), name='unique_draft_pick_player'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.27 on 2026-10-17 00:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0070_draft_pick_uniqueness'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='draft',
+            name='clock_deadline',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='draft',
+            name='clock_pick',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='draft',
+            name='clock_round',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='draft',
+            name='pick_clock_seconds',
+            field=models.IntegerField(default=90),
+        ),
+    ]
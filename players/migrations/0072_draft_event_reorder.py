@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-17 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('players', '0071_draft_pick_clock'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='draftevent',
+            name='event_type',
+            field=models.CharField(choices=[('draft_update', 'Pick'), ('undraft_update', 'Undraft'), ('draft_reset', 'Reset'), ('draft_reorder', 'Reorder')], max_length=20),
+        ),
+    ]
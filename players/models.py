@@ -9,6 +9,13 @@ class Draft(models.Model):
     final_round_draft_order = models.TextField(blank=True, null=True)
     final_round_picks = models.IntegerField(null=True, blank=True)  # Number of picks in the final round
 
+    # Pick clock (see players/draft_clock.py): the slot on the clock and when
+    # its time runs out; no deadline means the clock is stopped
+    pick_clock_seconds = models.IntegerField(default=90)
+    clock_round = models.IntegerField(null=True, blank=True)
+    clock_pick = models.IntegerField(null=True, blank=True)
+    clock_deadline = models.DateTimeField(null=True, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -33,11 +40,44 @@ class DraftPick(models.Model):
     class Meta:
         db_table = 'draft_picks'
         ordering = ['round', 'pick']
+        constraints = [
+            # One pick per slot, and a player is drafted at most once (empty
+            # picks don't count: NULLs never conflict)
+            models.UniqueConstraint(fields=['round', 'pick'], name='unique_draft_pick_slot'),
+            models.UniqueConstraint(fields=['player'], name='unique_draft_pick_player'),
+        ]
 
     def __str__(self):
         return f"Round {self.round}, Pick {self.pick}"
 
 
+class DraftEvent(models.Model):
+    """One pick, undraft, reset or reorder of the draft, numbered in the order they happened (see players/draft_events.py)"""
+    EVENT_TYPE_CHOICES = [
+        ('draft_update', 'Pick'),
+        ('undraft_update', 'Undraft'),
+        ('draft_reset', 'Reset'),
+        ('draft_reorder', 'Reorder'),
+    ]
+
+    seq = models.BigAutoField(primary_key=True)
+    event_type = models.CharField(max_length=20, choices=EVENT_TYPE_CHOICES)
+    payload = models.JSONField(default=dict)  # The WebSocket message fields besides type and seq
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'draft_events'
+        ordering = ['seq']
+
+    def __str__(self):
+        return f"#{self.seq} {self.get_event_type_display()}"
+
+    def message(self):
+        """The event as sent to WebSocket clients."""
+        return {'type': self.event_type, 'seq': self.seq, **self.payload}
+
+
 class Manager(models.Model):
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
@@ -161,6 +201,58 @@ class SiblingRanking(models.Model):
         return f"Sibling Ranking {self.id} by {self.manager}" if self.manager else f"Sibling Ranking {self.id}"
 
 
+class RankingEntry(models.Model):
+    """One ranked player in a PlayerRanking / ManagerDaughterRanking / SiblingRanking submission (see players/rankings.py)"""
+    KIND_PLAYER = 'player'
+    KIND_DAUGHTER = 'daughter'
+    KIND_SIBLING = 'sibling'
+    KIND_CHOICES = [
+        (KIND_PLAYER, 'Player Ranking'),
+        (KIND_DAUGHTER, 'Manager Daughter Ranking'),
+        (KIND_SIBLING, 'Sibling Ranking'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    submission_id = models.IntegerField()  # id of the ranking row of this kind
+    manager = models.ForeignKey(Manager, on_delete=models.SET_NULL, null=True, blank=True, related_name='ranking_entries')
+    player = models.ForeignKey(Player, on_delete=models.CASCADE, related_name='ranking_entries')
+    rank = models.IntegerField()
+    suggested_round = models.IntegerField(null=True, blank=True)  # Draft round (daughter and sibling rankings only)
+
+    class Meta:
+        db_table = 'ranking_entries'
+        unique_together = ('kind', 'submission_id', 'player')
+        indexes = [
+            models.Index(fields=['kind', 'player'], name='ranking_entry_kind_player'),
+            models.Index(fields=['kind', 'manager'], name='ranking_entry_kind_manager'),
+        ]
+        verbose_name = 'Ranking Entry'
+        verbose_name_plural = 'Ranking Entries'
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.submission_id}: #{self.rank} {self.player}"
+
+
+class RankingTally(models.Model):
+    """Running totals of one player's ranking entries of one kind (see players/ranking_tallies.py)"""
+    kind = models.CharField(max_length=20, choices=RankingEntry.KIND_CHOICES)
+    player = models.ForeignKey(Player, on_delete=models.CASCADE, related_name='ranking_tallies')
+    num_rankings = models.IntegerField(default=0)
+    rank_sum = models.IntegerField(default=0)
+    submission_borda = models.IntegerField(default=0)  # Sum of (submission size - rank + 1)
+    rank_counts = models.JSONField(default=dict)  # {"rank": number of submissions}
+    round_counts = models.JSONField(default=dict)  # {"round": number of submissions}, "0" = no round given
+
+    class Meta:
+        db_table = 'ranking_tallies'
+        unique_together = ('kind', 'player')
+        verbose_name = 'Ranking Tally'
+        verbose_name_plural = 'Ranking Tallies'
+
+    def __str__(self):
+        return f"{self.get_kind_display()} tally for {self.player}"
+
+
 class TeamPreference(models.Model):
     manager = models.ForeignKey(Manager, on_delete=models.CASCADE, related_name='team_preferences')
     preferences = models.JSONField(default=dict)
@@ -0,0 +1,90 @@
+"""
+Versioned, process-local cache of ranking aggregates.
+
+While rankings are open every manager keeps refreshing the analyze pages, and
+each hit used to rebuild the aggregate from every submission.  The cache keeps
+one RankingAggregate (players/ranking_engine.py) per kind, tagged with the
+version it was computed at:
+
+- a kind's version is bumped on every save/delete of its PlayerRanking /
+  ManagerDaughterRanking / SiblingRanking rows (players/signals.py), now and
+  again once the write commits, and on every other worker through a
+  broadcast (players/cache_invalidation.py)
+- a read whose snapshot has the current version is served from memory
+- otherwise a single thread recomputes it under the kind's lock; readers that
+  arrive meanwhile wait for that result instead of computing their own
+- deleting a player bumps the kinds she was ranked in once their tallies are
+  rebuilt without her entries (players/signals.py)
+- a TTL is the safety net for a missed broadcast
+"""
+import functools
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+
+from . import cache_invalidation, ranking_engine
+from .rankings import SUBMISSION_MODELS
+
+CACHE_NAME = 'ranking_aggregates'
+
+# Seconds before a snapshot is recomputed even without a new version
+DEFAULT_TTL = 300
+
+Snapshot = namedtuple('Snapshot', ['version', 'aggregate', 'loaded_at'])
+
+
+class RankingAggregateCache:
+    def __init__(self):
+        self._versions = {kind: 0 for kind in SUBMISSION_MODELS}
+        self._snapshots = {}
+        self._version_lock = threading.Lock()
+        self._compute_locks = {kind: threading.Lock() for kind in SUBMISSION_MODELS}
+
+    def _ttl(self):
+        return getattr(settings, 'RANKING_AGGREGATE_CACHE_TTL', DEFAULT_TTL)
+
+    def _is_current(self, snapshot, kind):
+        return (
+            snapshot is not None
+            and snapshot.version == self._versions[kind]
+            and time.monotonic() - snapshot.loaded_at < self._ttl()
+        )
+
+    def version(self, kind):
+        return self._versions[kind]
+
+    def get(self, kind):
+        """The RankingAggregate for one kind, recomputed only if a ranking changed since it was built."""
+        snapshot = self._snapshots.get(kind)
+        if self._is_current(snapshot, kind):
+            return snapshot.aggregate
+
+        with self._compute_locks[kind]:
+            # Another thread may have recomputed it while this one waited
+            snapshot = self._snapshots.get(kind)
+            if not self._is_current(snapshot, kind):
+                # Read the version first: a write during the recompute bumps it
+                # again, so this snapshot is never mistaken for the newer data
+                version = self._versions[kind]
+                snapshot = Snapshot(version, ranking_engine.aggregate(kind), time.monotonic())
+                self._snapshots[kind] = snapshot
+
+        cache_invalidation.start_invalidation_listener()
+        return snapshot.aggregate
+
+    def bump(self, kind=None):
+        """Advance the version of one kind (or all of them) so the next read recomputes."""
+        with self._version_lock:
+            for changed in ([kind] if kind else list(self._versions)):
+                self._versions[changed] += 1
+
+
+def broadcast_name(kind):
+    return f'{CACHE_NAME}:{kind}'
+
+
+ranking_aggregates = RankingAggregateCache()
+for _kind in SUBMISSION_MODELS:
+    cache_invalidation.register(broadcast_name(_kind), functools.partial(ranking_aggregates.bump, _kind))
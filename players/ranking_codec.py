@@ -0,0 +1,110 @@
+"""
+Storage format of ranking submissions.
+
+The `ranking` column of PlayerRanking / ManagerDaughterRanking / SiblingRanking
+holds one manager's submission as JSON.  Rankings used to be stored as a list
+of dicts, repeating keys and a rank that is just the position:
+
+    [{"rank": 1, "player_id": 12, "round": 1}, {"rank": 2, "player_id": 7, "round": 2}]
+
+They are now packed as the ranked player ids in order, plus the suggested
+draft rounds as a parallel array when the ranking has them (null for an item
+without a round):
+
+    {"ids":[12,7],"rounds":[1,2]}
+
+Every writer goes through encode() and every reader through decode(), which
+still reads the legacy format: migration 0068 packs the existing rows, but a
+legacy row whose ranks aren't its positions (1, 2, 3, ...) is left as it is.
+"""
+import json
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def encode(player_ids, rounds=None):
+    """Packed JSON for a ranking of player_ids in order, with their suggested rounds if given."""
+    packed = {'ids': [int(player_id) for player_id in player_ids]}
+    if rounds is not None:
+        packed['rounds'] = [_to_int(round_num) or None for round_num in rounds]
+    return json.dumps(packed, separators=(',', ':'))
+
+
+def encode_items(items, with_rounds=False):
+    """
+    Packed JSON for a ranking given as legacy-style items
+    ([{'player_id', 'rank'(, 'round')}], e.g. posted by the ranking pages),
+    ordered by rank.
+    """
+    ranked = sorted(_legacy_items(items if isinstance(items, list) else []), key=lambda item: item[1])
+    return encode(
+        [player_id for player_id, _, _ in ranked],
+        [round_num for _, _, round_num in ranked] if with_rounds else None,
+    )
+
+
+def is_packed(ranking):
+    """Whether a stored ranking is already in the packed format."""
+    return isinstance(ranking, str) and ranking.lstrip().startswith('{')
+
+
+def decode(ranking):
+    """
+    (player_id, rank, round) for each item of a stored ranking (either format),
+    in stored order.  Invalid JSON gives no items; items without a player or
+    rank and repeats of a player already ranked are skipped; a missing round is
+    None.
+    """
+    try:
+        ranking_data = json.loads(ranking)
+    except (json.JSONDecodeError, TypeError):
+        return []
+
+    if isinstance(ranking_data, dict):
+        return _packed_items(ranking_data)
+    if isinstance(ranking_data, list):
+        return _legacy_items(ranking_data)
+    return []
+
+
+def _packed_items(ranking_data):
+    player_ids = ranking_data.get('ids')
+    if not isinstance(player_ids, list):
+        return []
+    rounds = ranking_data.get('rounds')
+    if not isinstance(rounds, list):
+        rounds = []
+
+    items = []
+    seen = set()
+    for position, player_id in enumerate(player_ids):
+        if type(player_id) is not int:
+            player_id = _to_int(player_id)
+        if not player_id or player_id in seen:
+            continue
+        seen.add(player_id)
+        round_num = rounds[position] if position < len(rounds) else None
+        if round_num is not None and type(round_num) is not int:
+            round_num = _to_int(round_num)
+        items.append((player_id, position + 1, round_num or None))
+    return items
+
+
+def _legacy_items(ranking_data):
+    items = []
+    seen = set()
+    for item in ranking_data:
+        if not isinstance(item, dict):
+            continue
+        player_id = _to_int(item.get('player_id'))
+        rank = _to_int(item.get('rank'))
+        if not player_id or not rank or player_id in seen:
+            continue
+        seen.add(player_id)
+        items.append((player_id, rank, _to_int(item.get('round')) or None))
+    return items
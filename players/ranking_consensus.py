@@ -0,0 +1,164 @@
+"""
+Pairwise-preference consensus methods for manager rankings.
+
+Borda only scores the players each manager listed, so a player missing from a
+manager's top N gets nothing from that manager, no matter how the lists
+compare.  The pairwise methods here instead count, for every pair of players,
+how many submissions prefer one to the other; a listed player is preferred to
+every unlisted one and two unlisted players are a tie.  All of them start from
+one players x players preference matrix, built with NumPy from the submissions'
+ranks with one vectorized comparison per submission:
+
+- copeland: one point per head-to-head majority won, half a point per tie
+- schulze:  strongest paths between every pair (Floyd-Warshall on the
+            majority margins); a player is ahead of every player they beat
+            along their strongest path
+- kemeny:   the order that agrees with the most pairwise preferences,
+            approximated by local search (moving single players) from the
+            Copeland order
+
+The `ranking_consensus_method` general setting picks the method used by the
+analyze pages (borda, copeland, schulze or kemeny; borda if unset).  Ties are
+broken by the Borda order.  RankingAggregate (players/ranking_engine.py)
+computes each order once per cached aggregate.
+"""
+import numpy as np
+
+from .general_settings import general_settings
+
+METHOD_SETTING = 'ranking_consensus_method'
+
+BORDA = 'borda'
+COPELAND = 'copeland'
+SCHULZE = 'schulze'
+KEMENY = 'kemeny'
+
+METHOD_LABELS = {
+    BORDA: 'Borda Count',
+    COPELAND: 'Copeland',
+    SCHULZE: 'Schulze',
+    KEMENY: 'Kemeny (approximate)',
+}
+
+# Local-search passes before the Kemeny approximation stops improving
+KEMENY_MAX_PASSES = 100
+
+
+def configured_method():
+    """The consensus method selected in general settings (Borda if unset or unknown)."""
+    method = (general_settings.get(METHOD_SETTING) or BORDA).strip().lower()
+    return method if method in METHOD_LABELS else BORDA
+
+
+def preference_matrix(submission_ranks):
+    """
+    preferences[i, j] = number of submissions that prefer player i to player j,
+    from a submissions x players matrix of the rank each submission gives each
+    player (0 if it doesn't list them).
+    """
+    num_players = submission_ranks.shape[1]
+    preferences = np.zeros((num_players, num_players), dtype=np.int32)
+    if submission_ranks.size == 0:
+        return preferences
+
+    # Unlisted players rank last; compare in the narrowest type that holds the
+    # ranks
+    unlisted = int(submission_ranks.max()) + 1
+    ranks = np.where(submission_ranks > 0, submission_ranks, unlisted).astype(np.min_scalar_type(unlisted))
+
+    # Each listed player is preferred to every player ranked below them in the
+    # same submission: one comparison block per submission, added to the rows
+    # of the players it lists
+    for submission in ranks:
+        listed = np.flatnonzero(submission < unlisted)
+        preferences[listed] += submission > submission[listed, None]
+    return preferences
+
+
+def copeland_scores(preferences):
+    """Head-to-head majorities won, plus half a point for each tie."""
+    wins = (preferences > preferences.T).sum(axis=1)
+    ties = (preferences == preferences.T).sum(axis=1) - 1  # Not counting the player against themselves
+    return wins + ties / 2
+
+
+def schulze_scores(preferences):
+    """Number of players each player beats by strongest path."""
+    # Only majorities are edges; a path is as strong as its weakest majority
+    strength = np.where(preferences > preferences.T, preferences, 0)
+
+    # Only the order of the strengths matters, so replace them by their rank
+    # among the distinct values, in the narrowest type that holds those (the
+    # loop below is memory bound)
+    present = np.bincount(strength.ravel(), minlength=1) > 0
+    value_ranks = np.cumsum(present) - 1
+    strength = value_ranks.astype(np.min_scalar_type(value_ranks[-1]))[strength]
+
+    # Floyd-Warshall for widest paths, one intermediate player at a time
+    through = np.empty_like(strength)
+    for k in range(len(strength)):
+        np.minimum(strength[:, k, None], strength[None, k, :], out=through)
+        np.maximum(strength, through, out=strength)
+
+    return (strength > strength.T).sum(axis=1)
+
+
+def kemeny_order(preferences, initial_order):
+    """
+    Approximate Kemeny order: starting from initial_order, repeatedly move
+    players to the position that most increases the number of pairwise
+    preferences the order agrees with, until no move helps.
+    """
+    order = np.array(initial_order, dtype=np.int64)
+    margins = (preferences - preferences.T).astype(np.int32)
+    num_players = len(order)
+
+    for _ in range(KEMENY_MAX_PASSES):
+        ordered = margins.take(order, axis=0).take(order, axis=1)
+        running = np.zeros((num_players, num_players + 1), dtype=np.int32)
+        np.cumsum(ordered, axis=1, out=running[:, 1:])
+
+        # gains[a, b]: agreement gained by moving the player at position a to
+        # position b; moving up passes the players at b..a-1, moving down the
+        # players at a+1..b
+        positions = np.arange(num_players)
+        at_player = running[positions, positions][:, None]
+        gains = np.where(
+            positions[None, :] < positions[:, None],
+            at_player - running[:, :num_players],
+            at_player + ordered[positions, positions][:, None] - running[:, 1:],
+        )
+        targets = gains.argmax(axis=1)
+        best = gains[positions, targets]
+        if not (best > 0).any():
+            break
+
+        # Moves over disjoint stretches of the order don't change each other's
+        # gains, so apply as many of them as possible per pass, best first
+        taken = np.zeros(num_players, dtype=bool)
+        for position in np.argsort(-best, kind='stable'):
+            if best[position] <= 0:
+                break
+            low, high = sorted((int(position), int(targets[position])))
+            if taken[low:high + 1].any():
+                continue
+            taken[low:high + 1] = True
+            if position > targets[position]:
+                order[low:high + 1] = np.r_[order[high], order[low:high]]
+            else:
+                order[low:high + 1] = np.r_[order[low + 1:high + 1], order[low]]
+    return order
+
+
+def consensus_order(method, preferences, borda_order):
+    """Indexes into the preference matrix, best first, for a pairwise method; ties keep the Borda order."""
+    tiebreak = np.empty(len(borda_order), dtype=np.int64)
+    tiebreak[borda_order] = np.arange(len(borda_order))
+
+    if method == COPELAND:
+        return np.lexsort((tiebreak, -copeland_scores(preferences)))
+    if method == SCHULZE:
+        return np.lexsort((tiebreak, -schulze_scores(preferences)))
+    if method == KEMENY:
+        return kemeny_order(preferences, np.lexsort((tiebreak, -copeland_scores(preferences))))
+    raise ValueError(f"Unknown pairwise consensus method '{method}'")
@@ -0,0 +1,220 @@
+"""
+Vectorized aggregation of manager rankings.
+
+Every page that scores rankings (the three analyze pages, the run-draft
+daughter modal, set-draft-order and the priority score export) goes through
+aggregate(kind), cached per version by players/ranking_cache.py.  It reads the
+running per-player tallies (players/ranking_tallies.py) with one query into
+NumPy arrays aligned by player, so the cost grows with the number of ranked
+players, not with the number of submissions:
+
+- num_rankings:      number of submissions that rank the player
+- average_rank:      mean rank across those submissions
+- borda_count:       sum of (max_rank - rank + 1), max_rank being the largest
+                     rank in any submission of the kind (the analyze pages)
+- submission_borda:  sum of (submission size - rank + 1), so each submission's
+                     first player gets as many points as it ranks players
+                     (the draft order)
+- median_rounds():   median of the draft rounds managers suggested, from the
+                     per-player round histograms
+
+top() orders players by Borda count, or by one of the pairwise consensus
+methods in players/ranking_consensus.py, whose preference matrix is built from
+the entries the first time one of them is asked for, and can carry bootstrap
+bands of each player's position (players/ranking_stability.py).  Player rows
+are fetched with a single in_bulk, and only for the players shown.
+"""
+import threading
+
+import numpy as np
+from django.conf import settings
+
+from . import ranking_consensus, ranking_stability
+from .models import Player, RankingEntry, RankingTally
+
+
+def aggregate(kind):
+    """RankingAggregate over every submission of one kind (see players/rankings.py for the kinds)."""
+    rows = RankingTally.objects.filter(kind=kind).order_by('player_id').values_list(
+        'player_id', 'num_rankings', 'rank_sum', 'submission_borda', 'rank_counts', 'round_counts'
+    )
+    return RankingAggregate(list(rows), kind)
+
+
+class RankingAggregate:
+    """Per-player statistics for one kind of ranking; arrays are aligned with player_ids (ascending)."""
+
+    def __init__(self, tallies, kind=None):
+        self.kind = kind
+        num_players = len(tallies)
+        self.player_ids = np.array([tally[0] for tally in tallies], dtype=np.int64)
+        self.num_rankings = np.array([tally[1] for tally in tallies], dtype=np.int64)
+        rank_sums = np.array([tally[2] for tally in tallies], dtype=np.int64)
+        self.submission_borda = np.array([tally[3] for tally in tallies], dtype=np.int64)
+
+        self.average_rank = rank_sums / np.maximum(self.num_rankings, 1)
+
+        max_rank = max((int(rank) for tally in tallies for rank in tally[4]), default=0)
+        self.borda_count = self.num_rankings * (max_rank + 1) - rank_sums
+
+        # Round histograms as a players x rounds matrix; column 0 counts entries without a round
+        max_round = max((int(round_num) for tally in tallies for round_num in tally[5]), default=0)
+        self.round_counts = np.zeros((num_players, max_round + 1), dtype=np.int64)
+        for i, tally in enumerate(tallies):
+            for round_num, count in tally[5].items():
+                self.round_counts[i, int(round_num)] = count
+
+        # Aggregates are shared between requests by players/ranking_cache.py
+        self._median_rounds = {}
+        self._orders = {}
+        self._submission_ranks = None
+        self._preferences = None
+        self._position_bands = None
+        self._position_bands_lock = threading.Lock()
+
+    def median_rounds(self, missing=None):
+        """
+        Median suggested draft round per player (NaN where there is none).
+        Entries without a round are skipped, or count as round `missing` if given.
+        """
+        medians = self._median_rounds.get(missing)
+        if medians is None:
+            medians = self._median_rounds[missing] = self._compute_median_rounds(missing)
+        return medians
+
+    def _compute_median_rounds(self, missing):
+        num_players, num_rounds = self.round_counts.shape
+        counts_by_round = np.zeros((num_players, max(num_rounds, (missing or 0) + 1)), dtype=np.int64)
+        counts_by_round[:, :num_rounds] = self.round_counts
+        if missing is not None:
+            counts_by_round[:, missing] += counts_by_round[:, 0]
+        counts_by_round[:, 0] = 0
+
+        # The median is the mean of the middle two order statistics, found in
+        # the running totals of each player's histogram
+        counts = counts_by_round.sum(axis=1)
+        running = counts_by_round.cumsum(axis=1)
+        low = np.argmax(running > ((counts - 1) // 2)[:, None], axis=1)
+        high = np.argmax(running > (counts // 2)[:, None], axis=1)
+
+        medians = (low + high) / 2
+        medians[counts == 0] = np.nan
+        return medians
+
+    def submission_ranks(self):
+        """submissions x players matrix of the rank each submission gives each player (0 if unlisted)."""
+        if self._submission_ranks is None:
+            entries = RankingEntry.objects.filter(kind=self.kind).values_list('submission_id', 'player_id', 'rank')
+            entries = np.array(list(entries), dtype=np.int64).reshape(-1, 3)
+
+            # Entries written after the tallies were read may rank players without a column
+            columns = np.searchsorted(self.player_ids, entries[:, 1])
+            known = columns < len(self.player_ids)
+            known[known] = self.player_ids[columns[known]] == entries[known, 1]
+
+            _, rows = np.unique(entries[:, 0], return_inverse=True)
+            ranks = np.zeros((rows.max() + 1 if len(rows) else 0, len(self.player_ids)), dtype=np.int32)
+            ranks[rows[known], columns[known]] = entries[known, 2]
+            self._submission_ranks = ranks
+        return self._submission_ranks
+
+    def preferences(self):
+        """Pairwise preference matrix over every submission, aligned with player_ids both ways."""
+        if self._preferences is None:
+            self._preferences = ranking_consensus.preference_matrix(self.submission_ranks())
+        return self._preferences
+
+    def position_bands(self):
+        """
+        (low, high) arrays: the bootstrap band of each player's position in the
+        Borda order (see players/ranking_stability.py).  Computed once, by a
+        single thread, per aggregate.
+        """
+        with self._position_bands_lock:
+            if self._position_bands is None:
+                ranks = self.submission_ranks()
+                self._position_bands = ranking_stability.position_bands(
+                    (ranks > 0).astype(np.float64),
+                    ranks.astype(np.float64),
+                    self.player_ids,
+                    resamples=getattr(settings, 'RANKING_BOOTSTRAP_RESAMPLES', ranking_stability.DEFAULT_RESAMPLES),
+                    workers=getattr(settings, 'RANKING_BOOTSTRAP_WORKERS', 1),
+                )
+        return self._position_bands
+
+    def order(self, method=ranking_consensus.BORDA):
+        """
+        Indexes into the per-player arrays, best player first: highest Borda
+        count, then lowest average rank, or a pairwise consensus method's order.
+        """
+        order = self._orders.get(method)
+        if order is None:
+            order = np.lexsort((self.player_ids, self.average_rank, -self.borda_count))
+            if method != ranking_consensus.BORDA:
+                order = ranking_consensus.consensus_order(method, self.preferences(), order)
+            self._orders[method] = order
+        return order
+
+    def by_player(self, values):
+        """{player_id: value} for one of the per-player arrays, as plain Python numbers."""
+        return dict(zip(self.player_ids.tolist(), values.tolist()))
+
+    def compact_rows(self, limit=None, with_rounds=False, method=ranking_consensus.BORDA):
+        """
+        [player_id, borda_count, average_rank, num_rankings, suggested_round]
+        per ranked player best first (see order()), for the JSON APIs: no
+        player rows are read and suggested_round is None unless with_rounds.
+        """
+        order = self.order(method)
+        if limit is not None:
+            order = order[:limit]
+
+        if with_rounds:
+            medians = self.median_rounds()[order]
+            suggested_rounds = [None if np.isnan(median) else int(np.round(median)) for median in medians.tolist()]
+        else:
+            suggested_rounds = [None] * len(order)
+
+        return [list(row) for row in zip(
+            self.player_ids[order].tolist(),
+            self.borda_count[order].tolist(),
+            np.round(self.average_rank[order], 2).tolist(),
+            self.num_rankings[order].tolist(),
+            suggested_rounds,
+        )]
+
+    def top(self, limit=None, with_rounds=False, method=ranking_consensus.BORDA, with_bands=False):
+        """
+        Ranked players best first (see order()) as [{'player', 'average_rank',
+        'borda_count', 'num_rankings'}], plus 'suggested_round' (rounded median
+        round, or None) with_rounds and 'position_low'/'position_high' (the
+        bootstrap band of the Borda position) with_bands.
+        """
+        order = self.order(method)
+        if limit is not None:
+            order = order[:limit]
+
+        players = Player.objects.in_bulk(self.player_ids[order].tolist())
+        if with_rounds:
+            medians = self.median_rounds()
+        if with_bands:
+            low, high = self.position_bands()
+
+        top_players = []
+        for i in order.tolist():
+            player = players.get(int(self.player_ids[i]))
+            if player is None:  # Deleted since the entries were read
+                continue
+            stats = {
+                'player': player,
+                'average_rank': float(self.average_rank[i]),
+                'borda_count': int(self.borda_count[i]),
+                'num_rankings': int(self.num_rankings[i]),
+            }
+            if with_rounds:
+                stats['suggested_round'] = None if np.isnan(medians[i]) else int(np.round(medians[i]))
+            if with_bands:
+                stats['position_low'] = int(low[i])
+                stats['position_high'] = int(high[i])
+            top_players.append(stats)
+        return top_players
@@ -0,0 +1,97 @@
+"""
+Bootstrap confidence bands for consensus positions.
+
+Whether #14 vs #16 on the analyze page means anything depends on how much the
+order moves if a slightly different set of managers had submitted.  The
+bootstrap answers that by drawing the submissions with replacement many times,
+re-scoring every resample and recording where each player lands:
+
+- a resample is a row of weights (how often each submission was drawn), so
+  the Borda counts and average ranks of a whole chunk of resamples are two
+  matrix products with the per-submission rank matrices, with no Python loop
+  per resample
+- each resample is ordered like RankingAggregate.order() (Borda count, then
+  average rank, then player id) and the positions are counted into a
+  players x positions histogram, which chunks simply add up
+- the band is the range of positions covering the middle CONFIDENCE of the
+  resamples
+
+Large pools spread the chunks over a process pool (RANKING_BOOTSTRAP_WORKERS).
+Only Borda orders are resampled: a pairwise method would need a full
+preference matrix per resample.  RankingAggregate.position_bands() caches the
+result with the aggregate, so it is computed once per ranking version.
+
+This module only does NumPy work so it can run in worker processes.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DEFAULT_RESAMPLES = 2000
+
+# Share of resamples inside the band (the 5th to 95th percentile positions)
+CONFIDENCE = 0.9
+
+# Resamples scored per matrix product
+CHUNK_RESAMPLES = 250
+
+# Resamples x players below which a process pool costs more than it saves
+PARALLEL_MIN_CELLS = 2_000_000
+
+
+def position_bands(listed, rank_sums, player_ids, resamples=DEFAULT_RESAMPLES, workers=1, seed=0):
+    """
+    (low, high) 1-based consensus positions per player for the bootstrap band.
+    listed and rank_sums are submissions x players matrices: whether each
+    submission ranks the player, and the rank it gives them (0 if unlisted).
+    """
+    num_players = len(player_ids)
+    if num_players == 0 or len(listed) == 0:
+        return np.zeros(num_players, dtype=np.int64), np.zeros(num_players, dtype=np.int64)
+
+    chunk_sizes = [min(CHUNK_RESAMPLES, resamples - start) for start in range(0, resamples, CHUNK_RESAMPLES)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    jobs = [(listed, rank_sums, player_ids, size, chunk_seed) for size, chunk_seed in zip(chunk_sizes, seeds)]
+
+    if workers > 1 and len(jobs) > 1 and resamples * num_players >= PARALLEL_MIN_CELLS:
+        # Spawned rather than forked: the web process runs threads
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=context) as executor:
+            counts = sum(executor.map(_position_counts, *zip(*jobs)))
+    else:
+        counts = sum(_position_counts(*job) for job in jobs)
+
+    # Positions at the lower and upper tail of each player's histogram
+    tail = resamples * (1 - CONFIDENCE) / 2
+    running = counts.cumsum(axis=1)
+    low = np.argmax(running > tail, axis=1) + 1
+    high = np.argmax(running >= resamples - tail, axis=1) + 1
+    return low, high
+
+
+def _position_counts(listed, rank_sums, player_ids, resamples, seed):
+    """players x positions histogram of where each player lands in `resamples` bootstrap resamples."""
+    num_submissions, num_players = listed.shape
+    rng = np.random.default_rng(seed)
+
+    # How often each submission is drawn, one resample per row
+    weights = rng.multinomial(num_submissions, np.full(num_submissions, 1 / num_submissions), size=resamples)
+    weights = weights.astype(np.float64)
+
+    num_rankings = weights @ listed
+    resampled_rank_sums = weights @ rank_sums
+
+    # Borda counts against the largest rank among the drawn submissions
+    submission_max_rank = rank_sums.max(axis=1)
+    max_rank = np.where(weights > 0, submission_max_rank, 0).max(axis=1)
+    borda_count = num_rankings * (max_rank + 1)[:, None] - resampled_rank_sums
+    average_rank = resampled_rank_sums / np.maximum(num_rankings, 1)
+
+    # lexsort's last key is the primary one, as in RankingAggregate.order()
+    tiebreak = np.broadcast_to(player_ids, borda_count.shape)
+    order = np.lexsort((tiebreak, average_rank, -borda_count), axis=-1)
+
+    # order[r, position] is the player at that position in resample r
+    cells = order * num_players + np.arange(num_players)
+    return np.bincount(cells.ravel(), minlength=num_players * num_players).reshape(num_players, num_players)
@@ -0,0 +1,150 @@
+"""
+Running per-player totals of ranking entries.
+
+Saving one manager's ranking only changes the league-wide aggregate by that
+submission's contribution, so the ranking_tallies table keeps, per kind and
+player, everything the ranking engine needs:
+
+- num_rankings and rank_sum
+- submission_borda: sum of (submission size - rank + 1)
+- rank_counts and round_counts: histograms for the largest rank and the
+  median suggested round ("0" counts entries without a round)
+
+rankings.sync_entries() and rankings.delete_entries() call apply() with a
+submission's entries before and after the write, in the same transaction: the
+old contribution is subtracted and the new one added, so the tallies always
+match the entries and the analysis pages read one row per ranked player
+without touching the other submissions.  `manage.py rebuild_ranking_tallies`
+recomputes them from scratch.
+"""
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+
+from .models import RankingEntry, RankingTally
+
+BATCH_SIZE = 500
+
+TALLY_FIELDS = ['num_rankings', 'rank_sum', 'submission_borda', 'rank_counts', 'round_counts']
+
+
+class _Delta:
+    """Change to one player's tally."""
+
+    def __init__(self):
+        self.num_rankings = 0
+        self.rank_sum = 0
+        self.submission_borda = 0
+        self.rank_counts = Counter()
+        self.round_counts = Counter()
+
+    def add(self, sign, rank, round_num, submission_size):
+        self.num_rankings += sign
+        self.rank_sum += sign * rank
+        self.submission_borda += sign * (submission_size - rank + 1)
+        self.rank_counts[str(rank)] += sign
+        self.round_counts[str(round_num or 0)] += sign
+
+    def is_empty(self):
+        return not (
+            self.num_rankings or self.rank_sum or self.submission_borda
+            or any(self.rank_counts.values()) or any(self.round_counts.values())
+        )
+
+
+def _merge_counts(counts, delta):
+    merged = Counter(counts)
+    merged.update(delta)
+    return {key: count for key, count in merged.items() if count > 0}
+
+
+def _new_tally(kind, player_id, delta):
+    return RankingTally(
+        kind=kind,
+        player_id=player_id,
+        num_rankings=delta.num_rankings,
+        rank_sum=delta.rank_sum,
+        submission_borda=delta.submission_borda,
+        rank_counts=_merge_counts({}, delta.rank_counts),
+        round_counts=_merge_counts({}, delta.round_counts),
+    )
+
+
+def entry_rows(kind, submission_ids):
+    """(submission_id, player_id, rank, round) of the stored entries of these submissions."""
+    return list(RankingEntry.objects.filter(kind=kind, submission_id__in=submission_ids).values_list(
+        'submission_id', 'player_id', 'rank', 'suggested_round'
+    ))
+
+
+def apply(kind, removed, added):
+    """
+    Subtract the contribution of the `removed` entries and add that of the
+    `added` ones, both lists of (submission_id, player_id, rank, round) that
+    each hold whole submissions (their sizes are counted from the lists).
+    """
+    deltas = {}
+    for sign, entries in ((-1, removed), (1, added)):
+        submission_sizes = Counter(submission_id for submission_id, _, _, _ in entries)
+        for submission_id, player_id, rank, round_num in entries:
+            if player_id not in deltas:
+                deltas[player_id] = _Delta()
+            deltas[player_id].add(sign, rank, round_num, submission_sizes[submission_id])
+
+    # Re-saving an unchanged ranking leaves nothing to write
+    player_ids = [player_id for player_id, delta in deltas.items() if not delta.is_empty()]
+    if not player_ids:
+        return
+
+    with transaction.atomic():
+        for start in range(0, len(player_ids), BATCH_SIZE):
+            _apply_batch(kind, player_ids[start:start + BATCH_SIZE], deltas)
+
+
+def _apply_batch(kind, player_ids, deltas):
+    # Lock the tallies so concurrent submissions can't lose each other's updates
+    tallies = RankingTally.objects.select_for_update()
+    locked = {tally.player_id: tally for tally in tallies.filter(kind=kind, player_id__in=player_ids)}
+
+    # Players ranked for the first time get their tally created with the values
+    # filled in, unless a concurrent submission created one of them first
+    missing = [player_id for player_id in player_ids if player_id not in locked]
+    if missing:
+        try:
+            with transaction.atomic():
+                RankingTally.objects.bulk_create([
+                    _new_tally(kind, player_id, deltas[player_id])
+                    for player_id in missing if deltas[player_id].num_rankings > 0
+                ], batch_size=BATCH_SIZE)
+        except IntegrityError:
+            RankingTally.objects.bulk_create(
+                [RankingTally(kind=kind, player_id=player_id) for player_id in missing], ignore_conflicts=True
+            )
+            locked.update({tally.player_id: tally for tally in tallies.filter(kind=kind, player_id__in=missing)})
+
+    changed = []
+    emptied = []
+    for player_id, tally in locked.items():
+        delta = deltas[player_id]
+        tally.num_rankings += delta.num_rankings
+        tally.rank_sum += delta.rank_sum
+        tally.submission_borda += delta.submission_borda
+        tally.rank_counts = _merge_counts(tally.rank_counts, delta.rank_counts)
+        tally.round_counts = _merge_counts(tally.round_counts, delta.round_counts)
+        if tally.num_rankings > 0:
+            changed.append(tally)
+        else:
+            emptied.append(tally.id)
+
+    RankingTally.objects.bulk_update(changed, TALLY_FIELDS, batch_size=BATCH_SIZE)
+    if emptied:
+        RankingTally.objects.filter(id__in=emptied).delete()
+
+
+def rebuild(kind):
+    """Recompute every tally of one kind from the stored entries."""
+    with transaction.atomic():
+        RankingTally.objects.filter(kind=kind).delete()
+        apply(kind, [], list(RankingEntry.objects.filter(kind=kind).values_list(
+            'submission_id', 'player_id', 'rank', 'suggested_round'
+        )))
@@ -0,0 +1,197 @@
+"""
+Normalized ranking entries.
+
+Managers submit three kinds of rankings (all players, managers' daughters and
+siblings who stay together).  Each submission is still stored as JSON in the
+`ranking` column of its PlayerRanking / ManagerDaughterRanking / SiblingRanking
+row (players/ranking_codec.py reads and writes it), but every ranked player is
+also a row of the indexed ranking_entries table, so pages read one manager's
+ranking or load every submission with a single query instead of parsing all of
+the JSON in Python.  Writes also keep
+the per-player running totals in players/ranking_tallies.py up to date, which
+is what players/ranking_engine.py aggregates.
+
+Entries are rewritten in bulk whenever a submission is saved and deleted with
+it (post_save/post_delete receivers in players/signals.py), so every writer
+(views, admin, management commands) keeps them in sync.  bulk_create() sends no
+signals: code that bulk-creates submissions must call sync_entries() itself
+(see players/league_generator.py).  A deleted player's entries are deleted with
+her, which shrinks every submission she was in without saving it, so the
+tallies of her kinds are rebuilt once the delete commits.
+"""
+import threading
+
+from django.db import connection, transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from . import ranking_codec, ranking_tallies
+from .models import Manager, Player, PlayerRanking, ManagerDaughterRanking, SiblingRanking, RankingEntry
+
+KIND_PLAYER = RankingEntry.KIND_PLAYER
+KIND_DAUGHTER = RankingEntry.KIND_DAUGHTER
+KIND_SIBLING = RankingEntry.KIND_SIBLING
+
+SUBMISSION_MODELS = {
+    KIND_PLAYER: PlayerRanking,
+    KIND_DAUGHTER: ManagerDaughterRanking,
+    KIND_SIBLING: SiblingRanking,
+}
+
+BULK_BATCH_SIZE = 500
+
+# Kinds whose tallies this thread's player deletes left stale
+_stale_tallies = threading.local()
+
+
+def kind_for_model(model):
+    """The entry kind stored for a submission model, or None for other models."""
+    for kind, submission_model in SUBMISSION_MODELS.items():
+        if submission_model is model:
+            return kind
+    return None
+
+
+def build_entries(submissions, player_ids=None):
+    """
+    (submission_id, manager_id, player_id, rank, round) for every entry of
+    these submissions.  Players that no longer exist are skipped; pass
+    player_ids (every existing player id) to avoid looking them up.
+    """
+    parsed = [(submission, ranking_codec.decode(submission.ranking)) for submission in submissions]
+
+    if player_ids is None:
+        ranked_ids = {player_id for _, items in parsed for player_id, _, _ in items}
+        player_ids = set(Player.objects.filter(id__in=ranked_ids).values_list('id', flat=True))
+
+    return [
+        (submission.id, submission.manager_id, player_id, rank, round_num)
+        for submission, items in parsed
+        for player_id, rank, round_num in items
+        if player_id in player_ids
+    ]
+
+
+def _insert_entries(kind, entries):
+    """
+    Insert entries from build_entries() with multi-row INSERTs.  bulk_create()
+    prepares every value through the ORM, which dominates when a whole
+    league's rankings are written at once (players/league_generator.py).
+    """
+    columns = ['kind', 'submission_id', 'manager_id', 'player_id', 'rank', 'suggested_round']
+    max_rows = (connection.features.max_query_params or BULK_BATCH_SIZE * len(columns)) // len(columns)
+    batch_size = min(BULK_BATCH_SIZE, max_rows)
+
+    quote = connection.ops.quote_name
+    insert = f"INSERT INTO {quote(RankingEntry._meta.db_table)} ({', '.join(quote(column) for column in columns)}) VALUES "
+    placeholders = f"({', '.join(['%s'] * len(columns))})"
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(entries), batch_size):
+            batch = entries[start:start + batch_size]
+            cursor.execute(
+                insert + ', '.join([placeholders] * len(batch)),
+                [value for entry in batch for value in (kind, *entry)],
+            )
+
+
+def sync_entries(kind, submissions, player_ids=None):
+    """Replace the entries of these submissions with ones built from their current JSON, updating the tallies."""
+    submissions = list(submissions)
+    submission_ids = [submission.id for submission in submissions]
+    with transaction.atomic():
+        old_entries = ranking_tallies.entry_rows(kind, submission_ids)
+        entries = build_entries(submissions, player_ids)
+
+        RankingEntry.objects.filter(kind=kind, submission_id__in=submission_ids).delete()
+        _insert_entries(kind, entries)
+
+        ranking_tallies.apply(kind, old_entries, [
+            (submission_id, player_id, rank, round_num) for submission_id, _, player_id, rank, round_num in entries
+        ])
+
+
+def delete_entries(kind, submission_ids):
+    """Delete the entries of these submissions and take them out of the tallies."""
+    with transaction.atomic():
+        old_entries = ranking_tallies.entry_rows(kind, submission_ids)
+        RankingEntry.objects.filter(kind=kind, submission_id__in=submission_ids).delete()
+        ranking_tallies.apply(kind, old_entries, [])
+
+
+def player_deleting(player_id):
+    """
+    Before a player is deleted: mark the kinds she is ranked in as having stale
+    tallies.  Returns whether there were any, i.e. whether
+    rebuild_stale_tallies() must run once the delete commits.
+    """
+    kinds = set(RankingEntry.objects.filter(player_id=player_id).values_list('kind', flat=True).distinct())
+    if not hasattr(_stale_tallies, 'kinds'):
+        _stale_tallies.kinds = set()
+    _stale_tallies.kinds |= kinds
+    return bool(kinds)
+
+
+def rebuild_stale_tallies():
+    """
+    Rebuild the tallies of the kinds marked by player_deleting() from the
+    entries left; returns those kinds.  A whole batch of deletes rebuilds each
+    kind once.
+    """
+    kinds = getattr(_stale_tallies, 'kinds', set())
+    _stale_tallies.kinds = set()
+    for kind in sorted(kinds):
+        ranking_tallies.rebuild(kind)
+    return kinds
+
+
+# Players that can be ranked
+
+def ranking_pool(kind):
+    """
+    Players a manager can rank in one kind of ranking: every player, the
+    managers' daughters, or players with siblings who don't ask to be
+    separated from them.
+    """
+    if kind == KIND_DAUGHTER:
+        return Player.objects.filter(id__in=Manager.objects.filter(daughter__isnull=False).values('daughter_id'))
+    if kind == KIND_SIBLING:
+        return Player.objects.filter(requests_separate_team_from_sibling=False).exclude(siblings__isnull=True)
+    return Player.objects.all()
+
+
+# Reading one manager's ranking
+
+def manager_entries(kind, manager):
+    """A manager's ranking as [{'player_id', 'rank'(, 'round')}] in rank order, the format the ranking pages load."""
+    if manager is None:
+        return []
+
+    entries = []
+    rows = RankingEntry.objects.filter(kind=kind, manager=manager).order_by('rank').values_list(
+        'player_id', 'rank', 'suggested_round'
+    )
+    for player_id, rank, round_num in rows:
+        entry = {'player_id': player_id, 'rank': rank}
+        if round_num is not None:
+            entry['round'] = round_num
+        entries.append(entry)
+    return entries
+
+
+def manager_ranking_length(kind, manager):
+    """Number of players in a manager's ranking (0 if they haven't submitted one)."""
+    if manager is None:
+        return 0
+    return RankingEntry.objects.filter(kind=kind, manager=manager).count()
+
+
+def submission_lengths(kind):
+    """Number of ranked players in each submission of one kind, in submission order."""
+    entry_counts = RankingEntry.objects.filter(
+        kind=kind, submission_id=OuterRef('id')
+    ).values('submission_id').annotate(length=Count('id')).values('length')
+
+    return list(SUBMISSION_MODELS[kind].objects.annotate(
+        length=Coalesce(Subquery(entry_counts, output_field=IntegerField()), Value(0))
+    ).order_by('id').values_list('length', flat=True))
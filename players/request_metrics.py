@@ -0,0 +1,229 @@
+"""
+In-memory per-view request metrics.
+
+RequestMetricsMiddleware records, for every request, the wall time, the
+number of database queries and the time spent in them, keyed by the
+resolved URL name (e.g. players:run_draft).  Values are aggregated into
+fixed-bucket histograms, served in Prometheus text format at /metrics and
+summarized on the metrics dashboard.
+
+Queries are counted by a database execute wrapper installed on every new
+connection (see players/signals.py).  It adds to the collector stored in a
+context variable, so queries run by sync views under ASGI (in a
+sync_to_async thread) are still attributed to the request.
+
+Metrics are per process; the Procfile runs a single Daphne worker.  With
+more workers, Prometheus should scrape each one.
+"""
+import bisect
+import contextvars
+import threading
+import time
+
+# Histogram bucket upper bounds (Prometheus "le" labels)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+METRIC_PREFIX = 'wusa'
+
+# Label for requests that didn't resolve to a URL pattern (404s)
+UNRESOLVED_VIEW = '<unresolved>'
+
+_current_request = contextvars.ContextVar('request_metrics_collector', default=None)
+
+
+class QueryCollector:
+    """Query count and time for one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+
+def record_query(execute, sql, params, many, context):
+    """Database execute wrapper: time the query against the current request, if any."""
+    collector = _current_request.get()
+    if collector is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        collector.duration += time.perf_counter() - start
+        collector.count += 1
+
+
+def install_query_recorder(connection):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def start_request():
+    """Begin collecting queries for the current request; returns the token for finish_request()."""
+    return _current_request.set(QueryCollector())
+
+
+def finish_request(token):
+    collector = _current_request.get()
+    _current_request.reset(token)
+    return collector
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def cumulative(self):
+        """(upper bound, cumulative count) pairs, ending with +Inf."""
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            yield bound, total
+
+    def quantile(self, q):
+        """Estimate quantile q as the upper bound of the bucket it falls in (capped at the max seen)."""
+        count = self.count
+        if not count:
+            return 0.0
+        rank = q * count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class ViewMetrics:
+    def __init__(self):
+        self.duration = Histogram(DURATION_BUCKETS)
+        self.queries = Histogram(QUERY_COUNT_BUCKETS)
+        self.db_duration = Histogram(DURATION_BUCKETS)
+        self.statuses = {}  # status code -> count
+
+    def observe(self, duration, query_count, db_duration, status):
+        self.duration.observe(duration)
+        self.queries.observe(query_count)
+        self.db_duration.observe(db_duration)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+
+class RequestMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}  # (view name, method) -> ViewMetrics
+        self.started_at = time.time()
+
+    def observe(self, view, method, duration, query_count, db_duration, status):
+        key = (view or UNRESOLVED_VIEW, method)
+        with self._lock:
+            metrics = self._views.get(key)
+            if metrics is None:
+                metrics = self._views[key] = ViewMetrics()
+            metrics.observe(duration, query_count, db_duration, status)
+
+    def reset(self):
+        with self._lock:
+            self._views = {}
+            self.started_at = time.time()
+
+    def top_views(self, order_by='total_time', limit=25):
+        """
+        Summaries of each (view, method), worst first.
+
+        order_by is one of the summary keys, e.g. total_time, p95, avg_queries,
+        max_queries or total_db_time.
+        """
+        with self._lock:
+            items = list(self._views.items())
+
+        rows = []
+        for (view, method), metrics in items:
+            count = metrics.duration.count
+            rows.append({
+                'view': view,
+                'method': method,
+                'count': count,
+                'total_time': metrics.duration.sum,
+                'avg_time': metrics.duration.sum / count,
+                'p50': metrics.duration.quantile(0.5),
+                'p95': metrics.duration.quantile(0.95),
+                'max_time': metrics.duration.max,
+                'avg_queries': metrics.queries.sum / count,
+                'max_queries': int(metrics.queries.max),
+                'total_db_time': metrics.db_duration.sum,
+                'avg_db_time': metrics.db_duration.sum / count,
+                'errors': sum(n for status, n in metrics.statuses.items() if status >= 500),
+            })
+
+        rows.sort(key=lambda row: row[order_by], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def render_prometheus(self):
+        """Render every metric in the Prometheus text exposition format."""
+        # Copy everything under the lock so rendering doesn't hold it
+        with self._lock:
+            snapshot = [
+                (view, method, {
+                    'view_duration_seconds': (list(metrics.duration.cumulative()), metrics.duration.sum),
+                    'view_db_queries': (list(metrics.queries.cumulative()), metrics.queries.sum),
+                    'view_db_duration_seconds': (list(metrics.db_duration.cumulative()), metrics.db_duration.sum),
+                }, dict(metrics.statuses))
+                for (view, method), metrics in sorted(self._views.items())
+            ]
+
+        lines = []
+
+        def histogram(name, help_text):
+            lines.append(f'# HELP {METRIC_PREFIX}_{name} {help_text}')
+            lines.append(f'# TYPE {METRIC_PREFIX}_{name} histogram')
+            for view, method, histograms, statuses in snapshot:
+                buckets, total = histograms[name]
+                labels = f'view="{_escape_label(view)}",method="{method}"'
+                for bound, cumulative in buckets:
+                    le = '+Inf' if bound == float('inf') else _format_number(bound)
+                    lines.append(f'{METRIC_PREFIX}_{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f'{METRIC_PREFIX}_{name}_sum{{{labels}}} {_format_number(total)}')
+                lines.append(f'{METRIC_PREFIX}_{name}_count{{{labels}}} {buckets[-1][1]}')
+
+        histogram('view_duration_seconds', 'Wall time spent handling requests, by view.')
+        histogram('view_db_queries', 'Database queries per request, by view.')
+        histogram('view_db_duration_seconds', 'Time spent in database queries per request, by view.')
+
+        lines.append(f'# HELP {METRIC_PREFIX}_view_responses_total Responses by view and status code.')
+        lines.append(f'# TYPE {METRIC_PREFIX}_view_responses_total counter')
+        for view, method, histograms, statuses in snapshot:
+            for status, count in sorted(statuses.items()):
+                lines.append(
+                    f'{METRIC_PREFIX}_view_responses_total'
+                    f'{{view="{_escape_label(view)}",method="{method}",status="{status}"}} {count}'
+                )
+
+        lines.append(f'# HELP {METRIC_PREFIX}_metrics_start_time_seconds When this process started collecting metrics.')
+        lines.append(f'# TYPE {METRIC_PREFIX}_metrics_start_time_seconds gauge')
+        lines.append(f'{METRIC_PREFIX}_metrics_start_time_seconds {_format_number(self.started_at)}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+request_metrics = RequestMetrics()
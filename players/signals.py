@@ -0,0 +1,131 @@
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from .models import (
+    GeneralSetting, DivisionValidationRegistry, ValidationCode, PlayerRanking, ManagerDaughterRanking, SiblingRanking,
+    Draft, DraftPick, Manager, Player, Team,
+)
+from . import cache_invalidation, draft_state, ranking_cache, rankings, request_metrics, validation_routes
+from .validation_engine import validation_engine
+from .general_settings import general_settings, CACHE_NAME as GENERAL_SETTINGS_CACHE
+
+
+@receiver(post_save, sender=GeneralSetting)
+@receiver(post_delete, sender=GeneralSetting)
+def invalidate_general_settings_cache(sender, **kwargs):
+    """Drop cached settings locally now, and on every worker once the write commits."""
+    general_settings.invalidate()
+    transaction.on_commit(general_settings.invalidate)
+    transaction.on_commit(lambda: cache_invalidation.broadcast_invalidation(GENERAL_SETTINGS_CACHE))
+
+
+@receiver(post_save, sender=DivisionValidationRegistry)
+@receiver(post_delete, sender=DivisionValidationRegistry)
+@receiver(post_save, sender=ValidationCode)
+@receiver(post_delete, sender=ValidationCode)
+def invalidate_validation_routes(sender, **kwargs):
+    """Rebuild the validation route table locally now, and on every worker once the write commits."""
+    validation_routes.invalidate()
+    transaction.on_commit(validation_routes.invalidate)
+    transaction.on_commit(lambda: cache_invalidation.broadcast_invalidation(validation_routes.CACHE_NAME))
+
+
+@receiver(post_save, sender=PlayerRanking)
+@receiver(post_save, sender=ManagerDaughterRanking)
+@receiver(post_save, sender=SiblingRanking)
+def sync_ranking_entries(sender, instance, raw=False, **kwargs):
+    """Rewrite a ranking submission's entries from its JSON, in the same transaction as the save."""
+    if not raw:
+        rankings.sync_entries(rankings.kind_for_model(sender), [instance])
+
+
+@receiver(post_delete, sender=PlayerRanking)
+@receiver(post_delete, sender=ManagerDaughterRanking)
+@receiver(post_delete, sender=SiblingRanking)
+def delete_ranking_entries(sender, instance, **kwargs):
+    """Drop a deleted ranking submission's entries."""
+    rankings.delete_entries(rankings.kind_for_model(sender), [instance.id])
+
+
+@receiver(post_save, sender=PlayerRanking)
+@receiver(post_delete, sender=PlayerRanking)
+@receiver(post_save, sender=ManagerDaughterRanking)
+@receiver(post_delete, sender=ManagerDaughterRanking)
+@receiver(post_save, sender=SiblingRanking)
+@receiver(post_delete, sender=SiblingRanking)
+def bump_ranking_aggregate_version(sender, **kwargs):
+    """Invalidate the kind's cached aggregate locally now, and on every worker once the write commits."""
+    kind = rankings.kind_for_model(sender)
+    ranking_cache.ranking_aggregates.bump(kind)
+    transaction.on_commit(lambda: ranking_cache.ranking_aggregates.bump(kind))
+    transaction.on_commit(lambda: cache_invalidation.broadcast_invalidation(ranking_cache.broadcast_name(kind)))
+
+
+@receiver(pre_delete, sender=Player)
+def rebuild_ranking_tallies_of_deleted_player(sender, instance, **kwargs):
+    """
+    A player's ranking entries are deleted with her, without a ranking signal:
+    rebuild the tallies of her kinds once the delete commits.
+    """
+    if rankings.player_deleting(instance.id):
+        transaction.on_commit(rebuild_stale_ranking_tallies)
+
+
+def rebuild_stale_ranking_tallies():
+    """Rebuild the tallies player deletes left stale, then invalidate those kinds' aggregates on every worker."""
+    for kind in rankings.rebuild_stale_tallies():
+        ranking_cache.ranking_aggregates.bump(kind)
+        cache_invalidation.broadcast_invalidation(ranking_cache.broadcast_name(kind))
+
+
+@receiver(post_save, sender=DraftPick)
+def apply_saved_draft_pick(sender, instance, **kwargs):
+    """Apply a pick to this worker's draft state once it commits, and have every other worker rebuild theirs."""
+    pick = (instance.id, instance.round, instance.pick, instance.player_id, instance.team_id)
+    transaction.on_commit(lambda: draft_state.draft_states.pick_saved(*pick))
+    transaction.on_commit(lambda: cache_invalidation.broadcast_invalidation(draft_state.CACHE_NAME, include_self=False))
+
+
+@receiver(post_delete, sender=DraftPick)
+def apply_deleted_draft_pick(sender, instance, **kwargs):
+    """Remove a pick from this worker's draft state once the delete commits, and have every other worker rebuild theirs."""
+    pick_id = instance.id
+    transaction.on_commit(lambda: draft_state.draft_states.pick_deleted(pick_id))
+    transaction.on_commit(lambda: cache_invalidation.broadcast_invalidation(draft_state.CACHE_NAME, include_self=False))
+
+
+@receiver(post_save, sender=Draft)
+@receiver(post_delete, sender=Draft)
+@receiver(post_save, sender=Player)
+@receiver(post_delete, sender=Player)
+@receiver(post_save, sender=Manager)
+@receiver(post_delete, sender=Manager)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def bump_draft_state_version(sender, **kwargs):
+    """Invalidate the draft state locally now, and on every worker once the write commits."""
+    draft_state.draft_states.bump()
+    transaction.on_commit(draft_state.draft_states.bump)
+    transaction.on_commit(lambda: cache_invalidation.broadcast_invalidation(draft_state.CACHE_NAME))
+
+
+@receiver(m2m_changed, sender=Player.siblings.through)
+def bump_draft_state_version_for_siblings(sender, action, **kwargs):
+    """Siblings decide a player's sibling requirement in the available-player pool."""
+    if action.startswith('post_'):
+        bump_draft_state_version(sender)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def mark_validations_dirty(sender, **kwargs):
+    """Mark validators that read the changed model dirty (no-op for other models)."""
+    validation_engine.model_changed(sender)
+
+
+@receiver(connection_created)
+def install_request_metrics_recorder(sender, connection, **kwargs):
+    """Count and time queries on every connection for the per-view request metrics."""
+    request_metrics.install_query_recorder(connection)
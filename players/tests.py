@@ -1,3 +1,428 @@
-from django.test import TestCase
+import importlib
+import json
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.apps import apps
+from django.db import IntegrityError
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from . import draft_clock, master_password, ranking_codec, ranking_consensus, rankings
+from .models import Draft, DraftEvent, DraftPick, Manager, ManagerDaughterRanking, Player, PlayerRanking, RankingEntry, RankingTally, Team
+from .ranking_cache import ranking_aggregates
+
+
+def make_player(n):
+    return Player.objects.create(first_name="Player", last_name=str(n), parent_phone_1='555-0100', parent_email_1='parent@example.com')
+
+
+def make_manager(n):
+    return Manager.objects.create(first_name="Manager", last_name=str(n), email='manager@example.com', phone='555-0200')
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class DraftPickConcurrencyTests(TestCase):
+    """Two boards (the admin board and a manager portal) writing the same draft"""
+
+    def setUp(self):
+        self.teams = [
+            Team.objects.create(name=f"Team {n}", manager_secret=f"secret-{n}")
+            for n in range(1, 4)
+        ]
+        self.players = [make_player(n) for n in range(1, 7)]
+        self.draft = Draft.objects.create(
+            rounds_draftable=2,
+            picks_per_round=len(self.teams),
+            order=','.join(str(team.id) for team in self.teams),
+        )
+        self.client.cookies[master_password.COOKIE_NAME] = master_password.issue_token()
+
+    def post(self, url, body):
+        return self.client.post(url, json.dumps(body), content_type='application/json')
+
+    def pick(self, round_num, pick_num, player, team, **extra):
+        return self.post('/draft/make-pick/', {
+            'round': round_num, 'pick': pick_num, 'player_id': player.id, 'team_name': team.name, **extra
+        })
+
+    def undraft(self, round_num, pick_num, team, **extra):
+        return self.post('/draft/undraft-pick/', {
+            'round': round_num, 'pick': pick_num, 'team_name': team.name, **extra
+        })
+
+    def latest_seq(self):
+        return DraftEvent.objects.order_by('-seq').values_list('seq', flat=True).first() or 0
+
+    def test_second_board_cannot_take_a_filled_slot(self):
+        self.assertEqual(self.pick(1, 1, self.players[0], self.teams[0]).status_code, 200)
+
+        response = self.pick(1, 1, self.players[1], self.teams[0])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['slot']['player_id'], self.players[0].id)
+        self.assertEqual(DraftPick.objects.get(round=1, pick=1).player, self.players[0])
+
+    def test_second_board_cannot_draft_a_player_twice(self):
+        self.assertEqual(self.pick(1, 1, self.players[0], self.teams[0]).status_code, 200)
+
+        response = self.pick(1, 2, self.players[0], self.teams[1])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['player_pick']['pick'], 1)
+        self.assertFalse(DraftPick.objects.filter(round=1, pick=2).exists())
+
+    def test_editing_a_pick_names_the_player_it_replaces(self):
+        self.pick(1, 1, self.players[0], self.teams[0])
+
+        response = self.pick(1, 1, self.players[1], self.teams[0], replace_player_id=self.players[0].id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(DraftPick.objects.get(round=1, pick=1).player, self.players[1])
+
+    def test_stale_expected_seq_is_a_conflict(self):
+        seen_seq = self.latest_seq()
+        self.pick(1, 1, self.players[0], self.teams[0], expected_seq=seen_seq)
+
+        # The other board still shows the draft before that pick
+        response = self.pick(1, 1, self.players[1], self.teams[0], expected_seq=seen_seq, replace_player_id=self.players[0].id)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['seq'], seen_seq + 1)
+        self.assertEqual(DraftPick.objects.get(round=1, pick=1).player, self.players[0])
+
+        # Picks elsewhere on the board are unaffected by the stale seq
+        self.assertEqual(self.pick(1, 2, self.players[2], self.teams[1], expected_seq=seen_seq).status_code, 200)
+
+    def test_pick_losing_the_race_to_the_database_is_a_conflict(self):
+        seen_seq = self.latest_seq()
+
+        # Another board's insert commits between this pick's checks and its
+        # write: the unique constraints refuse the write
+        with mock.patch.object(DraftPick.objects, 'update_or_create', side_effect=IntegrityError('UNIQUE constraint failed')):
+            response = self.pick(1, 1, self.players[0], self.teams[0], expected_seq=seen_seq)
+
+        self.assertEqual(response.status_code, 409)
+        body = response.json()
+        self.assertTrue(body['conflict'])
+        self.assertEqual(body['error'], 'That pick or player was just taken')
+        self.assertEqual(body['seq'], seen_seq)
+        self.assertIsNone(body['slot'])
+        self.assertFalse(DraftPick.objects.exists())
+        self.assertEqual(self.latest_seq(), seen_seq)
+
+    def test_undrafting_a_pick_already_gone_is_a_conflict(self):
+        self.pick(1, 1, self.players[0], self.teams[0])
+        self.assertEqual(self.undraft(1, 1, self.teams[0], expected_seq=self.latest_seq()).status_code, 200)
+
+        response = self.undraft(1, 1, self.teams[0], expected_seq=self.latest_seq())
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIsNone(response.json()['slot'])
+
+    def test_pick_based_on_the_board_before_a_reset_is_a_conflict(self):
+        self.pick(1, 1, self.players[0], self.teams[0])
+        seen_seq = self.latest_seq()
+
+        response = self.post('/draft/reset/', {})
+
+        self.assertEqual(response.json()['seq'], seen_seq + 1)
+        self.assertFalse(DraftPick.objects.exists())
+        self.assertEqual(self.pick(1, 2, self.players[1], self.teams[1], expected_seq=seen_seq).status_code, 409)
+
+    def test_reordering_the_draft_with_picks_present(self):
+        first, second, third = self.teams
+        self.pick(1, 1, self.players[0], first)
+        self.pick(1, 2, self.players[1], second)
+        self.pick(2, 2, self.players[2], second)
+        self.pick(2, 3, self.players[3], first)
+
+        # Swap the first two teams: their picks trade slots in both rounds
+        response = self.post('/draft/save-draft-order/', {'team_order': [str(second.id), str(first.id), str(third.id)]})
+
+        self.assertEqual(response.status_code, 200)
+        picks = {
+            player_id: (round_num, pick_num)
+            for player_id, round_num, pick_num in DraftPick.objects.values_list('player_id', 'round', 'pick')
+        }
+        self.assertEqual(picks, {
+            self.players[0].id: (1, 2),
+            self.players[1].id: (1, 1),
+            self.players[2].id: (2, 3),
+            self.players[3].id: (2, 2),
+        })
+        self.draft.refresh_from_db()
+        self.assertEqual(self.draft.order, f"{second.id},{first.id},{third.id}")
+
+    def test_pick_based_on_the_board_before_a_reorder_is_a_conflict(self):
+        first, second, third = self.teams
+        self.pick(1, 1, self.players[0], first)
+        seen_seq = self.latest_seq()
+
+        response = self.post('/draft/save-draft-order/', {'team_order': [str(second.id), str(first.id), str(third.id)]})
+        self.assertEqual(response.json()['seq'], seen_seq + 1)
+
+        # The other board still shows round 2, pick 2 as the second team's; it
+        # is empty, but now belongs to the first team
+        response = self.pick(2, 2, self.players[1], second, expected_seq=seen_seq)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(DraftPick.objects.filter(round=2, pick=2).exists())
+        self.assertEqual(DraftEvent.objects.get(seq=seen_seq + 1).payload['slots'], [[1, 2, first.id, self.players[0].id]])
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class DeletedPlayerRankingTests(TestCase):
+    """A deleted player's ranking entries go with her, and the tallies follow"""
+
+    def setUp(self):
+        self.players = [make_player(n) for n in range(1, 4)]
+        for n in range(1, 3):
+            PlayerRanking.objects.create(manager=make_manager(n), ranking=ranking_codec.encode([player.id for player in self.players]))
+
+    def tally(self, player):
+        return RankingTally.objects.get(kind=rankings.KIND_PLAYER, player=player)
+
+    def test_deleting_a_ranked_player_rebuilds_the_tallies(self):
+        first, second, third = self.players
+        self.assertEqual(self.tally(first).submission_borda, 2 * 3)
+        version = ranking_aggregates.version(rankings.KIND_PLAYER)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+
+        # Both submissions now hold two players, at their original ranks
+        self.assertFalse(RankingEntry.objects.filter(player_id=second.id).exists())
+        self.assertEqual(rankings.submission_lengths(rankings.KIND_PLAYER), [2, 2])
+        self.assertEqual(self.tally(first).num_rankings, 2)
+        self.assertEqual(self.tally(first).submission_borda, 2 * (2 - 1 + 1))
+        self.assertEqual(self.tally(third).submission_borda, 2 * (2 - 3 + 1))
+        self.assertGreater(ranking_aggregates.version(rankings.KIND_PLAYER), version)
+
+    def test_deleting_an_unranked_player_leaves_the_tallies(self):
+        unranked = make_player(4)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            unranked.delete()
+
+        self.assertEqual(self.tally(self.players[0]).submission_borda, 2 * 3)
+        self.assertNotIn('rebuild_stale_ranking_tallies', [getattr(callback, '__name__', None) for callback in callbacks])
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class RankingAnalysisApiTests(TestCase):
+    url = '/api/player-rankings/analysis/'
+
+    def setUp(self):
+        self.players = [make_player(n) for n in range(1, 4)]
+        for n in range(1, 3):
+            PlayerRanking.objects.create(manager=make_manager(n), ranking=ranking_codec.encode([player.id for player in self.players]))
+
+    def test_requires_the_master_password(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_deleting_a_ranked_player_changes_the_etag(self):
+        self.client.cookies[master_password.COOKIE_NAME] = master_password.issue_token()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.players[1].delete()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row[0] for row in response.json()['rows']], [self.players[0].id, self.players[2].id])
+
+
+class PickClockTaskTests(TestCase):
+    def setUp(self):
+        teams = [Team.objects.create(name=f"Team {n}", manager_secret=f"secret-{n}") for n in range(1, 3)]
+        Draft.objects.create(rounds_draftable=1, picks_per_round=len(teams), order=','.join(str(team.id) for team in teams))
+
+    def test_starting_the_clock_starts_the_clock_task(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            draft_clock.start(60)
+
+        self.assertIn(draft_clock.ensure_clock_task, callbacks)
+
+    def test_clock_task_starts_once_per_process(self):
+        with mock.patch.object(draft_clock, '_thread', None), mock.patch.object(draft_clock, 'threading') as threading:
+            draft_clock.ensure_clock_task()
+            draft_clock.ensure_clock_task()
+
+        threading.Thread.assert_called_once()
+        threading.Thread.return_value.start.assert_called_once_with()
+
+
+class RankingCodecTests(SimpleTestCase):
+    def test_packed_round_trip(self):
+        packed = ranking_codec.encode([12, 7, 30], [1, 2, None])
+
+        self.assertEqual(packed, '{"ids":[12,7,30],"rounds":[1,2,null]}')
+        self.assertEqual(ranking_codec.decode(packed), [(12, 1, 1), (7, 2, 2), (30, 3, None)])
+
+    def test_packed_without_rounds(self):
+        packed = ranking_codec.encode([12, 7])
+
+        self.assertEqual(packed, '{"ids":[12,7]}')
+        self.assertEqual(ranking_codec.decode(packed), [(12, 1, None), (7, 2, None)])
+
+    def test_packed_with_fewer_rounds_than_players(self):
+        self.assertEqual(ranking_codec.decode('{"ids":[12,7,30],"rounds":[3]}'), [(12, 1, 3), (7, 2, None), (30, 3, None)])
+
+    def test_legacy_rows(self):
+        legacy = json.dumps([
+            {'rank': 2, 'player_id': 7, 'round': '2'},
+            {'rank': 1, 'player_id': 12, 'round': 1},
+            {'rank': 3, 'player_id': '30'},
+        ])
+
+        # Legacy items keep their stored order and ranks; a missing round is None
+        self.assertEqual(ranking_codec.decode(legacy), [(7, 2, 2), (12, 1, 1), (30, 3, None)])
+
+    def test_legacy_items_encode_in_rank_order(self):
+        items = [{'rank': 2, 'player_id': 7, 'round': 2}, {'rank': 1, 'player_id': 12}]
+
+        self.assertEqual(ranking_codec.encode_items(items, with_rounds=True), '{"ids":[12,7],"rounds":[null,2]}')
+        self.assertEqual(ranking_codec.encode_items(items), '{"ids":[12,7]}')
+
+    def test_legacy_skips_incomplete_and_repeated_items(self):
+        legacy = json.dumps([
+            {'rank': 1, 'player_id': 12},
+            {'rank': 2},
+            {'player_id': 7},
+            {'rank': 3, 'player_id': 12},
+            'not an item',
+        ])
+
+        self.assertEqual(ranking_codec.decode(legacy), [(12, 1, None)])
+
+    def test_empty_rankings(self):
+        self.assertEqual(ranking_codec.encode([]), '{"ids":[]}')
+        self.assertEqual(ranking_codec.encode([], []), '{"ids":[],"rounds":[]}')
+        for ranking in ('{"ids":[]}', '[]', '{}', '', None, 'not json', '42'):
+            with self.subTest(ranking=ranking):
+                self.assertEqual(ranking_codec.decode(ranking), [])
+
+    def test_is_packed(self):
+        self.assertTrue(ranking_codec.is_packed(' {"ids":[1]}'))
+        self.assertFalse(ranking_codec.is_packed('[{"rank": 1, "player_id": 1}]'))
+        self.assertFalse(ranking_codec.is_packed(None))
+
+
+class PackRankingsMigrationTests(TestCase):
+    """Migration 0068 rewrites stored rankings without changing what decode() reads from them"""
+    migration = importlib.import_module('players.migrations.0068_pack_rankings')
+
+    def decoded(self, ranking):
+        # Legacy items decode in stored order, packed ones in rank order
+        return sorted(ranking_codec.decode(ranking), key=lambda item: item[1])
+
+    def test_pack_and_unpack_keep_the_decoded_items(self):
+        manager = make_manager(1)
+        rankings_by_row = {
+            PlayerRanking.objects.create(manager=manager, ranking=json.dumps([
+                {'rank': 2, 'player_id': 7}, {'rank': 1, 'player_id': 12},
+            ])).id: '{"ids":[12,7]}',
+            PlayerRanking.objects.create(manager=manager, ranking='[]').id: '{"ids":[]}',
+            # Ranks that aren't positions stay in the legacy format
+            PlayerRanking.objects.create(manager=manager, ranking=json.dumps([
+                {'rank': 1, 'player_id': 12}, {'rank': 3, 'player_id': 7},
+            ])).id: None,
+            PlayerRanking.objects.create(manager=manager, ranking='{"ids":[5,6]}').id: '{"ids":[5,6]}',
+        }
+        daughter_ranking = ManagerDaughterRanking.objects.create(manager=manager, ranking=json.dumps([
+            {'rank': 1, 'player_id': 12, 'round': 1}, {'rank': 2, 'player_id': 7},
+        ]))
+        decoded = {row.id: self.decoded(row.ranking) for row in PlayerRanking.objects.all()}
+        daughter_decoded = self.decoded(daughter_ranking.ranking)
+
+        self.migration.pack_rankings(apps, None)
+
+        for row in PlayerRanking.objects.all():
+            self.assertEqual(self.decoded(row.ranking), decoded[row.id])
+            if rankings_by_row[row.id]:
+                self.assertEqual(row.ranking, rankings_by_row[row.id])
+            else:
+                self.assertFalse(ranking_codec.is_packed(row.ranking))
+        daughter_ranking.refresh_from_db()
+        self.assertEqual(daughter_ranking.ranking, '{"ids":[12,7],"rounds":[1,null]}')
+        self.assertEqual(self.decoded(daughter_ranking.ranking), daughter_decoded)
+
+        self.migration.unpack_rankings(apps, None)
+
+        for row in PlayerRanking.objects.all():
+            self.assertFalse(ranking_codec.is_packed(row.ranking))
+            self.assertEqual(self.decoded(row.ranking), decoded[row.id])
+        daughter_ranking.refresh_from_db()
+        self.assertEqual(self.decoded(daughter_ranking.ranking), daughter_decoded)
+
+
+def submission_ranks(ballots, players):
+    """Submissions x players rank matrix from ballots written as strings of players, best first (0 = unlisted)."""
+    return np.array([
+        [ballot.index(player) + 1 if player in ballot else 0 for player in players]
+        for ballot in ballots
+    ])
+
+
+class RankingConsensusTests(SimpleTestCase):
+    """Small hand-checked examples of the pairwise consensus methods"""
+
+    def order(self, method, preferences, borda_order, players):
+        return ''.join(players[index] for index in ranking_consensus.consensus_order(method, preferences, np.array(borda_order)))
+
+    def test_preference_matrix_with_unlisted_players(self):
+        # AB lists neither C nor D, CA neither B nor D: a listed player beats
+        # every unlisted one, and two unlisted players tie
+        preferences = ranking_consensus.preference_matrix(submission_ranks(['AB', 'CA'], 'ABCD'))
+
+        np.testing.assert_array_equal(preferences, [
+            [0, 2, 1, 2],
+            [0, 0, 1, 1],
+            [1, 1, 0, 1],
+            [0, 0, 0, 0],
+        ])
+        # A beats B and D and ties C; B ties C and beats D; C ties A and B and beats D
+        np.testing.assert_array_equal(ranking_consensus.copeland_scores(preferences), [2.5, 1.5, 2, 0])
+        self.assertEqual(self.order(ranking_consensus.COPELAND, preferences, [0, 2, 1, 3], 'ABCD'), 'ACBD')
+
+    def test_preference_matrix_without_submissions(self):
+        preferences = ranking_consensus.preference_matrix(np.zeros((0, 3), dtype=np.int64))
+
+        np.testing.assert_array_equal(preferences, np.zeros((3, 3)))
+
+    def test_condorcet_cycle_falls_back_to_the_borda_order(self):
+        # A beats B, B beats C and C beats A, each 2 to 1
+        preferences = ranking_consensus.preference_matrix(submission_ranks(['ABC', 'BCA', 'CAB'], 'ABC'))
+
+        np.testing.assert_array_equal(ranking_consensus.copeland_scores(preferences), [1, 1, 1])
+        np.testing.assert_array_equal(ranking_consensus.schulze_scores(preferences), [0, 0, 0])
+        for method in (ranking_consensus.COPELAND, ranking_consensus.SCHULZE, ranking_consensus.KEMENY):
+            with self.subTest(method=method):
+                self.assertEqual(self.order(method, preferences, [1, 2, 0], 'ABC'), 'BCA')
+
+    def test_schulze_example(self):
+        # The 45-voter example of Schulze's paper: E > A > C > B > D
+        ballots = (
+            ['ACBED'] * 5 + ['ADECB'] * 5 + ['BEDAC'] * 8 + ['CABED'] * 3
+            + ['CAEBD'] * 7 + ['CBADE'] * 2 + ['DCEBA'] * 7 + ['EBADC'] * 8
+        )
+        preferences = ranking_consensus.preference_matrix(submission_ranks(ballots, 'ABCDE'))
+
+        self.assertEqual(preferences[0, 1], 20)  # A over B, by hand from the ballots
+        np.testing.assert_array_equal(ranking_consensus.schulze_scores(preferences), [3, 1, 2, 0, 4])
+        self.assertEqual(self.order(ranking_consensus.SCHULZE, preferences, [0, 1, 2, 3, 4], 'ABCDE'), 'EACBD')
+
+    def test_kemeny_finds_the_majority_order(self):
+        # Majorities are transitive (A > B > C > D), so the Kemeny order is
+        # theirs even when the search starts from the reverse
+        preferences = ranking_consensus.preference_matrix(submission_ranks(['ABCD', 'BACD', 'ABDC'], 'ABCD'))
+
+        order = ranking_consensus.kemeny_order(preferences, [3, 2, 1, 0])
+
+        self.assertEqual(''.join('ABCD'[index] for index in order), 'ABCD')
@@ -14,6 +14,9 @@ urlpatterns = [
     path('api/toggle-component-visibility/', views.toggle_component_visibility_api_view, name='toggle_component_visibility'),
     path('api/component-items/', views.get_component_items_api_view, name='get_component_items'),
     path('admin_dashboard/', views.admin_dashboard_view, name='admin_dashboard'),
+    path('metrics', views.metrics_view, name='metrics'),
+    path('metrics/dashboard/', views.metrics_dashboard_view, name='metrics_dashboard'),
+    path('metrics/reset/', views.reset_metrics_view, name='reset_metrics'),
     path('settings/', views.settings_view, name='settings'),
     path('settings/get-general-setting/', views.get_general_setting, name='get_general_setting'),
     path('settings/save-general-setting/', views.save_general_setting, name='save_general_setting'),
@@ -35,11 +38,14 @@ urlpatterns = [
     path('draft/available-players/', views.available_players_view, name='available_players'),
     path('draft/make-pick/', views.make_pick_view, name='make_pick'),
     path('draft/undraft-pick/', views.undraft_pick_view, name='undraft_pick'),
+    path('draft/clock/', views.draft_clock_view, name='draft_clock'),
     path('draft/undrafted-daughters/', views.undrafted_daughters_api, name='undrafted_daughters_api'),
+    path('api/draft/events/', views.draft_events_api_view, name='draft_events_api'),
     path('draft/validate-assignment/', views.validate_draft_assignment_view, name='validate_draft_assignment'),
     path('draft/reset/', views.reset_draft_view, name='reset_draft'),
     path('draft/assign-players/', views.assign_players_to_teams_view, name='assign_players_to_teams'),
     path('draft/simulate/', views.simulate_draft_view, name='simulate_draft'),
+    path('draft/simulation/', views.draft_simulation_view, name='draft_simulation'),
     path('draft/get-draft-order/', views.get_draft_order_view, name='get_draft_order'),
     path('draft/save-draft-order/', views.save_draft_order_view, name='save_draft_order'),
     path('reset-teams/', views.reset_teams_view, name='reset_teams'),
@@ -68,6 +74,7 @@ urlpatterns = [
     path('teams/<str:team_secret>/export-roster/', views.export_team_roster_csv, name='export_team_roster_csv'),
     path('teams/<str:team_secret>/toggle-star/', views.toggle_star_player_view, name='toggle_star_player'),
     path('teams/<str:team_secret>/save-starred-order/', views.save_starred_order_view, name='save_starred_order'),
+    path('teams/<str:team_secret>/available-players/', views.team_available_players_view, name='team_available_players'),
     path('managers/', views.managers_list_view, name='managers_list'),
     path('managers/create/', views.manager_create_view, name='manager_create'),
     path('managers/<int:pk>/', views.manager_detail_view, name='manager_detail'),
@@ -84,6 +91,12 @@ urlpatterns = [
     path('manager_daughter_rankings/analyze/', views.manager_daughter_rankings_analyze_view, name='manager_daughter_rankings_analyze'),
     path('sibling_rankings/', views.sibling_rankings_view, name='sibling_rankings'),
     path('sibling_rankings/analyze/', views.sibling_rankings_analyze_view, name='sibling_rankings_analyze'),
+    path('api/player-rankings/analysis/', views.ranking_analysis_api_view, {'kind': 'player'}, name='player_rankings_analysis_api'),
+    path('api/manager-daughter-rankings/analysis/', views.ranking_analysis_api_view, {'kind': 'daughter'}, name='manager_daughter_rankings_analysis_api'),
+    path('api/sibling-rankings/analysis/', views.ranking_analysis_api_view, {'kind': 'sibling'}, name='sibling_rankings_analysis_api'),
+    path('api/player-rankings/pool/', views.ranking_pool_api_view, {'kind': 'player'}, name='player_rankings_pool_api'),
+    path('api/manager-daughter-rankings/pool/', views.ranking_pool_api_view, {'kind': 'daughter'}, name='manager_daughter_rankings_pool_api'),
+    path('api/sibling-rankings/pool/', views.ranking_pool_api_view, {'kind': 'sibling'}, name='sibling_rankings_pool_api'),
     path('practice_slot_rankings/', views.practice_slot_rankings_view, name='practice_slot_rankings'),
     path('try_out_check_in/', views.try_out_check_in_view, name='try_out_check_in'),
     path('api/search-players/', views.search_players_view, name='search_players'),
@@ -0,0 +1,219 @@
+"""
+Incremental engine for the division setup validations.
+
+Each validation_code_* function in views.py is registered with the models it
+reads.  A post_save/post_delete on one of those models (see
+players/signals.py) marks only the affected validators dirty; they are
+recomputed lazily the next time results are read, and the changed
+ValidationCode rows are written with a single bulk_update.
+
+Writes that send no signals (QuerySet.update(), bulk_create, management
+commands) call mark_dirty(), which also tells every other worker.  As a
+safety net for a writer that doesn't, or a missed broadcast, every
+validator is recomputed at least every VALIDATION_ENGINE_TTL seconds.
+
+Registered functions take a DivisionStats snapshot (shared by every
+validator in one refresh, see players/division_stats.py) and return
+(is_valid, metadata).  Calling one directly with no arguments (as validation
+triggers do) still recomputes it, stores the result and returns the
+metadata dict, exactly like before.
+"""
+import functools
+import logging
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from . import cache_invalidation
+from .division_stats import DivisionStats
+
+logger = logging.getLogger(__name__)
+
+# Seconds before every validator is recomputed even if nothing marked it dirty
+DEFAULT_TTL = 300
+
+ValidationResult = namedtuple('ValidationResult', ['is_valid', 'meta'])
+
+
+class Validator:
+    def __init__(self, code, compute, depends_on):
+        self.code = code
+        self.compute = compute
+        self.depends_on = tuple(depends_on)
+
+
+class ValidationEngine:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Serializes recomputation so concurrent readers don't duplicate work
+        self._refresh_lock = threading.Lock()
+        self._validators = {}  # code -> Validator, in registration order
+        self._dependents = {}  # model label -> set of codes
+        self._results = {}     # code -> ValidationResult
+        self._dirty = set()
+        self._refreshed_at = None  # monotonic time of the last refresh of every validator
+
+    def register(self, code, compute, depends_on):
+        validator = Validator(code, compute, depends_on)
+        with self._lock:
+            self._validators[code] = validator
+            self._dirty.add(code)
+            for model in validator.depends_on:
+                label = model._meta.label
+                if label not in self._dependents:
+                    self._dependents[label] = set()
+                    cache_invalidation.register(
+                        f'validation_engine:{label}',
+                        functools.partial(self._mark_label_dirty, label),
+                    )
+                self._dependents[label].add(code)
+        return validator
+
+    def codes(self):
+        return list(self._validators)
+
+    def depends_on_model(self, model):
+        return model._meta.label in self._dependents
+
+    def _mark_label_dirty(self, label):
+        with self._lock:
+            self._dirty.update(self._dependents.get(label, ()))
+
+    def mark_dirty(self, *models):
+        """
+        Mark every validator that reads any of models as needing recomputation,
+        here now and on every worker after commit; for writes that send no signals.
+        """
+        # Validators are registered when views.py is imported (not yet in a management command)
+        from . import views  # noqa: F401
+
+        for model in models:
+            self.model_changed(model)
+
+    def mark_all_dirty(self):
+        with self._lock:
+            self._dirty.update(self._validators)
+
+    def _ttl(self):
+        return getattr(settings, 'VALIDATION_ENGINE_TTL', DEFAULT_TTL)
+
+    def model_changed(self, model):
+        """Signal hook: mark dependents dirty here now and on every worker after commit."""
+        label = model._meta.label
+        if label not in self._dependents:
+            return
+
+        self._mark_label_dirty(label)
+        transaction.on_commit(functools.partial(self._mark_label_dirty, label))
+        transaction.on_commit(functools.partial(
+            cache_invalidation.broadcast_invalidation, f'validation_engine:{label}'
+        ))
+
+    def run(self, code):
+        """Recompute one validator now, persist its value and return its result."""
+        with self._refresh_lock:
+            with self._lock:
+                self._dirty.discard(code)
+            result = self._compute(self._validators[code], DivisionStats())
+            self._store({code: result})
+        return result
+
+    def refresh(self, force=False):
+        """Recompute dirty validators (or all of them) and persist any changed values."""
+        # Validators are registered when views.py is imported
+        from . import views  # noqa: F401
+
+        refreshed_at = self._refreshed_at
+        if force or refreshed_at is None or time.monotonic() - refreshed_at >= self._ttl():
+            self.mark_all_dirty()
+
+        with self._refresh_lock:
+            with self._lock:
+                codes = [code for code in self._validators if code in self._dirty]
+                self._dirty.difference_update(codes)
+                if len(codes) == len(self._validators):
+                    self._refreshed_at = time.monotonic()
+
+            if not codes:
+                return {}
+
+            logger.info(f"Recomputing validations: {codes}")
+            stats = DivisionStats()
+            results = {}
+            for code in codes:
+                try:
+                    results[code] = self._compute(self._validators[code], stats)
+                except Exception as e:
+                    logger.error(f"Error computing validation '{code}': {str(e)}")
+            self._store(results)
+        return results
+
+    def get_results(self):
+        """Return code -> ValidationResult for every validator, recomputing dirty ones first."""
+        self.refresh()
+        return dict(self._results)
+
+    def _compute(self, validator, stats):
+        try:
+            is_valid, meta = validator.compute(stats)
+        except Exception:
+            # Leave it dirty so the next read retries
+            with self._lock:
+                self._dirty.add(validator.code)
+            raise
+        return ValidationResult(bool(is_valid), meta)
+
+    def _store(self, results):
+        from .models import ValidationCode
+        from . import validation_routes
+
+        self._results.update(results)
+
+        changed = []
+        validation_codes = ValidationCode.objects.filter(code__in=list(results)).in_bulk(field_name='code')
+        for code, result in results.items():
+            validation = validation_codes.get(code)
+            if validation is None:
+                logger.warning(f"Validation code '{code}' not found in database")
+                continue
+            if validation.value != result.is_valid:
+                validation.value = result.is_valid
+                validation.updated_at = timezone.now()
+                changed.append(validation)
+
+        if changed:
+            ValidationCode.objects.bulk_update(changed, ['value', 'updated_at'])
+            # bulk_update doesn't send post_save, so drop the route table explicitly
+            validation_routes.invalidate()
+            transaction.on_commit(validation_routes.invalidate)
+            transaction.on_commit(functools.partial(
+                cache_invalidation.broadcast_invalidation, validation_routes.CACHE_NAME
+            ))
+
+
+validation_engine = ValidationEngine()
+
+
+def validator(code, depends_on=()):
+    """
+    Register a validation function with the engine.
+
+    The decorated function computes (is_valid, metadata) from a DivisionStats
+    snapshot without side effects.
+    The returned wrapper keeps the old calling convention: it recomputes,
+    updates ValidationCode.value and returns the metadata dict.
+    """
+    def decorator(compute):
+        validation_engine.register(code, compute, depends_on)
+
+        @functools.wraps(compute)
+        def run_validator():
+            return validation_engine.run(code).meta
+
+        return run_validator
+
+    return decorator
@@ -0,0 +1,140 @@
+"""
+Compiled, in-memory snapshot of DivisionValidationRegistry and ValidationCode.
+
+ValidationMiddleware looks up every request path here instead of querying
+the registry.  The snapshot maps each registered page to its ordered
+page-load validations and triggers, and holds the current value and error
+message of every validation code.
+
+Registry pages can be:
+- exact paths:            /draft/run/
+- placeholder patterns:   /players/{id}/  or  /teams/{team_secret}/
+- prefixes (trailing *):  /draft/*
+
+The snapshot is rebuilt (and swapped in as a whole) after any write to
+DivisionValidationRegistry or ValidationCode (see players/signals.py).
+"""
+import logging
+import re
+import threading
+from collections import namedtuple
+
+from asgiref.sync import sync_to_async
+
+from . import cache_invalidation
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = 'validation_routes'
+
+# Placeholder names that only match numeric path segments
+NUMERIC_PLACEHOLDERS = {'id', 'pk'}
+
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+ValidationRoute = namedtuple('ValidationRoute', ['page', 'page_load', 'triggers'])
+ValidationState = namedtuple('ValidationState', ['value', 'error_message'])
+
+
+def _compile_page_pattern(page):
+    """Turn a registry page like /players/{id}/ into a compiled regex."""
+    regex = ''
+    position = 0
+    for match in _PLACEHOLDER_RE.finditer(page):
+        regex += re.escape(page[position:match.start()])
+        regex += r'\d+' if match.group(1) in NUMERIC_PLACEHOLDERS else r'[^/]+'
+        position = match.end()
+    regex += re.escape(page[position:])
+    return re.compile(regex + r'\Z')
+
+
+class ValidationRouteTable:
+    """Immutable lookup table built from one read of each validation table."""
+
+    def __init__(self, registries, validation_codes):
+        self.exact = {}
+        self.patterns = []
+        self.prefixes = []
+        self.codes = {}
+
+        for registry in registries:
+            route = ValidationRoute(
+                page=registry.page,
+                page_load=tuple(registry.validations_to_run_on_page_load or ()),
+                triggers=tuple(registry.validation_code_triggers or ()),
+            )
+            page = registry.page
+            if page.endswith('*'):
+                self.prefixes.append((page[:-1], route))
+            elif _PLACEHOLDER_RE.search(page):
+                self.patterns.append((_compile_page_pattern(page), route))
+            else:
+                self.exact[page] = route
+
+        # Longest prefix wins
+        self.prefixes.sort(key=lambda item: len(item[0]), reverse=True)
+
+        for validation in validation_codes:
+            self.codes[validation.code] = ValidationState(validation.value, validation.error_message)
+
+    def lookup(self, path):
+        """Return the ValidationRoute for path, or None if the page has no registry entry."""
+        route = self.exact.get(path)
+        if route is not None:
+            return route
+
+        for pattern, route in self.patterns:
+            if pattern.match(path):
+                return route
+
+        for prefix, route in self.prefixes:
+            if path.startswith(prefix):
+                return route
+
+        return None
+
+
+_lock = threading.Lock()
+_table = None
+
+
+def get_route_table():
+    """Return the current route table, building it from the database if needed."""
+    global _table
+
+    table = _table
+    if table is not None:
+        return table
+
+    from .models import DivisionValidationRegistry, ValidationCode
+
+    with _lock:
+        if _table is None:
+            _table = ValidationRouteTable(
+                DivisionValidationRegistry.objects.order_by('id'),
+                ValidationCode.objects.all(),
+            )
+            logger.info(f"Built validation route table ({len(_table.exact) + len(_table.patterns) + len(_table.prefixes)} pages)")
+        table = _table
+
+    cache_invalidation.start_invalidation_listener()
+    return table
+
+
+async def aget_route_table():
+    """Async variant of get_route_table(); only hops to a thread when the table must be built."""
+    table = _table
+    if table is not None:
+        return table
+    return await sync_to_async(get_route_table)()
+
+
+def invalidate():
+    """Drop the current snapshot; the next lookup rebuilds it."""
+    global _table
+
+    with _lock:
+        _table = None
+
+
+cache_invalidation.register(CACHE_NAME, invalidate)
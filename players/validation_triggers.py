@@ -0,0 +1,107 @@
+"""
+Debounced background execution of validation code triggers.
+
+After a successful write, ValidationMiddleware enqueues the page's
+validation_code_triggers instead of running them inside the request.
+Codes enqueued within the debounce window are coalesced, so a burst of
+check-ins runs each validation once.  They are then run on a worker
+thread.
+
+Call flush() to run everything pending right away, in the calling thread
+(used by tests and management commands that need deterministic results).
+"""
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for more triggers before running a batch
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+
+
+class ValidationTriggerQueue:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Serializes batches so flush() also waits for one already running
+        self._run_lock = threading.Lock()
+        self._pending = {}  # Ordered set of validation codes
+        self._timer = None
+
+    def _debounce_seconds(self):
+        return getattr(settings, 'VALIDATION_TRIGGER_DEBOUNCE_SECONDS', DEFAULT_DEBOUNCE_SECONDS)
+
+    def enqueue(self, validation_codes):
+        """Schedule validation codes to run; duplicates within the window run once."""
+        if not validation_codes:
+            return
+
+        delay = self._debounce_seconds()
+        if not delay:
+            # Debouncing disabled - run inline like a normal function call
+            self._run(list(validation_codes))
+            return
+
+        with self._lock:
+            for validation_code in validation_codes:
+                self._pending[validation_code] = None
+
+            if self._timer is None:
+                self._timer = threading.Timer(delay, self._flush_in_background)
+                self._timer.name = 'validation-triggers'
+                self._timer.start()
+
+    def pending(self):
+        with self._lock:
+            return list(self._pending)
+
+    def flush(self):
+        """Run all pending validation codes now, in the calling thread."""
+        with self._run_lock:
+            with self._lock:
+                validation_codes = list(self._pending)
+                self._pending.clear()
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+
+            self._run(validation_codes)
+
+        return validation_codes
+
+    def _flush_in_background(self):
+        try:
+            self.flush()
+        finally:
+            # The timer thread opened its own database connection
+            connections.close_all()
+
+    def _run(self, validation_codes):
+        # Import views module to access validation functions
+        from . import views
+
+        for validation_code in validation_codes:
+            validation_function = getattr(views, validation_code, None)
+            if validation_function is None:
+                logger.warning(f"Validation function '{validation_code}' not found in views")
+                continue
+
+            try:
+                validation_function()
+                logger.info(f"Validation trigger '{validation_code}' executed")
+            except Exception as e:
+                logger.error(f"Error running validation trigger '{validation_code}': {str(e)}")
+
+
+validation_trigger_queue = ValidationTriggerQueue()
+
+
+def enqueue(validation_codes):
+    validation_trigger_queue.enqueue(validation_codes)
+
+
+def flush():
+    """Run pending validation triggers immediately; returns the codes that ran."""
+    return validation_trigger_queue.flush()
@@ -1,6 +1,6 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.http import JsonResponse, Http404
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import condition, require_http_methods
 from django.core.files.storage import default_storage
 from django.core.files.base import ContentFile
 from django.contrib import messages
@@ -9,6 +9,11 @@ from django.core.paginator import Paginator
 from django.views.decorators.csrf import csrf_exempt
 from django.db import models
 from .models import Player, Team, Manager, PlayerRanking, ManagerDaughterRanking, SiblingRanking, Draft, DraftPick, TeamPreference, GeneralSetting, StarredDraftPick, DivisionValidationRegistry, ValidationCode, PracticeSlot
+from .general_settings import general_settings
+from .ranking_cache import ranking_aggregates
+from .draft_state import draft_states
+from .validation_engine import validation_engine, validator
+from . import available_pool, draft_clock, draft_events, draft_priority, master_password, ranking_codec, ranking_consensus, rankings
 import pandas as pd
 import json
 import os
@@ -17,19 +22,16 @@ from datetime import datetime
 
 
 def get_display_timezone():
-    """Get the configured display timezone from database, default to UTC"""
+    """Get the configured display timezone from the settings cache, default to UTC"""
     try:
-        setting = GeneralSetting.objects.filter(key='display_timezone').first()
-        if setting and setting.value:
-            return pytz.timezone(setting.value)
-        return pytz.UTC
+        return general_settings.get_timezone('display_timezone', pytz.UTC)
     except:
         return pytz.UTC
 
 
 def settings_view(request):
     """Main settings page"""
-    from .models import Draft, QuickLink, GeneralSetting
+    from .models import Draft, QuickLink
 
     # Check if there's an existing draft
     draft_exists = Draft.objects.exists()
@@ -38,14 +40,14 @@ def settings_view(request):
     quick_links = QuickLink.objects.all().order_by('display_order', 'name')
 
     # Get visibility settings
-    show_preseason = GeneralSetting.objects.filter(key='show_preseason_items').first()
-    show_testing = GeneralSetting.objects.filter(key='show_testing_items').first()
+    show_preseason = general_settings.get_bool('show_preseason_items', True)
+    show_testing = general_settings.get_bool('show_testing_items', True)
 
     context = {
         'draft_exists': draft_exists,
         'quick_links': quick_links,
-        'show_preseason_items': show_preseason.value.lower() == 'true' if show_preseason else True,
-        'show_testing_items': show_testing.value.lower() == 'true' if show_testing else True,
+        'show_preseason_items': show_preseason,
+        'show_testing_items': show_testing,
     }
     return render(request, 'players/settings.html', context)
 
@@ -348,19 +350,11 @@ def get_master_password(request):
     Get the current master password from general_settings table.
     """
     try:
-        setting = GeneralSetting.objects.filter(key='master_password').first()
-
-        if setting:
-            return JsonResponse({
-                'success': True,
-                'password': setting.value
-            })
-        else:
-            # Return default password if not set in database
-            return JsonResponse({
-                'success': True,
-                'password': 'wusarocks'  # Default fallback
-            })
+        # Default password if not set in database
+        return JsonResponse({
+            'success': True,
+            'password': general_settings.get('master_password', 'wusarocks')
+        })
     except Exception as e:
         return JsonResponse({
             'success': False,
@@ -373,6 +367,8 @@ def set_master_password(request):
     """
     Set the master password in general_settings table.
     """
+    from django.db import transaction
+
     try:
         password = request.POST.get('password', '').strip()
 
@@ -383,16 +379,23 @@ def set_master_password(request):
             }, status=400)
 
         # Update or create the master password setting
-        setting, created = GeneralSetting.objects.update_or_create(
-            key='master_password',
-            defaults={'value': password}
-        )
+        with transaction.atomic():
+            setting, created = GeneralSetting.objects.update_or_create(
+                key='master_password',
+                defaults={'value': password}
+            )
 
-        return JsonResponse({
+            # Revoke every token issued for the old password
+            version = master_password.bump_password_version()
+
+        response = JsonResponse({
             'success': True,
             'message': 'Master password updated successfully',
             'created': created
         })
+
+        # Keep the admin who changed it signed in
+        return master_password.set_token_cookie(response, version)
     except Exception as e:
         return JsonResponse({
             'success': False,
@@ -402,15 +405,11 @@ def set_master_password(request):
 
 def get_master_password_from_db():
     """
-    Helper function to retrieve master password from database.
+    Helper function to retrieve master password from the general settings cache.
     Returns the password from general_settings, or default 'wusarocks' if not set.
     """
     try:
-        setting = GeneralSetting.objects.filter(key='master_password').first()
-        if setting:
-            return setting.value
-        else:
-            return 'wusarocks'  # Default fallback
+        return general_settings.get('master_password', 'wusarocks')
     except:
         return 'wusarocks'  # Default fallback on error
 
@@ -419,7 +418,7 @@ def get_master_password_from_db():
 def verify_master_password_view(request):
     """
     Verify if the provided password matches the master password.
-    Sets a cookie if valid.
+    Sets a signed, expiring token cookie if valid (the password itself is never stored in the cookie).
     """
     try:
         password = request.POST.get('password', '').strip()
@@ -431,25 +430,17 @@ def verify_master_password_view(request):
             }, status=400)
 
         # Get master password from database
-        master_password = get_master_password_from_db()
+        db_password = get_master_password_from_db()
 
         # Check if passwords match
-        if password == master_password:
+        if password == db_password:
             response = JsonResponse({
                 'success': True,
                 'message': 'Password verified successfully'
             })
 
-            # Set cookie that expires in 30 days
-            response.set_cookie(
-                'master_password',
-                password,
-                max_age=30*24*60*60,  # 30 days
-                httponly=False,  # Allow JavaScript to read it
-                samesite='Lax'
-            )
-
-            return response
+            # Set signed token cookie that expires in 30 days
+            return master_password.set_token_cookie(response)
         else:
             return JsonResponse({
                 'success': False,
@@ -464,59 +455,44 @@ def verify_master_password_view(request):
 
 
 # Validation functions for division setup checklist
-def validation_code_create_players():
+# Each reads a shared DivisionStats snapshot and returns (is_valid, metadata);
+# @validator registers it with the incremental validation engine and persists
+# ValidationCode.value when called directly.
+@validator('validation_code_create_players', depends_on=[Player])
+def validation_code_create_players(stats):
     """Validate that at least 10 players exist"""
-    from .models import ValidationCode
-
-    player_count = Player.objects.count()
+    player_count = stats.player_count
     is_valid = (player_count >= 10)
 
-    # Update ValidationCode.value field
-    validation = ValidationCode.objects.get(code='validation_code_create_players')
-    validation.value = is_valid
-    validation.save()
-
     # Return metadata for display
-    return {
+    return is_valid, {
         'count': player_count,
         'count_label': 'players',
         'status_note': f'{player_count} players created (need at least 10)'
     }
 
-def validation_code_create_teams():
+@validator('validation_code_create_teams', depends_on=[Team])
+def validation_code_create_teams(stats):
     """Validate that at least 5 teams exist"""
-    from .models import ValidationCode
-
-    team_count = Team.objects.count()
+    team_count = stats.team_count
     is_valid = (team_count >= 5)
 
-    # Update ValidationCode.value field
-    validation = ValidationCode.objects.get(code='validation_code_create_teams')
-    validation.value = is_valid
-    validation.save()
-
     # Return metadata for display
-    return {
+    return is_valid, {
         'count': team_count,
         'count_label': 'teams',
         'status_note': f'{team_count} teams created (need at least 5)'
     }
 
-def validation_code_create_managers():
+@validator('validation_code_create_managers', depends_on=[Manager, Team, Player])
+def validation_code_create_managers(stats):
     """Validate that manager count equals team count and all managers have daughters"""
-    from .models import ValidationCode
-
-    manager_count = Manager.objects.count()
-    team_count = Team.objects.count()
-    managers_without_daughters = Manager.objects.filter(daughter__isnull=True).count()
+    manager_count = stats.manager_count
+    team_count = stats.team_count
+    managers_without_daughters = stats.managers_without_daughter
 
     is_valid = (manager_count == team_count and manager_count > 0 and managers_without_daughters == 0)
 
-    # Update ValidationCode.value field
-    validation = ValidationCode.objects.get(code='validation_code_create_managers')
-    validation.value = is_valid
-    validation.save()
-
     # Return metadata for display
     if managers_without_daughters > 0:
         status_note = f'{manager_count} managers created, but {managers_without_daughters} missing daughter assignments'
@@ -528,29 +504,23 @@ def validation_code_create_managers():
     # Calculate managers with daughters assigned
     managers_with_daughters = manager_count - managers_without_daughters
 
-    return {
+    return is_valid, {
         'count': manager_count,
         'count_label': f'Managers ({managers_with_daughters} Assigned to Daughters)',
         'status_note': status_note
     }
 
-def validation_code_collect_manager_team_preferences():
+@validator('validation_code_collect_manager_team_preferences', depends_on=[Manager, Team, TeamPreference])
+def validation_code_collect_manager_team_preferences(stats):
     """Validate that all managers have submitted team preferences OR all teams have managers assigned"""
-    from .models import ValidationCode
-
-    manager_count = Manager.objects.count()
-    team_count = Team.objects.count()
-    teams_without_managers = Team.objects.filter(manager__isnull=True).count()
-    team_preferences_count = TeamPreference.objects.count()
+    manager_count = stats.manager_count
+    team_count = stats.team_count
+    teams_without_managers = stats.teams_without_manager
+    team_preferences_count = stats.team_preferences_count
 
     # Complete if all managers have submitted preferences OR (teams exist AND all teams have been assigned managers)
     is_valid = (manager_count > 0 and team_preferences_count >= manager_count) or (team_count > 0 and teams_without_managers == 0)
 
-    # Update ValidationCode.value field
-    validation = ValidationCode.objects.get(code='validation_code_collect_manager_team_preferences')
-    validation.value = is_valid
-    validation.save()
-
     # Return metadata for display
     if teams_without_managers == 0:
         status_note = 'All teams have managers assigned'
@@ -560,198 +530,129 @@ def validation_code_collect_manager_team_preferences():
     # Calculate teams with managers assigned
     teams_with_managers = team_count - teams_without_managers
 
-    return {
+    return is_valid, {
         'count': team_preferences_count,
         'count_label': f'Preferences Submitted, {teams_with_managers} Managers Assigned to Teams',
         'status_note': status_note
     }
 
-def validation_code_assign_managers_to_teams():
+@validator('validation_code_assign_managers_to_teams', depends_on=[Manager, Team])
+def validation_code_assign_managers_to_teams(stats):
     """Validate that all teams have managers assigned"""
-    from .models import ValidationCode
-
-    manager_count = Manager.objects.count()
-    teams_without_managers = Team.objects.filter(manager__isnull=True).count()
-    managers_with_teams = Team.objects.filter(manager__isnull=False).count()
+    manager_count = stats.manager_count
+    teams_without_managers = stats.teams_without_manager
+    managers_with_teams = stats.teams_with_manager
 
     is_valid = (manager_count > 0 and teams_without_managers == 0 and managers_with_teams == manager_count)
 
-    # Update ValidationCode.value field
-    validation = ValidationCode.objects.get(code='validation_code_assign_managers_to_teams')
-    validation.value = is_valid
-    validation.save()
-
     # Return metadata for display
-    return {
+    return is_valid, {
         'count': managers_with_teams,
         'count_label': 'teams with managers',
         'status_note': f'{managers_with_teams}/{manager_count} teams have managers assigned'
     }
 
-def validation_code_create_practice_slots():
+@validator('validation_code_create_practice_slots', depends_on=[Team, PracticeSlot])
+def validation_code_create_practice_slots(stats):
     """Validate that practice slots count equals team count"""
-    from .models import ValidationCode
-
-    team_count = Team.objects.count()
-    practice_slot_count = PracticeSlot.objects.count()
+    team_count = stats.team_count
+    practice_slot_count = stats.practice_slot_count
     is_valid = (team_count > 0 and practice_slot_count == team_count)
 
-    # Update ValidationCode.value field (if table exists)
-    try:
-        validation = ValidationCode.objects.get(code='validation_code_create_practice_slots')
-        validation.value = is_valid
-        validation.save()
-    except (ValidationCode.DoesNotExist, Exception):
-        # If ValidationCode table doesn't exist or record not found, skip
-        pass
-
     # Return metadata for display
-    return {
+    return is_valid, {
         'count': practice_slot_count,
         'count_label': 'practice slots',
         'status_note': f'{practice_slot_count} practice slots created (need {team_count} to match teams)'
     }
 
-def validation_code_send_managers_team_secrets():
+@validator('validation_code_send_managers_team_secrets')
+def validation_code_send_managers_team_secrets(stats):
     """N/A - Manual task performed outside the website"""
-    from .models import ValidationCode
-
-    # This is a manual task, so we mark it as False (incomplete)
-    validation = ValidationCode.objects.get(code='validation_code_send_managers_team_secrets')
-    validation.value = False
-    validation.save()
+    # This is a manual task, so it is always False (incomplete)
+    is_valid = False
 
     # Return metadata for display
-    return {
+    return is_valid, {
         'count': 0,
         'count_label': 'manual task',
         'status_note': 'Manual task - send secrets via email/text'
     }
 
-def validation_code_request_manager_rankings():
+@validator('validation_code_request_manager_rankings')
+def validation_code_request_manager_rankings(stats):
     """N/A - Manual task performed outside the website"""
-    from .models import ValidationCode
-
-    # This is a manual task, so we mark it as False (incomplete)
-    validation = ValidationCode.objects.get(code='validation_code_request_manager_rankings')
-    validation.value = False
-    validation.save()
+    # This is a manual task, so it is always False (incomplete)
+    is_valid = False
 
     # Return metadata for display
-    return {
+    return is_valid, {
         'count': 0,
         'count_label': 'manual task',
         'status_note': 'Manual task - request rankings via email/text'
     }
 
-def validation_code_analyze_and_release_player_rankings():
+@validator('validation_code_analyze_and_release_player_rankings', depends_on=[Team, PlayerRanking, GeneralSetting])
+def validation_code_analyze_and_release_player_rankings(stats):
     """Validate that at least one player ranking has been submitted and rankings are public"""
-    from .models import ValidationCode
-    import json
-
-    # Calculate required number of rankings: (Number of Teams) × 2
-    num_teams = Team.objects.count()
-    required_player_count = num_teams * 2
-
-    # Count ONLY complete player rankings (those with exactly the required number of players ranked)
-    complete_rankings_count = 0
-    for ranking in PlayerRanking.objects.all():
-        try:
-            ranking_data = json.loads(ranking.ranking)
-            if isinstance(ranking_data, list) and len(ranking_data) == required_player_count:
-                complete_rankings_count += 1
-        except (json.JSONDecodeError, TypeError):
-            # Skip invalid JSON
-            pass
+    # Count ONLY complete player rankings (those with exactly (Number of Teams) × 2 players ranked)
+    complete_rankings_count = stats.complete_player_rankings_count
 
     # Check that player_rankings_public is set to "true"
-    player_rankings_public_is_true = GeneralSetting.objects.filter(
-        key="player_rankings_public",
-        value="true"
-    ).exists()
+    player_rankings_public_is_true = general_settings.get('player_rankings_public') == 'true'
 
     is_valid = (complete_rankings_count >= 1) and player_rankings_public_is_true
 
-    # Update ValidationCode.value field
-    validation = ValidationCode.objects.get(code='validation_code_analyze_and_release_player_rankings')
-    validation.value = is_valid
-    validation.save()
-
     # Return metadata for display
     portal_status = "is released to managers" if player_rankings_public_is_true else "is not released to managers"
-    return {
+    return is_valid, {
         'count': complete_rankings_count,
         'count_label': 'player rankings submitted',
         'status_note': f'{complete_rankings_count} player rankings submitted, portal {portal_status}'
     }
 
-def validation_code_analyze_manager_daughter_rankings():
+@validator('validation_code_analyze_manager_daughter_rankings', depends_on=[Manager, Player, ManagerDaughterRanking])
+def validation_code_analyze_manager_daughter_rankings(stats):
     """Validate that a complete manager daughter ranking has been submitted with ALL manager daughters ranked"""
-    from .models import ValidationCode
-    import json
-
     # Count total manager daughters (players who are daughters of managers)
-    total_manager_daughters = Manager.objects.filter(daughter__isnull=False).count()
-
-    # Get any existing manager daughter rankings
-    manager_daughter_rankings = ManagerDaughterRanking.objects.all()
+    total_manager_daughters = stats.managers_with_daughter
 
     # Check if any ranking contains ALL manager daughters
     is_valid = False
     ranked_count = 0
 
-    if manager_daughter_rankings.exists() and total_manager_daughters > 0:
-        for ranking in manager_daughter_rankings:
-            try:
-                rankings_data = json.loads(ranking.ranking)
-                ranked_count = len(rankings_data)
-
-                # Check if this ranking includes ALL manager daughters
-                if ranked_count == total_manager_daughters:
-                    is_valid = True
-                    break
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-    # Update ValidationCode.value field
-    validation = ValidationCode.objects.get(code='validation_code_analyze_manager_daughter_rankings')
-    validation.value = is_valid
-    validation.save()
+    ranking_lengths = stats.daughter_ranking_lengths
+    if ranking_lengths and total_manager_daughters > 0:
+        is_valid = total_manager_daughters in ranking_lengths
+        ranked_count = total_manager_daughters if is_valid else ranking_lengths[-1]
 
     # Return metadata for display
-    return {
+    return is_valid, {
         'count': ranked_count,
         'count_label': f'manager daughters ranked (need {total_manager_daughters})',
         'status_note': f'{ranked_count} managers\' daughters ranked'
     }
 
-def validation_code_assign_practice_slots():
+@validator('validation_code_assign_practice_slots', depends_on=[Team, PracticeSlot])
+def validation_code_assign_practice_slots(stats):
     """Validate that all teams have been assigned practice slots"""
-    from .models import ValidationCode, PracticeSlotRanking
-
-    all_teams = Team.objects.all()
-    team_count = all_teams.count()
-    teams_without_slots = all_teams.filter(practice_slot__isnull=True)
-    teams_with_slots = all_teams.filter(practice_slot__isnull=False)
+    team_count = stats.team_count
+    teams_with_slots = stats.teams_with_practice_slot
 
     # Complete if teams exist AND all teams have practice slots assigned
-    is_valid = (team_count > 0 and teams_without_slots.count() == 0)
-
-    # Update ValidationCode.value field
-    validation = ValidationCode.objects.get(code='validation_code_assign_practice_slots')
-    validation.value = is_valid
-    validation.save()
+    is_valid = (team_count > 0 and stats.teams_without_practice_slot == 0)
 
     # Return metadata for display
-    return {
-        'count': teams_with_slots.count(),
+    return is_valid, {
+        'count': teams_with_slots,
         'count_label': 'teams with practice slots',
-        'status_note': f'{teams_with_slots.count()} teams have practice slots assigned'
+        'status_note': f'{teams_with_slots} teams have practice slots assigned'
     }
 
-def validation_code_setup_draft():
+@validator('validation_code_setup_draft', depends_on=[Draft])
+def validation_code_setup_draft(stats):
     """Validate that draft is fully configured"""
-    from .models import ValidationCode, Draft
+    from .models import Draft
     import json as json_module
 
     # Fetch the draft object from the database
@@ -782,11 +683,6 @@ def validation_code_setup_draft():
             except (json_module.JSONDecodeError, ValueError):
                 draft_setup_complete = False
 
-    # Update the ValidationCode in the database with the result
-    validation = ValidationCode.objects.get(code='validation_code_setup_draft')
-    validation.value = draft_setup_complete
-    validation.save()
-
     # Return metadata for display
     if draft:
         if draft_setup_complete:
@@ -797,29 +693,23 @@ def validation_code_setup_draft():
     else:
         status_note = 'No draft created yet'
 
-    return {
+    return draft_setup_complete, {
         'count': 1 if draft_setup_complete else 0,
         'count_label': 'draft configured',
         'status_note': status_note
     }
 
-def validation_code_run_the_draft():
+@validator('validation_code_run_the_draft', depends_on=[Player, Team])
+def validation_code_run_the_draft(stats):
     """Validate that all players have been assigned to teams"""
-    from .models import ValidationCode
-
-    player_count = Player.objects.count()
-    players_without_team = Player.objects.filter(team__isnull=True).count()
-    players_with_team = player_count - players_without_team
+    player_count = stats.player_count
+    players_without_team = stats.players_without_team
+    players_with_team = stats.players_with_team
 
     is_valid = (player_count > 0 and players_without_team == 0)
 
-    # Update ValidationCode.value field
-    validation = ValidationCode.objects.get(code='validation_code_run_the_draft')
-    validation.value = is_valid
-    validation.save()
-
     # Return metadata for display
-    return {
+    return is_valid, {
         'count': players_with_team,
         'count_label': 'players assigned',
         'status_note': f'{players_with_team}/{player_count} players assigned to teams'
@@ -828,7 +718,7 @@ def validation_code_run_the_draft():
 
 def run_all_validations():
     """
-    Master function that runs all 12 validation functions.
+    Master function that recomputes every registered validation function.
 
     This function is called by the division_setup_checklist page to refresh
     all validation statuses in the database.
@@ -838,19 +728,7 @@ def run_all_validations():
 
     logger.info("Running all validation functions...")
 
-    # Call all 12 validation functions in order
-    validation_code_create_players()
-    validation_code_create_teams()
-    validation_code_create_managers()
-    validation_code_collect_manager_team_preferences()
-    validation_code_assign_managers_to_teams()
-    validation_code_send_managers_team_secrets()
-    validation_code_request_manager_rankings()
-    validation_code_analyze_and_release_player_rankings()
-    validation_code_analyze_manager_daughter_rankings()
-    validation_code_assign_practice_slots()
-    validation_code_setup_draft()
-    validation_code_run_the_draft()
+    validation_engine.refresh(force=True)
 
     logger.info("All validation functions completed successfully")
 
@@ -867,7 +745,8 @@ def refresh_all_validations_api(request):
 
     try:
         logger.info("API: Starting validation refresh...")
-        run_all_validations()
+        # Only validators whose models changed since the last run are recomputed
+        validation_engine.refresh()
         logger.info("API: Validation refresh completed")
 
         return JsonResponse({
@@ -1062,60 +941,29 @@ def division_setup_checklist_view(request):
 
     logger = logging.getLogger(__name__)
 
-    # Helper function to execute validation code from database
-    def execute_validation_from_db(validation_code):
-        """
-        Execute validation logic from ValidationCode table.
-        Returns True/False based on validation result.
-        """
-        try:
-            from .models import ValidationCode
-
-            # Fetch validation from database
-            validation = ValidationCode.objects.filter(code=validation_code).first()
-
-            if not validation:
-                logger.warning(f"Validation code '{validation_code}' not found in database")
-                return False
-
-            # Simply return the boolean value directly
-            # (ValidationCode.value is now a BooleanField)
-            return validation.value
-
-        except Exception as e:
-            logger.error(f"Error executing validation code '{validation_code}': {str(e)}")
-            # On error, assume validation fails
-            return False
-
-    # Execute ALL validation codes from database
-    result_create_players = execute_validation_from_db('validation_code_create_players')
-    result_create_teams = execute_validation_from_db('validation_code_create_teams')
-    result_create_managers = execute_validation_from_db('validation_code_create_managers')
-    result_collect_preferences = execute_validation_from_db('validation_code_collect_manager_team_preferences')
-    result_assign_managers = execute_validation_from_db('validation_code_assign_managers_to_teams')
-    result_create_practice_slots = execute_validation_from_db('validation_code_create_practice_slots')
-    result_send_secrets = execute_validation_from_db('validation_code_send_managers_team_secrets')
-    result_request_rankings = execute_validation_from_db('validation_code_request_manager_rankings')
-    result_analyze_player_rankings = execute_validation_from_db('validation_code_analyze_and_release_player_rankings')
-    result_analyze_daughter_rankings = execute_validation_from_db('validation_code_analyze_manager_daughter_rankings')
-    result_assign_practice_slots = execute_validation_from_db('validation_code_assign_practice_slots')
-    result_setup_draft = execute_validation_from_db('validation_code_setup_draft')
-    result_run_draft = execute_validation_from_db('validation_code_run_the_draft')
-
-    # Call legacy Python functions for rich metadata (count, count_label, etc.)
-    result_create_players_meta = validation_code_create_players()
-    result_create_teams_meta = validation_code_create_teams()
-    result_create_managers_meta = validation_code_create_managers()
-    result_collect_preferences_meta = validation_code_collect_manager_team_preferences()
-    result_assign_managers_meta = validation_code_assign_managers_to_teams()
-    result_create_practice_slots_meta = validation_code_create_practice_slots()
-    result_send_secrets_meta = validation_code_send_managers_team_secrets()
-    result_request_rankings_meta = validation_code_request_manager_rankings()
-    result_analyze_player_rankings_meta = validation_code_analyze_and_release_player_rankings()
-    result_analyze_daughter_rankings_meta = validation_code_analyze_manager_daughter_rankings()
-    result_assign_practice_slots_meta = validation_code_assign_practice_slots()
-    result_setup_draft_meta = validation_code_setup_draft()
-    result_run_draft_meta = validation_code_run_the_draft()
+    # Read precomputed results; only validators whose models changed are recomputed
+    validation_results = validation_engine.get_results()
+
+    def get_validation_result(validation_code):
+        result = validation_results.get(validation_code)
+        if result is None:
+            logger.warning(f"No result for validation code '{validation_code}'")
+            return False, {}
+        return result
+
+    result_create_players, result_create_players_meta = get_validation_result('validation_code_create_players')
+    result_create_teams, result_create_teams_meta = get_validation_result('validation_code_create_teams')
+    result_create_managers, result_create_managers_meta = get_validation_result('validation_code_create_managers')
+    result_collect_preferences, result_collect_preferences_meta = get_validation_result('validation_code_collect_manager_team_preferences')
+    result_assign_managers, result_assign_managers_meta = get_validation_result('validation_code_assign_managers_to_teams')
+    result_create_practice_slots, result_create_practice_slots_meta = get_validation_result('validation_code_create_practice_slots')
+    result_send_secrets, result_send_secrets_meta = get_validation_result('validation_code_send_managers_team_secrets')
+    result_request_rankings, result_request_rankings_meta = get_validation_result('validation_code_request_manager_rankings')
+    result_analyze_player_rankings, result_analyze_player_rankings_meta = get_validation_result('validation_code_analyze_and_release_player_rankings')
+    result_analyze_daughter_rankings, result_analyze_daughter_rankings_meta = get_validation_result('validation_code_analyze_manager_daughter_rankings')
+    result_assign_practice_slots, result_assign_practice_slots_meta = get_validation_result('validation_code_assign_practice_slots')
+    result_setup_draft, result_setup_draft_meta = get_validation_result('validation_code_setup_draft')
+    result_run_draft, result_run_draft_meta = get_validation_result('validation_code_run_the_draft')
 
     # Build checklist items
     checklist_items = [
@@ -1570,6 +1418,143 @@ def admin_dashboard_view(request):
     return render(request, 'players/admin_dashboard.html')
 
 
+def _can_view_metrics(request):
+    """Master password holders, or a scraper presenting the METRICS_TOKEN bearer token."""
+    from django.conf import settings
+    from django.utils.crypto import constant_time_compare
+
+    if not getattr(request, 'needs_master_password_challenge', False):
+        return True
+
+    metrics_token = getattr(settings, 'METRICS_TOKEN', '')
+    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+    if metrics_token and auth_header.startswith('Bearer '):
+        return constant_time_compare(auth_header[len('Bearer '):].strip(), metrics_token)
+
+    return False
+
+
+@require_http_methods(["GET"])
+def metrics_view(request):
+    """Per-view request metrics in Prometheus text format"""
+    from django.http import HttpResponse
+    from .request_metrics import request_metrics
+
+    if not _can_view_metrics(request):
+        return HttpResponse('Unauthorized\n', status=401, content_type='text/plain')
+
+    return HttpResponse(
+        request_metrics.render_prometheus(),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
+
+
+def metrics_dashboard_view(request):
+    """Dashboard listing the slowest and chattiest views since the process started"""
+    from .request_metrics import request_metrics
+
+    sort_options = [
+        ('total_time', 'Total time'),
+        ('p95', 'p95 latency'),
+        ('avg_queries', 'Avg queries'),
+        ('max_queries', 'Max queries'),
+        ('total_db_time', 'Total DB time'),
+        ('errors', 'Errors'),
+    ]
+    order_by = request.GET.get('sort', 'total_time')
+    if order_by not in dict(sort_options):
+        order_by = 'total_time'
+
+    # Don't leak anything behind the password challenge overlay
+    rows = [] if getattr(request, 'needs_master_password_challenge', False) else request_metrics.top_views(order_by, limit=50)
+
+    context = {
+        'rows': rows,
+        'order_by': order_by,
+        'sort_options': sort_options,
+        'started_at': datetime.fromtimestamp(request_metrics.started_at, tz=pytz.UTC).astimezone(get_display_timezone()),
+    }
+    return render(request, 'players/metrics_dashboard.html', context)
+
+
+@require_http_methods(["GET"])
+def draft_simulation_view(request):
+    """
+    Play the draft many times with the priority formula's (or the saved)
+    draft order and show expected team strength, each player's pick positions
+    and draft order fairness (players/draft_simulation.py)
+    """
+    from django.conf import settings
+    from . import draft_simulation
+
+    order = request.GET.get('order', draft_simulation.ORDER_PRIORITY)
+    if order not in draft_simulation.ORDER_LABELS:
+        order = draft_simulation.ORDER_PRIORITY
+    try:
+        runs = int(request.GET.get('runs', getattr(settings, 'DRAFT_SIMULATION_RUNS', draft_simulation.DEFAULT_RUNS)))
+        noise = float(request.GET.get('noise', draft_simulation.DEFAULT_NOISE))
+    except ValueError:
+        runs, noise = draft_simulation.DEFAULT_RUNS, draft_simulation.DEFAULT_NOISE
+    runs = max(1, min(runs, draft_simulation.MAX_RUNS))
+    noise = max(0.0, noise)
+
+    context = {
+        'order': order,
+        'order_options': list(draft_simulation.ORDER_LABELS.items()),
+        'runs': runs,
+        'noise': noise,
+        'error': None,
+        'team_rows': [],
+        'player_rows': [],
+        'fairness': None,
+    }
+
+    # Don't leak anything behind the password challenge overlay
+    if getattr(request, 'needs_master_password_challenge', False):
+        return render(request, 'players/draft_simulation.html', context)
+
+    try:
+        inputs = draft_simulation.load_inputs(order)
+    except ValueError as e:
+        context['error'] = str(e)
+        return render(request, 'players/draft_simulation.html', context)
+
+    result = draft_simulation.simulate(
+        inputs, runs=runs, noise=noise, workers=getattr(settings, 'DRAFT_SIMULATION_WORKERS', 1)
+    )
+
+    # Names for the rows
+    team_rows = draft_simulation.team_rows(result)
+    teams = Team.objects.select_related('manager', 'manager__daughter').in_bulk([row['team_id'] for row in team_rows])
+    for row in team_rows:
+        row['team'] = teams.get(row['team_id'])
+    player_rows = draft_simulation.player_rows(result)
+    players = Player.objects.in_bulk([row['player_id'] for row in player_rows])
+    for row in player_rows:
+        row['player'] = players.get(row['player_id'])
+
+    context.update({
+        'team_rows': team_rows,
+        'player_rows': player_rows,
+        'fairness': draft_simulation.fairness(result),
+        'num_teams': len(inputs.team_ids),
+        'num_rounds': inputs.num_rounds,
+    })
+    return render(request, 'players/draft_simulation.html', context)
+
+
+@require_http_methods(["POST"])
+def reset_metrics_view(request):
+    """Clear the collected request metrics (e.g. right before a draft)"""
+    from .request_metrics import request_metrics
+
+    if getattr(request, 'needs_master_password_challenge', False):
+        return JsonResponse({'success': False, 'error': 'Master password required'}, status=403)
+
+    request_metrics.reset()
+    return JsonResponse({'success': True, 'message': 'Metrics reset'})
+
+
 def public_portal_view(request):
     """Public portal listing all teams"""
     from .models import QuickLink
@@ -1740,7 +1725,6 @@ def update_manager_api_view(request):
 
 def get_component_categories_api_view(request):
     """API endpoint to get all component categories and their visibility"""
-    from .models import GeneralSetting
 
     categories = [
         {
@@ -1757,8 +1741,7 @@ def get_component_categories_api_view(request):
 
     # Get current visibility for each category
     for category in categories:
-        setting = GeneralSetting.objects.filter(key=category['key']).first()
-        category['visible'] = setting.value.lower() == 'true' if setting else True
+        category['visible'] = general_settings.get_bool(category['key'], True)
 
     return JsonResponse({
         'success': True,
@@ -1947,8 +1930,8 @@ def players_list_view(request):
     all_teams = Team.objects.all().order_by('name')
 
     # Get visibility settings
-    show_preseason = GeneralSetting.objects.filter(key='show_preseason_items').first()
-    show_testing = GeneralSetting.objects.filter(key='show_testing_items').first()
+    show_preseason = general_settings.get_bool('show_preseason_items', True)
+    show_testing = general_settings.get_bool('show_testing_items', True)
 
     context = {
         'page_obj': page_obj,
@@ -1957,8 +1940,8 @@ def players_list_view(request):
         'order': order,
         'total_players': Player.objects.count(),
         'all_teams': all_teams,
-        'show_preseason_items': show_preseason.value.lower() == 'true' if show_preseason else True,
-        'show_testing_items': show_testing.value.lower() == 'true' if show_testing else True,
+        'show_preseason_items': show_preseason,
+        'show_testing_items': show_testing,
     }
     return render(request, 'players/players_list.html', context)
 
@@ -2413,9 +2396,8 @@ def import_players_view(request):
 
 def team_detail_view(request, team_secret):
     """Display team info and roster based on manager_secret (read-only)"""
-    from .models import PlayerRanking, ManagerDaughterRanking, PracticeSlotRanking, PracticeSlot
+    from .models import PracticeSlotRanking, PracticeSlot
     from django.contrib import messages
-    import json
 
     try:
         team = Team.objects.get(manager_secret=team_secret)
@@ -2426,25 +2408,22 @@ def team_detail_view(request, team_secret):
     players = team.players.all().order_by('last_name', 'first_name')
 
     # Check if draft portal is open
-    try:
-        portal_setting = GeneralSetting.objects.get(key='open_draft_portal_to_managers')
-        portal_open = portal_setting.value == 'true'
-    except GeneralSetting.DoesNotExist:
-        portal_open = False
+    portal_open = general_settings.get('open_draft_portal_to_managers') == 'true'
 
-    # Get available players (not yet drafted) and drafted players if portal is open
-    available_players = []
+    # Get drafted players if portal is open; the available players are loaded
+    # page by page from team_available_players_view
     drafted_players = []
     starred_player_ids = set()
     starred_players = []
+    draft_event_seq = 0
     if portal_open:
-        # Get all player IDs that have been drafted
-        drafted_player_ids = DraftPick.objects.filter(player__isnull=False).values_list('player_id', flat=True)
-        # Get players not in that list
-        available_players = Player.objects.exclude(id__in=drafted_player_ids).order_by('last_name', 'first_name')
-        # Get players drafted by this team
-        drafted_picks = DraftPick.objects.filter(team=team, player__isnull=False).select_related('player').order_by('round', 'pick')
-        drafted_players = [pick.player for pick in drafted_picks]
+        # Live updates continue from the last event before the page was read
+        draft_event_seq = draft_events.latest_seq()
+        # Get players drafted by this team, in pick order, from the shared draft state
+        state = draft_states.get()
+        team_player_ids = state.team_player_ids(team.id)
+        players_by_id = Player.objects.in_bulk(team_player_ids)
+        drafted_players = [players_by_id[player_id] for player_id in team_player_ids if player_id in players_by_id]
         # Get starred players for this team (in order)
         starred_picks = StarredDraftPick.objects.filter(team=team).select_related('player').order_by('order')
         starred_players = [pick.player for pick in starred_picks]
@@ -2460,17 +2439,13 @@ def team_detail_view(request, team_secret):
         player_ranking_status = 'not_started'
 
         if team.manager:
-            try:
-                player_ranking = PlayerRanking.objects.get(manager=team.manager)
-                ranking_data = json.loads(player_ranking.ranking)
-                if len(ranking_data) == 0:
-                    player_ranking_status = 'not_started'
-                elif len(ranking_data) < expected_player_count:
-                    player_ranking_status = 'in_progress'
-                else:
-                    player_ranking_status = 'completed'
-            except PlayerRanking.DoesNotExist:
+            ranked_count = rankings.manager_ranking_length(rankings.KIND_PLAYER, team.manager)
+            if ranked_count == 0:
                 player_ranking_status = 'not_started'
+            elif ranked_count < expected_player_count:
+                player_ranking_status = 'in_progress'
+            else:
+                player_ranking_status = 'completed'
 
         checklist_items.append({
             'title': 'Rank All Players',
@@ -2485,17 +2460,13 @@ def team_detail_view(request, team_secret):
         daughter_ranking_status = 'not_started'
 
         if team.manager:
-            try:
-                daughter_ranking = ManagerDaughterRanking.objects.get(manager=team.manager)
-                ranking_data = json.loads(daughter_ranking.ranking)
-                if len(ranking_data) == 0:
-                    daughter_ranking_status = 'not_started'
-                elif len(ranking_data) < total_daughters:
-                    daughter_ranking_status = 'in_progress'
-                else:
-                    daughter_ranking_status = 'completed'
-            except ManagerDaughterRanking.DoesNotExist:
+            ranked_count = rankings.manager_ranking_length(rankings.KIND_DAUGHTER, team.manager)
+            if ranked_count == 0:
                 daughter_ranking_status = 'not_started'
+            elif ranked_count < total_daughters:
+                daughter_ranking_status = 'in_progress'
+            else:
+                daughter_ranking_status = 'completed'
 
         checklist_items.append({
             'title': "Rank Managers' Daughters",
@@ -2513,17 +2484,13 @@ def team_detail_view(request, team_secret):
 
         sibling_ranking_status = 'not_started'
         if team.manager:
-            try:
-                sibling_ranking = SiblingRanking.objects.get(manager=team.manager)
-                ranking_data = json.loads(sibling_ranking.ranking)
-                if len(ranking_data) == 0:
-                    sibling_ranking_status = 'not_started'
-                elif len(ranking_data) < sibling_together_count:
-                    sibling_ranking_status = 'in_progress'
-                else:
-                    sibling_ranking_status = 'completed'
-            except SiblingRanking.DoesNotExist:
+            ranked_count = rankings.manager_ranking_length(rankings.KIND_SIBLING, team.manager)
+            if ranked_count == 0:
                 sibling_ranking_status = 'not_started'
+            elif ranked_count < sibling_together_count:
+                sibling_ranking_status = 'in_progress'
+            else:
+                sibling_ranking_status = 'completed'
 
         checklist_items.append({
             'title': 'Rank Siblings Who Want to Stay Together',
@@ -2541,21 +2508,22 @@ def team_detail_view(request, team_secret):
     background_checks = BackgroundCheck.objects.filter(team=team).select_related('player').order_by('last_name', 'first_name')
 
     # Get visibility settings
-    show_preseason = GeneralSetting.objects.filter(key='show_preseason_items').first()
-    show_testing = GeneralSetting.objects.filter(key='show_testing_items').first()
+    show_preseason = general_settings.get_bool('show_preseason_items', True)
+    show_testing = general_settings.get_bool('show_testing_items', True)
 
     context = {
         'team': team,
         'players': players,
         'checklist_items': checklist_items,
         'portal_open': portal_open,
-        'available_players': available_players,
+        'draft_event_seq': draft_event_seq,
+        'rankings_released': general_settings.get_bool('player_rankings_public'),
         'drafted_players': drafted_players,
         'starred_player_ids': starred_player_ids,
         'starred_players': starred_players,
         'background_checks': background_checks,
-        'show_preseason_items': show_preseason.value.lower() == 'true' if show_preseason else True,
-        'show_testing_items': show_testing.value.lower() == 'true' if show_testing else True,
+        'show_preseason_items': show_preseason,
+        'show_testing_items': show_testing,
     }
     return render(request, 'players/team_detail.html', context)
 
@@ -2563,8 +2531,7 @@ def team_detail_view(request, team_secret):
 def roster_view(request, team_secret, roster_id):
     """View and edit a specific roster"""
     from django.shortcuts import render, get_object_or_404
-    from .models import Roster, Team, GeneralSetting
-    import pytz
+    from .models import Roster, Team
 
     # Get the team by manager_secret
     team = get_object_or_404(Team, manager_secret=team_secret)
@@ -2573,8 +2540,7 @@ def roster_view(request, team_secret, roster_id):
     roster = get_object_or_404(Roster, id=roster_id, team=team)
 
     # Get display timezone
-    display_tz_setting = GeneralSetting.objects.filter(key='display_timezone').first()
-    display_tz = pytz.timezone(display_tz_setting.value) if display_tz_setting else pytz.UTC
+    display_tz = get_display_timezone()
 
     # Convert event timestamp to display timezone
     event_time_display = roster.event.timestamp.astimezone(display_tz) if roster.event else None
@@ -2591,21 +2557,13 @@ def roster_view(request, team_secret, roster_id):
     }
 
     # Get division settings
-    allow_four_outfielders_setting = GeneralSetting.objects.filter(key='allow_four_outfielders').first()
-    allow_four_outfielders = allow_four_outfielders_setting.value.lower() == 'true' if allow_four_outfielders_setting else False
-
-    allow_rover_position_setting = GeneralSetting.objects.filter(key='allow_rover_position').first()
-    allow_rover_position = allow_rover_position_setting.value.lower() == 'true' if allow_rover_position_setting else False
-
-    innings_per_game_setting = GeneralSetting.objects.filter(key='innings_per_game').first()
-    innings_per_game = int(innings_per_game_setting.value) if innings_per_game_setting else 6
-
-    allow_benched_players_setting = GeneralSetting.objects.filter(key='allow_benched_players').first()
-    allow_benched_players = allow_benched_players_setting.value.lower() == 'true' if allow_benched_players_setting else False
+    allow_four_outfielders = general_settings.get_bool('allow_four_outfielders')
+    allow_rover_position = general_settings.get_bool('allow_rover_position')
+    innings_per_game = general_settings.get_int('innings_per_game', 6)
+    allow_benched_players = general_settings.get_bool('allow_benched_players')
 
     # Get infield positions setting
-    infield_positions_setting = GeneralSetting.objects.filter(key='infield_positions').first()
-    infield_positions = json.loads(infield_positions_setting.value) if infield_positions_setting and infield_positions_setting.value else ['C', '1B', '2B', '3B', 'SS', 'P']
+    infield_positions = general_settings.get_json('infield_positions', ['C', '1B', '2B', '3B', 'SS', 'P'])
 
     # Calculate if team has enough players to show 4 outfielders
     # Base positions: 6 infield (C, 1B, 2B, 3B, SS, P) + 3 outfield (LF, CF, RF) = 9
@@ -2756,8 +2714,7 @@ def get_previous_games(request, team_secret, roster_id):
     """Get list of previous games with rosters for this team"""
     from django.shortcuts import get_object_or_404
     from django.http import JsonResponse
-    from .models import Roster, Team, GeneralSetting
-    import pytz
+    from .models import Roster, Team
 
     # Get the team by manager_secret
     team = get_object_or_404(Team, manager_secret=team_secret)
@@ -2767,8 +2724,7 @@ def get_previous_games(request, team_secret, roster_id):
     current_event = current_roster.event
 
     # Get display timezone
-    display_tz_setting = GeneralSetting.objects.filter(key='display_timezone').first()
-    display_tz = pytz.timezone(display_tz_setting.value) if display_tz_setting else pytz.UTC
+    display_tz = get_display_timezone()
 
     # Find all rosters for this team where the event timestamp is before the current event
     previous_rosters = Roster.objects.filter(
@@ -2917,6 +2873,61 @@ def toggle_star_player_view(request, team_secret):
     return JsonResponse({'success': False, 'error': 'Invalid request method'}, status=400)
 
 
+@require_http_methods(["GET"])
+def team_available_players_view(request, team_secret):
+    """
+    One page of the players not yet drafted, for the draft pool of a team's
+    page while the draft portal is open (see players/available_pool.py for the
+    query parameters).  The team's starred players are listed separately, so
+    they are left out.  Consensus ranks, and sorting by them, are only
+    available once the player rankings are released to managers.
+    """
+    try:
+        team = Team.objects.get(manager_secret=team_secret)
+    except Team.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Team not found'}, status=404)
+
+    if general_settings.get('open_draft_portal_to_managers') != 'true':
+        return JsonResponse({'success': False, 'error': 'The draft portal is not open'}, status=403)
+
+    rankings_released = general_settings.get_bool('player_rankings_public')
+    try:
+        query = available_pool.parse_query(request.GET)
+        if query.sort == available_pool.SORT_RANK and not rankings_released:
+            raise ValueError('Player rankings have not been released')
+        starred_ids = StarredDraftPick.objects.filter(team=team).values_list('player_id', flat=True)
+        query = query._replace(exclude=query.exclude.union(starred_ids))
+        pool_page = available_pool.page(query, with_ranks=rankings_released)
+    except ValueError as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        }, status=400)
+
+    # Fields of the details dialog, for just the players on this page
+    details = Player.objects.in_bulk([player['id'] for player in pool_page['players']])
+    for player in pool_page['players']:
+        detail = details.get(player['id'])
+        if detail is None:
+            continue
+        player.update({
+            'history': detail.history,
+            'birthday': str(detail.birthday) if detail.birthday else None,
+            'school': detail.school,
+            'jersey_size': detail.jersey_size,
+            'parent_email_1': detail.parent_email_1,
+            'parent_phone_1': detail.parent_phone_1,
+            'parent_email_2': detail.parent_email_2,
+            'parent_phone_2': detail.parent_phone_2,
+            'manager_volunteer_name': detail.manager_volunteer_name,
+        })
+
+    return JsonResponse({
+        'success': True,
+        **pool_page
+    })
+
+
 @csrf_exempt
 def save_starred_order_view(request, team_secret):
     """Save the order of starred players for a team"""
@@ -2997,8 +3008,8 @@ def managers_list_view(request):
     manager_team_mismatch = total_managers != total_teams
 
     # Get visibility settings
-    show_preseason = GeneralSetting.objects.filter(key='show_preseason_items').first()
-    show_testing = GeneralSetting.objects.filter(key='show_testing_items').first()
+    show_preseason = general_settings.get_bool('show_preseason_items', True)
+    show_testing = general_settings.get_bool('show_testing_items', True)
 
     context = {
         'page_obj': page_obj,
@@ -3009,8 +3020,8 @@ def managers_list_view(request):
         'total_teams': total_teams,
         'manager_team_mismatch': manager_team_mismatch,
         'unassigned_teams': unassigned_teams,
-        'show_preseason_items': show_preseason.value.lower() == 'true' if show_preseason else True,
-        'show_testing_items': show_testing.value.lower() == 'true' if show_testing else True,
+        'show_preseason_items': show_preseason,
+        'show_testing_items': show_testing,
     }
     return render(request, 'players/managers_list.html', context)
 
@@ -3147,8 +3158,8 @@ def teams_list_view(request):
     all_teams = Team.objects.select_related('manager').filter(manager__isnull=False).order_by('name')
 
     # Get visibility settings
-    show_preseason = GeneralSetting.objects.filter(key='show_preseason_items').first()
-    show_testing = GeneralSetting.objects.filter(key='show_testing_items').first()
+    show_preseason = general_settings.get_bool('show_preseason_items', True)
+    show_testing = general_settings.get_bool('show_testing_items', True)
 
     context = {
         'page_obj': page_obj,
@@ -3158,8 +3169,8 @@ def teams_list_view(request):
         'total_teams': Team.objects.count(),
         'unassigned_managers': unassigned_managers,
         'all_teams': all_teams,
-        'show_preseason_items': show_preseason.value.lower() == 'true' if show_preseason else True,
-        'show_testing_items': show_testing.value.lower() == 'true' if show_testing else True,
+        'show_preseason_items': show_preseason,
+        'show_testing_items': show_testing,
     }
     return render(request, 'players/teams_list.html', context)
 
@@ -3170,6 +3181,8 @@ def unassign_practice_slots(request):
         try:
             # Remove all practice slot assignments from teams
             updated_count = Team.objects.filter(practice_slot__isnull=False).update(practice_slot=None)
+            # QuerySet.update() skips post_save, so tell the validation engine directly
+            validation_engine.mark_dirty(Team)
 
             return JsonResponse({
                 'success': True,
@@ -3290,6 +3303,25 @@ def team_delete_view(request, pk):
     return render(request, 'players/team_confirm_delete.html', context)
 
 
+def _with_player_names(ranking_items):
+    """Ranking items ({'player_id', ...}) with each player's 'name' and 'is_daughter' added, skipping deleted players"""
+    ranking_items = [item for item in ranking_items if isinstance(item, dict) and str(item.get('player_id', '')).isdigit()]
+    players = Player.objects.in_bulk([int(item['player_id']) for item in ranking_items])
+    daughter_ids = set(Manager.objects.filter(daughter__in=players.values()).values_list('daughter_id', flat=True))
+
+    named_items = []
+    for item in ranking_items:
+        player = players.get(int(item['player_id']))
+        if player is None:
+            continue
+        named_items.append({
+            **item,
+            'name': f"{player.first_name} {player.last_name}",
+            'is_daughter': player.id in daughter_ids,
+        })
+    return named_items
+
+
 def player_rankings_view(request):
     """Create or update player rankings (dynamic count based on number of teams × 2)"""
     # Get team_secret from URL parameter
@@ -3316,11 +3348,8 @@ def player_rankings_view(request):
             # Parse the comma-separated IDs
             player_ids = [int(pid) for pid in rankings_data.split(',') if pid]
 
-            # Create a JSON structure with rank and player ID
-            rankings_json = json.dumps([
-                {"rank": idx + 1, "player_id": player_id}
-                for idx, player_id in enumerate(player_ids)
-            ])
+            # Store the player IDs in ranked order (packed format, see players/ranking_codec.py)
+            rankings_json = ranking_codec.encode(player_ids)
 
             # Update or create ranking for this manager (ensures only one ranking per manager)
             if manager:
@@ -3341,30 +3370,14 @@ def player_rankings_view(request):
         else:
             messages.error(request, 'No rankings data provided.')
 
-    # Load existing rankings for this manager
-    existing_ranking = None
-    ranked_player_ids = []
-    if manager:
-        try:
-            existing_ranking = PlayerRanking.objects.get(manager=manager)
-            # Parse the JSON to get player IDs in order
-            rankings_data = json.loads(existing_ranking.ranking)
-            ranked_player_ids = [item['player_id'] for item in rankings_data]
-        except PlayerRanking.DoesNotExist:
-            pass
-
-    # Get all players for the dropdown, ordered by name
-    all_players = Player.objects.all().order_by('last_name', 'first_name')
-
-    # Get IDs of all players who are managers' daughters
-    manager_daughter_ids = list(Manager.objects.filter(daughter__isnull=False).values_list('daughter_id', flat=True))
+    # Load existing rankings for this manager (players in ranked order); the
+    # available players are loaded page by page from ranking_pool_api_view
+    ranked_players = _with_player_names(rankings.manager_entries(rankings.KIND_PLAYER, manager))
 
     context = {
-        'all_players': all_players,
         'team_secret': team_secret,
         'manager': manager,
-        'ranked_player_ids': json.dumps(ranked_player_ids),  # Pass as JSON for JavaScript
-        'manager_daughter_ids': json.dumps(manager_daughter_ids),  # Pass as JSON for JavaScript
+        'ranked_players': json.dumps(ranked_players),  # Pass as JSON for JavaScript
         'required_rankings': required_rankings,  # Dynamic count based on number of teams × 2
         'num_teams': num_teams
     }
@@ -3394,8 +3407,8 @@ def manager_daughter_rankings_view(request):
             try:
                 rankings_list = json.loads(rankings_data)
 
-                # Save the rankings as JSON
-                rankings_json = json.dumps(rankings_list)
+                # Save the rankings packed: player IDs in rank order plus their rounds
+                rankings_json = ranking_codec.encode_items(rankings_list, with_rounds=True)
 
                 # Update or create ranking for this manager (if manager exists)
                 if manager:
@@ -3423,7 +3436,6 @@ def manager_daughter_rankings_view(request):
             messages.error(request, 'No rankings data provided.')
 
     # Load existing rankings for this manager OR unsaved rankings from session
-    existing_ranking = None
     existing_rankings_data = []
 
     # Check if there are unsaved rankings in the session (from failed save)
@@ -3434,19 +3446,12 @@ def manager_daughter_rankings_view(request):
             pass
     # Otherwise, load saved rankings for this manager
     elif manager:
-        try:
-            existing_ranking = ManagerDaughterRanking.objects.get(manager=manager)
-            # Parse the JSON to get full ranking data (player_id, rank, round)
-            existing_rankings_data = json.loads(existing_ranking.ranking)
-        except ManagerDaughterRanking.DoesNotExist:
-            pass
+        # Full ranking data (player_id, rank, round)
+        existing_rankings_data = rankings.manager_entries(rankings.KIND_DAUGHTER, manager)
 
-    # Get only players who are managers' daughters, ordered by name
-    manager_daughter_ids = Manager.objects.filter(daughter__isnull=False).values_list('daughter_id', flat=True)
-    all_players = Player.objects.filter(id__in=manager_daughter_ids).order_by('last_name', 'first_name')
-
-    # Count the total number of manager daughter players (for dynamic requirement)
-    manager_daughter_count = len(manager_daughter_ids)
+    # Count the manager daughter players (for dynamic requirement); they are
+    # loaded page by page from ranking_pool_api_view
+    manager_daughter_count = rankings.ranking_pool(rankings.KIND_DAUGHTER).count()
 
     # Calculate number of draft rounds: (total players / total teams), rounded up
     import math
@@ -3455,11 +3460,9 @@ def manager_daughter_rankings_view(request):
     num_rounds = math.ceil(total_players / total_teams) if total_teams > 0 else 1
 
     context = {
-        'all_players': all_players,
         'team_secret': team_secret,
         'manager': manager,
-        'existing_rankings_data': json.dumps(existing_rankings_data),  # Pass full ranking data as JSON for JavaScript
-        'manager_daughter_ids': json.dumps(list(manager_daughter_ids)),  # Pass as JSON for JavaScript
+        'existing_rankings_data': json.dumps(_with_player_names(existing_rankings_data)),  # Pass full ranking data as JSON for JavaScript
         'manager_daughter_count': manager_daughter_count,  # Pass the count for dynamic requirements
         'num_rounds': num_rounds  # Number of draft rounds
     }
@@ -3489,8 +3492,8 @@ def sibling_rankings_view(request):
             try:
                 rankings_list = json.loads(rankings_data)
 
-                # Save the rankings as JSON
-                rankings_json = json.dumps(rankings_list)
+                # Save the rankings packed: player IDs in rank order plus their rounds
+                rankings_json = ranking_codec.encode_items(rankings_list, with_rounds=True)
 
                 # Update or create ranking for this manager (if manager exists)
                 if manager:
@@ -3518,7 +3521,6 @@ def sibling_rankings_view(request):
             messages.error(request, 'No rankings data provided.')
 
     # Load existing rankings for this manager OR unsaved rankings from session
-    existing_ranking = None
     existing_rankings_data = []
 
     # Check if there are unsaved rankings in the session (from failed save)
@@ -3529,19 +3531,8 @@ def sibling_rankings_view(request):
             pass
     # Otherwise, load saved rankings for this manager
     elif manager:
-        try:
-            existing_ranking = SiblingRanking.objects.get(manager=manager)
-            # Parse the JSON to get full ranking data (player_id, rank, round)
-            existing_rankings_data = json.loads(existing_ranking.ranking)
-        except SiblingRanking.DoesNotExist:
-            pass
-
-    # Get players who have siblings AND do NOT request separation from siblings
-    all_players = Player.objects.filter(
-        requests_separate_team_from_sibling=False
-    ).exclude(
-        siblings__isnull=True
-    ).order_by('last_name', 'first_name')
+        # Full ranking data (player_id, rank, round)
+        existing_rankings_data = rankings.manager_entries(rankings.KIND_SIBLING, manager)
 
     # Get players who have siblings AND DO request separation (for informational display)
     separation_players = Player.objects.filter(
@@ -3550,8 +3541,9 @@ def sibling_rankings_view(request):
         siblings__isnull=True
     ).order_by('last_name', 'first_name')
 
-    # Calculate the count of siblings wanting to stay together
-    sibling_count = all_players.count()
+    # Calculate the count of siblings wanting to stay together; they are loaded
+    # page by page from ranking_pool_api_view
+    sibling_count = rankings.ranking_pool(rankings.KIND_SIBLING).count()
 
     # Calculate number of draft rounds: (total players / total teams), rounded up
     import math
@@ -3559,16 +3551,11 @@ def sibling_rankings_view(request):
     total_teams = Team.objects.count()
     num_rounds = math.ceil(total_players / total_teams) if total_teams > 0 else 1
 
-    # Get IDs of all players who are managers' daughters
-    manager_daughter_ids = list(Manager.objects.filter(daughter__isnull=False).values_list('daughter_id', flat=True))
-
     context = {
-        'all_players': all_players,
         'separation_players': separation_players,
         'team_secret': team_secret,
         'manager': manager,
-        'existing_rankings_data': json.dumps(existing_rankings_data),  # Pass full ranking data as JSON for JavaScript
-        'manager_daughter_ids': json.dumps(manager_daughter_ids),  # Pass as JSON for JavaScript
+        'existing_rankings_data': json.dumps(_with_player_names(existing_rankings_data)),  # Pass full ranking data as JSON for JavaScript
         'sibling_count': sibling_count,  # Pass the count for dynamic requirements
         'num_rounds': num_rounds  # Number of draft rounds
     }
@@ -3577,60 +3564,16 @@ def sibling_rankings_view(request):
 
 def sibling_rankings_analyze_view(request):
     """Analyze sibling rankings with Borda count and suggested draft rounds"""
-    from .models import SiblingRanking, Manager, Player
-    from collections import defaultdict
-    import statistics
-
-    # Get all sibling rankings
-    all_rankings = SiblingRanking.objects.all()
-    player_scores = defaultdict(list)
-    player_rounds = defaultdict(list)  # Track which round each manager put the player in
-    max_rank = 0
-
-    # Process all rankings to collect scores and rounds for each player
-    for ranking in all_rankings:
-        rankings_data = json.loads(ranking.ranking)
-        for item in rankings_data:
-            player_id = item.get('player_id')
-            rank = item.get('rank')
-            round_num = item.get('round')  # Get the draft round
-            if player_id and rank:
-                player_scores[player_id].append(rank)
-                max_rank = max(max_rank, rank)
-                if round_num:
-                    player_rounds[player_id].append(round_num)
-
-    # Calculate Borda count and suggested round for each player
-    player_stats = []
-    for player_id, ranks in player_scores.items():
-        # Borda count: rank 1 gets max_rank points, rank 2 gets max_rank-1 points, etc.
-        borda_count = sum(max_rank - rank + 1 for rank in ranks)
-        avg_rank = sum(ranks) / len(ranks)
-
-        # Calculate suggested draft round (median of all rounds managers assigned)
-        rounds = player_rounds.get(player_id, [])
-        if rounds:
-            suggested_round = round(statistics.median(rounds))
-        else:
-            suggested_round = None
-
-        try:
-            player = Player.objects.get(id=player_id)
-            player_stats.append({
-                'player': player,
-                'average_rank': avg_rank,
-                'borda_count': borda_count,
-                'num_rankings': len(ranks),
-                'suggested_round': suggested_round
-            })
-        except Player.DoesNotExist:
-            continue
-
-    # Sort by Borda count (higher is better), then by average rank (lower is better)
-    player_stats.sort(key=lambda x: (-x['borda_count'], x['average_rank']))
+    from .models import SiblingRanking, Manager
 
+    # Borda count, average rank and suggested draft round (median of the rounds
+    # managers assigned) for each player, in the order of the consensus method
+    # picked in general settings (by default Borda count, higher is better, then
+    # average rank, lower is better)
     # Show all sibling rankings
-    top_players = player_stats
+    top_players = ranking_aggregates.get(rankings.KIND_SIBLING).top(
+        with_rounds=True, method=ranking_consensus.configured_method()
+    )
 
     # Get managers who haven't submitted rankings
     all_managers = Manager.objects.all()
@@ -3875,15 +3818,42 @@ def assign_practice_slots_to_teams_view(request):
         }, status=500)
 
 
+def _draft_grid(state):
+    """
+    Rounds, picks and the snake-order team of every pick of the current draft,
+    as the draft board and its CSV export lay them out, from the draft state.
+    """
+    rounds = list(range(1, state.total_rounds + 1))
+    picks = list(range(1, state.picks_per_round + 1))
+
+    # Map round -> pick -> Team, with what the board shows about each team
+    assignments = state.pick_assignments()
+    team_ids = {team_id for round_picks in assignments.values() for team_id in round_picks.values()}
+    teams = Team.objects.select_related('manager', 'practice_slot').in_bulk(team_ids)
+    pick_assignments = {
+        round_num: {pick_num: teams[team_id] for pick_num, team_id in round_picks.items() if team_id in teams}
+        for round_num, round_picks in assignments.items()
+    }
+
+    return {
+        'rounds': rounds,
+        'picks': picks,
+        'pick_assignments': pick_assignments,
+        # Rounds after the draftable ones are hat pick rounds
+        'hat_pick_rounds': set(range(state.rounds_draftable + 1, state.total_rounds + 1)),
+        # A final round with partial picks follows the regular rounds
+        'has_final_round': bool(state.final_round_number),
+        'final_round_number': state.final_round_number,
+        'final_round_pick_count': state.final_round_pick_count,
+        'final_round_valid_picks': list(range(1, state.final_round_pick_count + 1)),
+    }
+
+
 def run_draft_view(request):
     """Run the draft - display grid of rounds and picks"""
 
     # Get the draft portal status
-    try:
-        portal_setting = GeneralSetting.objects.get(key='open_draft_portal_to_managers')
-        portal_open = portal_setting.value == 'true'
-    except GeneralSetting.DoesNotExist:
-        portal_open = False
+    portal_open = general_settings.get('open_draft_portal_to_managers') == 'true'
 
     # Get the most recent draft
     try:
@@ -3892,173 +3862,53 @@ def run_draft_view(request):
         messages.error(request, 'No draft found. Please create a draft first.')
         return redirect('players:edit_draft')
 
-    # Create ranges for rounds and picks
-    total_rounds = draft.rounds_draftable + draft.rounds_nondraftable
-    rounds = list(range(1, total_rounds + 1))
-    picks = list(range(1, draft.picks_per_round + 1))
-
-    # Parse the order field to get team objects
-    order_data = draft.order.strip()
-    if order_data.startswith('['):
-        team_ids = json.loads(order_data)
-    else:
-        team_ids = [int(tid.strip()) for tid in order_data.split(',') if tid.strip()]
-
-    # Get team objects in order
-    teams_dict = {team.id: team for team in Team.objects.filter(id__in=team_ids)}
-    ordered_teams = [teams_dict[tid] for tid in team_ids]
-
-    # Determine how many picks are in the final round
-    final_round_pick_count = draft.final_round_picks if draft.final_round_picks else draft.picks_per_round
-    final_round_number_calc = draft.rounds_draftable + draft.rounds_nondraftable
-
-    # Create a mapping of round -> pick -> team for snake draft
-    pick_assignments = {}
-    for round_num in rounds:
-        pick_assignments[round_num] = {}
-
-        # Determine how many picks this round should have
-        if round_num == final_round_number_calc:
-            # Final round - only assign teams for the limited number of picks
-            picks_for_this_round = range(1, final_round_pick_count + 1)
-        else:
-            # Regular round - all picks
-            picks_for_this_round = picks
-
-        if round_num % 2 == 1:  # Odd rounds: normal order
-            for pick_num in picks_for_this_round:
-                team_index = pick_num - 1
-                pick_assignments[round_num][pick_num] = ordered_teams[team_index]
-        else:  # Even rounds: reversed order (snake draft)
-            for pick_num in picks_for_this_round:
-                team_index = len(ordered_teams) - pick_num
-                pick_assignments[round_num][pick_num] = ordered_teams[team_index]
-
-    # Load existing draft picks - structure as nested dict like pick_assignments
-    existing_picks = DraftPick.objects.select_related('player', 'team').all()
-    draft_picks_map = {}
-    for draft_pick in existing_picks:
-        if draft_pick.round not in draft_picks_map:
-            draft_picks_map[draft_pick.round] = {}
-        # Only add pick to map if player is assigned
-        if draft_pick.player:
-            draft_picks_map[draft_pick.round][draft_pick.pick] = {
-                'player_name': f"{draft_pick.player.first_name} {draft_pick.player.last_name}",
-                'player_id': draft_pick.player.id
-            }
+    # Picks and undrafts are checked against the last draft event the page knew of
+    draft_event_seq = draft_events.latest_seq()
 
-    # Check if there's a final round with partial picks
-    has_final_round = False
-    final_round_number = 0
-
-    if draft.final_round_draft_order:
-        has_final_round = True
-        total_rounds = draft.rounds_draftable + draft.rounds_nondraftable
-        final_round_number = total_rounds + 1
-
-        # Parse final round team IDs
-        final_round_team_ids = [int(tid) for tid in draft.final_round_draft_order.split(',') if tid]
-
-        # Get team objects for final round
-        final_teams_dict = {team.id: team for team in Team.objects.filter(id__in=final_round_team_ids)}
-
-        # Add final round to pick_assignments
-        pick_assignments[final_round_number] = {}
-        for pick_num, team_id in enumerate(final_round_team_ids, start=1):
-            pick_assignments[final_round_number][pick_num] = final_teams_dict[team_id]
-
-    # Determine which rounds are hat pick rounds
-    hat_pick_rounds = set(range(draft.rounds_draftable + 1, total_rounds + 1))
+    # The pick grid and picks come from the shared in-memory draft state
+    state = draft_states.get()
+    grid = _draft_grid(state)
+    draft_picks_map = state.board()
 
     # Get manager daughter rankings data for modal
-    from collections import defaultdict
-    import statistics
-
-    all_rankings = ManagerDaughterRanking.objects.all()
-    player_scores = defaultdict(list)
-    player_rounds = defaultdict(list)
-    max_rank = 0
-
-    for ranking in all_rankings:
-        rankings_data = json.loads(ranking.ranking)
-        for item in rankings_data:
-            player_id = item.get('player_id')
-            rank = item.get('rank')
-            round_num = item.get('round')
-            if player_id and rank:
-                player_scores[player_id].append(rank)
-                max_rank = max(max_rank, rank)
-                if round_num:
-                    player_rounds[player_id].append(round_num)
-
-    player_stats = []
-    for player_id, ranks in player_scores.items():
-        borda_count = sum(max_rank - rank + 1 for rank in ranks)
-        avg_rank = sum(ranks) / len(ranks)
-        player_round_nums = player_rounds.get(player_id, [])
-        suggested_round = round(statistics.median(player_round_nums)) if player_round_nums else None
-
-        try:
-            player = Player.objects.get(id=player_id)
-            player_stats.append({
-                'player': player,
-                'average_rank': avg_rank,
-                'borda_count': borda_count,
-                'num_rankings': len(ranks),
-                'suggested_round': suggested_round
-            })
-        except Player.DoesNotExist:
-            continue
-
-    player_stats.sort(key=lambda x: (-x['borda_count'], x['average_rank']))
-    top_players = player_stats[:20]
+    top_players = ranking_aggregates.get(rankings.KIND_DAUGHTER).top(limit=20, with_rounds=True)
 
     all_managers = Manager.objects.all()
     managers_with_rankings = ManagerDaughterRanking.objects.values_list('manager_id', flat=True)
     managers_without_rankings = all_managers.exclude(id__in=managers_with_rankings)
 
     # Check if all manager's daughters have been drafted
-    managers_with_daughters = Manager.objects.filter(daughter__isnull=False)
-    undrafted_daughters = []
-
-    for manager in managers_with_daughters:
-        daughter = manager.daughter
-        # Check if daughter has been drafted (has a draft pick assigned)
-        is_drafted = DraftPick.objects.filter(player=daughter).exists()
-        if not is_drafted:
-            undrafted_daughters.append({
-                'manager': manager,
-                'daughter': daughter
-            })
+    undrafted_daughters = [{
+        'manager': {'first_name': daughter.manager_first_name, 'last_name': daughter.manager_last_name},
+        'daughter': {'id': daughter.player_id, 'first_name': daughter.first_name, 'last_name': daughter.last_name},
+    } for daughter in state.undrafted_daughters()]
 
     # Calculate daughters drafted counts
-    total_daughters_count = managers_with_daughters.count()
+    total_daughters_count = len(state.daughters)
     daughters_drafted_count = total_daughters_count - len(undrafted_daughters)
 
-    # Create a list of valid pick numbers for the final round
-    final_round_pick_count = draft.final_round_picks if draft.final_round_picks else draft.picks_per_round
-    final_round_valid_picks = list(range(1, final_round_pick_count + 1))
-
     # Check if any players are currently assigned to teams
     players_with_teams_count = Player.objects.filter(team__isnull=False).count()
 
     # Get actual player counts for accurate display
-    total_players = Player.objects.count()
-    drafted_players_count = DraftPick.objects.filter(player__isnull=False).count()
+    total_players = state.player_count()
+    drafted_players_count = state.drafted_count()
     remaining_players_count = total_players - drafted_players_count
 
     context = {
         'draft': draft,
-        'rounds': rounds,
-        'picks': picks,
-        'pick_assignments': pick_assignments,
-        'hat_pick_rounds': hat_pick_rounds,
+        'rounds': grid['rounds'],
+        'picks': grid['picks'],
+        'pick_assignments': grid['pick_assignments'],
+        'hat_pick_rounds': grid['hat_pick_rounds'],
         'draft_picks_map': draft_picks_map,
+        'draft_event_seq': draft_event_seq,
+        'pick_clock_seconds': draft.pick_clock_seconds,
         'show_grid': True,
-        'has_final_round': has_final_round,
-        'final_round_number': final_round_number,
-        'final_round_picks': final_round_pick_count,
-        'final_round_valid_picks': final_round_valid_picks,
+        'has_final_round': grid['has_final_round'],
+        'final_round_number': grid['final_round_number'],
+        'final_round_picks': grid['final_round_pick_count'],
+        'final_round_valid_picks': grid['final_round_valid_picks'],
         'portal_open': portal_open,
         'top_players': top_players,
         'managers_without_rankings': managers_without_rankings,
@@ -4073,11 +3923,11 @@ def run_draft_view(request):
     }
 
     # Get visibility settings
-    show_preseason = GeneralSetting.objects.filter(key='show_preseason_items').first()
-    show_testing = GeneralSetting.objects.filter(key='show_testing_items').first()
+    show_preseason = general_settings.get_bool('show_preseason_items', True)
+    show_testing = general_settings.get_bool('show_testing_items', True)
 
-    context['show_preseason_items'] = show_preseason.value.lower() == 'true' if show_preseason else True
-    context['show_testing_items'] = show_testing.value.lower() == 'true' if show_testing else True
+    context['show_preseason_items'] = show_preseason
+    context['show_testing_items'] = show_testing
 
     return render(request, 'players/run_draft.html', context)
 
@@ -4087,87 +3937,21 @@ def export_draft_board(request):
     import csv
     from django.http import HttpResponse
 
-    # Get the most recent draft
-    try:
-        draft = Draft.objects.latest('created_at')
-    except Draft.DoesNotExist:
+    # The pick grid and picks of the most recent draft come from the shared
+    # in-memory draft state
+    state = draft_states.get()
+    if not state.has_draft:
         messages.error(request, 'No draft found. Please create a draft first.')
         return redirect('players:edit_draft')
 
-    # Create ranges for rounds and picks
-    total_rounds = draft.rounds_draftable + draft.rounds_nondraftable
-    rounds = list(range(1, total_rounds + 1))
-    picks = list(range(1, draft.picks_per_round + 1))
-
-    # Parse the order field to get team objects
-    order_data = draft.order.strip()
-    if order_data.startswith('['):
-        team_ids = json.loads(order_data)
-    else:
-        team_ids = [int(tid.strip()) for tid in order_data.split(',') if tid.strip()]
-
-    # Get team objects in order
-    teams_dict = {team.id: team for team in Team.objects.filter(id__in=team_ids)}
-    ordered_teams = [teams_dict[tid] for tid in team_ids]
-
-    # Determine how many picks are in the final round
-    final_round_pick_count = draft.final_round_picks if draft.final_round_picks else draft.picks_per_round
-    final_round_number_calc = draft.rounds_draftable + draft.rounds_nondraftable
-
-    # Create a mapping of round -> pick -> team for snake draft
-    pick_assignments = {}
-    for round_num in rounds:
-        pick_assignments[round_num] = {}
-
-        # Determine how many picks this round should have
-        if round_num == final_round_number_calc:
-            picks_for_this_round = range(1, final_round_pick_count + 1)
-        else:
-            picks_for_this_round = picks
-
-        if round_num % 2 == 1:  # Odd rounds: normal order
-            for pick_num in picks_for_this_round:
-                team_index = pick_num - 1
-                pick_assignments[round_num][pick_num] = ordered_teams[team_index]
-        else:  # Even rounds: reversed order (snake draft)
-            for pick_num in picks_for_this_round:
-                team_index = len(ordered_teams) - pick_num
-                pick_assignments[round_num][pick_num] = ordered_teams[team_index]
-
-    # Load existing draft picks
-    existing_picks = DraftPick.objects.select_related('player', 'team').all()
-    draft_picks_map = {}
-    for draft_pick in existing_picks:
-        if draft_pick.round not in draft_picks_map:
-            draft_picks_map[draft_pick.round] = {}
-        if draft_pick.player:
-            draft_picks_map[draft_pick.round][draft_pick.pick] = {
-                'player_name': f"{draft_pick.player.first_name} {draft_pick.player.last_name}",
-                'player_id': draft_pick.player.id
-            }
-
-    # Check if there's a final round with partial picks
-    has_final_round = False
-    final_round_number = 0
-
-    if draft.final_round_draft_order:
-        has_final_round = True
-        total_rounds = draft.rounds_draftable + draft.rounds_nondraftable
-        final_round_number = total_rounds + 1
-
-        # Parse final round team IDs
-        final_round_team_ids = [int(tid) for tid in draft.final_round_draft_order.split(',') if tid]
-
-        # Get team objects for final round
-        final_teams_dict = {team.id: team for team in Team.objects.filter(id__in=final_round_team_ids)}
-
-        # Add final round to pick_assignments
-        pick_assignments[final_round_number] = {}
-        for pick_num, team_id in enumerate(final_round_team_ids, start=1):
-            pick_assignments[final_round_number][pick_num] = final_teams_dict[team_id]
-
-    # Determine which rounds are hat pick rounds
-    hat_pick_rounds = set(range(draft.rounds_draftable + 1, total_rounds + 1))
+    grid = _draft_grid(state)
+    rounds = grid['rounds']
+    picks = grid['picks']
+    pick_assignments = grid['pick_assignments']
+    hat_pick_rounds = grid['hat_pick_rounds']
+    has_final_round = grid['has_final_round']
+    final_round_number = grid['final_round_number']
+    draft_picks_map = state.board()
 
     # Create CSV response
     response = HttpResponse(content_type='text/csv')
@@ -4187,8 +3971,7 @@ def export_draft_board(request):
     writer.writerow(header)
 
     # Write data rows
-    final_round_pick_count = draft.final_round_picks if draft.final_round_picks else draft.picks_per_round
-    final_round_valid_picks = list(range(1, final_round_pick_count + 1))
+    final_round_valid_picks = grid['final_round_valid_picks']
 
     for pick_num in picks:
         row = [str(pick_num)]
@@ -4264,47 +4047,81 @@ def toggle_draft_portal_view(request):
 
 @csrf_exempt
 def available_players_view(request):
-    """Get list of players not yet drafted"""
-    include_player_id = request.GET.get('include_player')
-
-    # Get all player IDs that have been drafted (exclude empty picks)
-    drafted_player_ids = list(DraftPick.objects.filter(player__isnull=False).values_list('player_id', flat=True))
+    """
+    Get one page of the players not yet drafted, for the pick modal of the
+    draft board (see players/available_pool.py for the query parameters).
+    The board may see each player's consensus rank.
+    """
+    try:
+        query = available_pool.parse_query(request.GET)
+        pool_page = available_pool.page(query, with_ranks=True)
+    except ValueError as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        }, status=400)
 
-    # If we're editing and need to include a specific player, remove them from drafted list
-    if include_player_id:
-        drafted_player_ids = [pid for pid in drafted_player_ids if str(pid) != str(include_player_id)]
+    return JsonResponse({
+        'success': True,
+        **pool_page
+    })
 
-    # Get all players not in the drafted list
-    available_players = Player.objects.exclude(id__in=drafted_player_ids).order_by('last_name', 'first_name')
 
-    # Build response
-    players_data = [{
-        'id': player.id,
-        'first_name': player.first_name,
-        'last_name': player.last_name,
-        'conflict': player.conflict,
-        'draftable': player.draftable,
-        'has_sibling_requirement': player.siblings.exists() and not player.requests_separate_team_from_sibling
-    } for player in available_players]
+def _draft_pick_conflict(message, round_num, pick_num, player_id=None):
+    """
+    409 response for a pick or undraft that lost to a concurrent one, with the
+    current state of the slot and of the player so the client can catch up.
+    """
+    def describe(draft_pick):
+        if draft_pick is None:
+            return None
+        return {
+            'round': draft_pick.round,
+            'pick': draft_pick.pick,
+            'player_id': draft_pick.player_id,
+            'player_name': f"{draft_pick.player.first_name} {draft_pick.player.last_name}" if draft_pick.player else None,
+            'team_name': draft_pick.team.name if draft_pick.team else None,
+        }
 
+    picks = DraftPick.objects.select_related('player', 'team')
+    player_pick = picks.filter(player_id=player_id).first() if player_id else None
     return JsonResponse({
-        'success': True,
-        'players': players_data
-    })
+        'success': False,
+        'conflict': True,
+        'error': message,
+        'slot': describe(picks.filter(round=round_num, pick=pick_num).first()),
+        'player_pick': describe(player_pick),
+        'seq': draft_events.latest_seq(),
+    }, status=409)
 
 
 @csrf_exempt
 def make_pick_view(request):
-    """Create or update a draft pick record"""
+    """
+    Create or update a draft pick record.
+
+    The admin board and the manager portal can submit at the same moment, so
+    picks are written one at a time under a lock on the draft row, and the
+    database allows one pick per slot and one per player.  A pick never
+    overwrites another player unless the request names her in
+    replace_player_id (editing a pick on the board).  A request may also send
+    expected_seq, the last draft event its page knows of: if the slot or the
+    player changed after it, nothing is written.  The loser of any of these
+    gets a 409 with the current state.
+    """
+    from django.db import IntegrityError, transaction
+
     if request.method != 'POST':
         return JsonResponse({'success': False, 'error': 'Invalid request method'})
 
     try:
         data = json.loads(request.body)
-        round_num = data.get('round')
-        pick_num = data.get('pick')
+        round_num = int(data.get('round'))
+        pick_num = int(data.get('pick'))
         player_id = data.get('player_id')
         team_name = data.get('team_name')
+        expected_seq = data.get('expected_seq')
+        replace_player_id = int(data['replace_player_id']) if data.get('replace_player_id') else None
 
         # Get the player
         player = Player.objects.get(id=player_id)
@@ -4312,48 +4129,59 @@ def make_pick_view(request):
         # Get the team by name
         team = Team.objects.get(name=team_name)
 
-        # Create or update the draft pick
-        draft_pick, created = DraftPick.objects.update_or_create(
-            round=round_num,
-            pick=pick_num,
-            defaults={
-                'player': player,
-                'team': team
-            }
-        )
+        try:
+            with transaction.atomic():
+                # Serialize pick writes on the draft row
+                list(Draft.objects.select_for_update().order_by('-created_at')[:1])
+
+                # Compare-and-swap on the draft version the page was showing
+                if expected_seq is not None and draft_events.conflicting_events(int(expected_seq), round_num, pick_num, [player.id]):
+                    return _draft_pick_conflict('The draft changed since this page was loaded', round_num, pick_num, player.id)
+
+                # Someone else filled the slot since this page showed it
+                slot_player_id = DraftPick.objects.filter(round=round_num, pick=pick_num).values_list('player_id', flat=True).first()
+                if slot_player_id not in (None, player.id, replace_player_id):
+                    return _draft_pick_conflict('That pick has already been made', round_num, pick_num, player.id)
+
+                if DraftPick.objects.filter(player=player).exclude(round=round_num, pick=pick_num).exists():
+                    return _draft_pick_conflict(
+                        f"{player.first_name} {player.last_name} has already been drafted", round_num, pick_num, player.id
+                    )
 
-        # Broadcast the draft pick to all connected WebSocket clients
-        from asgiref.sync import async_to_sync
-        from channels.layers import get_channel_layer
+                # Create or update the draft pick
+                draft_pick, created = DraftPick.objects.update_or_create(
+                    round=round_num,
+                    pick=pick_num,
+                    defaults={
+                        'player': player,
+                        'team': team
+                    }
+                )
 
-        channel_layer = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            'draft_updates',
-            {
-                'type': 'draft_update',
-                'player_id': player.id,
-                'player_name': f"{player.first_name} {player.last_name}",
-                'player_birthday': str(player.birthday) if player.birthday else None,
-                'player_school': player.school,
-                'player_history': player.history,
-                'player_conflict': player.conflict,
-                'player_draftable': player.draftable,
-                'team_name': team.name,
-                'team_id': team.id,
-                'round': round_num,
-                'pick': pick_num
-            }
-        )
+                # Log the draft pick and broadcast it to all connected WebSocket clients
+                event = draft_events.publish(draft_events.PICK, {
+                    **draft_events.player_fields(player),
+                    'team_name': team.name,
+                    'team_id': team.id,
+                    'round': round_num,
+                    'pick': pick_num
+                })
+        except IntegrityError:
+            # A concurrent pick took the slot or the player first
+            return _draft_pick_conflict('That pick or player was just taken', round_num, pick_num, player.id)
+
+        # Move a running pick clock on to the next pick
+        draft_clock.advance()
 
         # Check if this player is a manager's daughter
-        # A player is a manager's daughter if there's a Manager whose daughter field points to this player
-        is_managers_daughter = Manager.objects.filter(daughter=player).exists()
+        is_managers_daughter = draft_states.get().is_daughter(player.id)
 
         return JsonResponse({
             'success': True,
             'player_name': f"{player.first_name} {player.last_name}",
             'is_managers_daughter': is_managers_daughter,
-            'player_id': player.id
+            'player_id': player.id,
+            'seq': event.seq
         })
 
     except Player.DoesNotExist:
@@ -4366,73 +4194,71 @@ def make_pick_view(request):
 
 @csrf_exempt
 def undraft_pick_view(request):
-    """Delete a draft pick record"""
+    """
+    Delete a draft pick record, under the same draft lock and expected_seq
+    check as make_pick_view; undrafting a pick that is already gone is a 409.
+    """
+    from django.db import transaction
+
     if request.method != 'POST':
         return JsonResponse({'success': False, 'error': 'Invalid request method'})
 
     try:
         data = json.loads(request.body)
-        round_num = data.get('round')
-        pick_num = data.get('pick')
+        round_num = int(data.get('round'))
+        pick_num = int(data.get('pick'))
         team_name = data.get('team_name')
+        expected_seq = data.get('expected_seq')
 
         # Get the team by name
         team = Team.objects.get(name=team_name)
 
-        # Delete the draft pick if it exists
-        draft_pick = DraftPick.objects.filter(
-            round=round_num,
-            pick=pick_num,
-            team=team
-        ).first()
+        with transaction.atomic():
+            # Serialize pick writes on the draft row
+            list(Draft.objects.select_for_update().order_by('-created_at')[:1])
+
+            # Delete the draft pick if it exists
+            draft_pick = DraftPick.objects.select_related('player').filter(
+                round=round_num,
+                pick=pick_num,
+                team=team
+            ).first()
+
+            if not draft_pick:
+                return _draft_pick_conflict('That pick has already been undrafted', round_num, pick_num)
 
-        if draft_pick:
             # Save player info before deleting
             player = draft_pick.player
             player_id = player.id if player else None
-            player_name = f"{player.first_name} {player.last_name}" if player else None
-            player_birthday = str(player.birthday) if (player and player.birthday) else None
-            player_school = player.school if player else None
-            player_history = player.history if player else None
-            player_conflict = player.conflict if player else None
-            player_draftable = player.draftable if player else None
-
-            # Check if this player is a manager's daughter
-            # A player is a manager's daughter if there's a Manager whose daughter field points to this player
-            is_managers_daughter = False
-            if player:
-                is_managers_daughter = Manager.objects.filter(daughter=player).exists()
+
+            # Compare-and-swap on the draft version the page was showing
+            if expected_seq is not None and draft_events.conflicting_events(int(expected_seq), round_num, pick_num, [player_id]):
+                return _draft_pick_conflict('The draft changed since this page was loaded', round_num, pick_num, player_id)
 
             draft_pick.delete()
 
-            # Broadcast the undraft to all connected WebSocket clients
+            # Log the undraft and broadcast it to all connected WebSocket clients
+            seq = None
             if player:
-                from asgiref.sync import async_to_sync
-                from channels.layers import get_channel_layer
-
-                channel_layer = get_channel_layer()
-                async_to_sync(channel_layer.group_send)(
-                    'draft_updates',
-                    {
-                        'type': 'undraft_update',
-                        'player_id': player_id,
-                        'player_name': player_name,
-                        'player_birthday': player_birthday,
-                        'player_school': player_school,
-                        'player_history': player_history,
-                        'player_conflict': player_conflict,
-                        'player_draftable': player_draftable,
-                        'team_name': team.name,
-                        'team_id': team.id,
-                        'round': round_num,
-                        'pick': pick_num
-                    }
-                )
+                seq = draft_events.publish(draft_events.UNDRAFT, {
+                    **draft_events.player_fields(player),
+                    'team_name': team.name,
+                    'team_id': team.id,
+                    'round': round_num,
+                    'pick': pick_num
+                }).seq
+
+        # A running pick clock moves back to the undrafted pick if it is now the first empty one
+        draft_clock.advance()
+
+        # Check if this player is a manager's daughter
+        is_managers_daughter = draft_states.get().is_daughter(player_id) if player_id else False
 
         return JsonResponse({
             'success': True,
             'is_managers_daughter': is_managers_daughter,
-            'player_id': player_id
+            'player_id': player_id,
+            'seq': seq
         })
 
     except Team.DoesNotExist:
@@ -4443,18 +4269,11 @@ def undraft_pick_view(request):
 
 def undrafted_daughters_api(request):
     """Return list of undrafted manager's daughters"""
-    managers_with_daughters = Manager.objects.filter(daughter__isnull=False)
-    undrafted_daughters = []
-
-    for manager in managers_with_daughters:
-        daughter = manager.daughter
-        is_drafted = DraftPick.objects.filter(player=daughter).exists()
-        if not is_drafted:
-            undrafted_daughters.append({
-                'player_id': daughter.id,
-                'player_name': f"{daughter.first_name} {daughter.last_name}",
-                'manager_name': f"{manager.first_name} {manager.last_name}"
-            })
+    undrafted_daughters = [{
+        'player_id': daughter.player_id,
+        'player_name': f"{daughter.first_name} {daughter.last_name}",
+        'manager_name': f"{daughter.manager_first_name} {daughter.manager_last_name}"
+    } for daughter in draft_states.get().undrafted_daughters()]
 
     return JsonResponse({
         'success': True,
@@ -4462,16 +4281,70 @@ def undrafted_daughters_api(request):
     })
 
 
+@require_http_methods(["GET"])
+def draft_events_api_view(request):
+    """
+    API endpoint with the draft events a client missed: those after the seq
+    in ?after (see players/draft_events.py).  If there are too many,
+    `complete` is false and the client should reload instead.
+    """
+    try:
+        after = int(request.GET.get('after', 0))
+    except ValueError:
+        return JsonResponse({
+            'success': False,
+            'error': 'after must be a whole number'
+        }, status=400)
+
+    catch_up = draft_events.catch_up(after)
+    return JsonResponse({
+        'success': True,
+        'events': catch_up['events'],
+        'complete': catch_up['complete'],
+        'last_seq': catch_up['last_seq'],
+    })
+
+
+@csrf_exempt
+def draft_clock_view(request):
+    """
+    GET: the pick clock as it is now.  POST {"action": "start", "seconds": N}
+    starts it on the first empty pick with N seconds per pick, and
+    {"action": "stop"} stops it (see players/draft_clock.py).
+    """
+    if request.method == 'GET':
+        return JsonResponse({'success': True, 'clock': draft_clock.status()})
+
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+    if getattr(request, 'needs_master_password_challenge', False):
+        return JsonResponse({'success': False, 'error': 'Master password required'}, status=403)
+
+    try:
+        data = json.loads(request.body)
+        action = data.get('action')
+        if action == 'start':
+            draft = draft_clock.start(int(data.get('seconds')))
+        elif action == 'stop':
+            draft = draft_clock.stop()
+        else:
+            raise ValueError('action must be start or stop')
+    except (ValueError, TypeError) as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+
+    return JsonResponse({'success': True, 'clock': draft_clock.clock_message(draft)})
+
+
 def validate_draft_assignment_view(request):
     """Validate draft assignment and return warning counts"""
     try:
         # Get all player IDs that have been drafted
-        drafted_player_ids = set(DraftPick.objects.filter(player__isnull=False).values_list('player_id', flat=True))
+        state = draft_states.get()
+        drafted_player_ids = state.drafted_ids()
 
         # Warning 1: Count actual undrafted players (not draft slots)
-        total_players = Player.objects.count()
-        drafted_players_count = len(drafted_player_ids)
-        undrafted_players_count = total_players - drafted_players_count
+        undrafted_players_count = len(state.available_ids())
 
         # Warning 2: Count players who:
         # - ARE assigned to a team (team is not null)
@@ -4502,30 +4375,31 @@ def validate_draft_assignment_view(request):
 
 @csrf_exempt
 def reset_draft_view(request):
-    """Delete all draft picks to reset the draft"""
+    """
+    Delete all draft picks to reset the draft, under the same draft lock as
+    the pick views, so no pick lands between the delete and the reset event.
+    """
+    from django.db import transaction
+
     if request.method != 'POST':
         return JsonResponse({'success': False, 'error': 'Invalid request method'})
 
     try:
-        # Delete all draft picks
-        deleted_count = DraftPick.objects.all().delete()[0]
+        with transaction.atomic():
+            # Serialize pick writes on the draft row
+            list(Draft.objects.select_for_update().order_by('-created_at')[:1])
 
-        # Broadcast the draft reset to all connected WebSocket clients
-        from asgiref.sync import async_to_sync
-        from channels.layers import get_channel_layer
+            # Delete all draft picks
+            deleted_count = DraftPick.objects.all().delete()[0]
 
-        channel_layer = get_channel_layer()
-        async_to_sync(channel_layer.group_send)(
-            'draft_updates',
-            {
-                'type': 'draft_reset',
-                'message': 'Draft has been reset'
-            }
-        )
+            # Log the draft reset and broadcast it to all connected WebSocket clients
+            seq = draft_events.publish(draft_events.RESET, {'message': 'Draft has been reset'}).seq
+            draft_clock.stop('The draft has been reset')
 
         return JsonResponse({
             'success': True,
-            'message': f'Successfully reset draft. Deleted {deleted_count} draft picks.'
+            'message': f'Successfully reset draft. Deleted {deleted_count} draft picks.',
+            'seq': seq
         })
 
     except Exception as e:
@@ -4544,6 +4418,8 @@ def reset_teams_view(request):
 
         # Unassociate players from teams
         Player.objects.all().update(team=None)
+        # QuerySet.update() skips post_save, so tell the validation engine directly
+        validation_engine.mark_dirty(Player)
 
         # Reset the player_assigned_to_team flag on all draft picks
         DraftPick.objects.filter(player_assigned_to_team=True).update(player_assigned_to_team=False)
@@ -4665,93 +4541,72 @@ def simulate_draft_view(request):
 
     try:
         import random
+        from django.db import transaction
 
-        # Check if draft picks already exist
-        existing_picks = DraftPick.objects.count()
-        if existing_picks > 0:
-            return JsonResponse({
-                'success': False,
-                'error': 'Draft picks already exist. Please reset the draft before simulating.',
-                'existing_picks': existing_picks
-            })
-
-        # Get the current draft
-        try:
-            draft = Draft.objects.latest('created_at')
-        except Draft.DoesNotExist:
-            return JsonResponse({'success': False, 'error': 'No draft found'})
-
-        # Parse draft order to get team IDs
-        order_data = draft.order.strip()
-        if order_data.startswith('['):
-            team_ids = json.loads(order_data)
-        else:
-            team_ids = [int(tid.strip()) for tid in order_data.split(',') if tid.strip()]
+        with transaction.atomic():
+            # Serialize with pick writes on the draft row, so a pick made
+            # meanwhile can't collide with the simulated ones
+            list(Draft.objects.select_for_update().order_by('-created_at')[:1])
 
-        # Get all teams
-        teams = list(Team.objects.filter(id__in=team_ids))
-        if not teams:
-            return JsonResponse({'success': False, 'error': 'No teams found in draft order'})
+            # Check if draft picks already exist
+            existing_picks = DraftPick.objects.count()
+            if existing_picks > 0:
+                return JsonResponse({
+                    'success': False,
+                    'error': 'Draft picks already exist. Please reset the draft before simulating.',
+                    'existing_picks': existing_picks
+                })
 
-        # Get all players who haven't been drafted yet
-        drafted_player_ids = DraftPick.objects.filter(player__isnull=False).values_list('player_id', flat=True)
-        available_players = list(Player.objects.exclude(id__in=drafted_player_ids))
+            # Get the current draft
+            try:
+                draft = Draft.objects.latest('created_at')
+            except Draft.DoesNotExist:
+                return JsonResponse({'success': False, 'error': 'No draft found'})
+
+            # Parse draft order to get team IDs
+            order_data = draft.order.strip()
+            if order_data.startswith('['):
+                team_ids = json.loads(order_data)
+            else:
+                team_ids = [int(tid.strip()) for tid in order_data.split(',') if tid.strip()]
 
-        if not available_players:
-            return JsonResponse({'success': False, 'error': 'No available players to draft'})
+            # Get all teams
+            teams = list(Team.objects.filter(id__in=team_ids))
+            if not teams:
+                return JsonResponse({'success': False, 'error': 'No teams found in draft order'})
 
-        # Shuffle players randomly
-        random.shuffle(available_players)
+            # Get all players who haven't been drafted yet
+            drafted_player_ids = DraftPick.objects.filter(player__isnull=False).values_list('player_id', flat=True)
+            available_players = list(Player.objects.exclude(id__in=drafted_player_ids))
 
-        picks_created = 0
-        current_player_index = 0
+            if not available_players:
+                return JsonResponse({'success': False, 'error': 'No available players to draft'})
 
-        # Create picks for regular rounds
-        total_rounds = draft.rounds_draftable + draft.rounds_nondraftable
-        for round_num in range(1, total_rounds + 1):
-            if current_player_index >= len(available_players):
-                break
+            # Shuffle players randomly
+            random.shuffle(available_players)
 
-            # Snake draft: reverse order on even rounds
-            if round_num % 2 == 0:
-                round_teams = list(reversed(teams))
-            else:
-                round_teams = teams
+            picks_created = 0
+            current_player_index = 0
 
-            for pick_num, team in enumerate(round_teams, start=1):
+            # Create picks for regular rounds
+            total_rounds = draft.rounds_draftable + draft.rounds_nondraftable
+            for round_num in range(1, total_rounds + 1):
                 if current_player_index >= len(available_players):
                     break
 
-                # Create or update draft pick
-                draft_pick, created = DraftPick.objects.update_or_create(
-                    round=round_num,
-                    pick=pick_num,
-                    defaults={
-                        'player': available_players[current_player_index],
-                        'team': team
-                    }
-                )
-
-                picks_created += 1
-                current_player_index += 1
-
-        # Handle final round if needed and we still have players
-        if draft.final_round_draft_order and current_player_index < len(available_players):
-            final_round_team_ids = [int(tid) for tid in draft.final_round_draft_order.split(',') if tid]
-            final_round_teams = Team.objects.filter(id__in=final_round_team_ids)
-            teams_dict = {team.id: team for team in final_round_teams}
-
-            total_rounds = draft.rounds_draftable + draft.rounds_nondraftable
-            final_round_num = total_rounds + 1
+                # Snake draft: reverse order on even rounds
+                if round_num % 2 == 0:
+                    round_teams = list(reversed(teams))
+                else:
+                    round_teams = teams
 
-            for pick_num, team_id in enumerate(final_round_team_ids, start=1):
-                if current_player_index >= len(available_players):
-                    break
+                for pick_num, team in enumerate(round_teams, start=1):
+                    if current_player_index >= len(available_players):
+                        break
 
-                team = teams_dict.get(team_id)
-                if team:
+                    # Create or update draft pick
                     draft_pick, created = DraftPick.objects.update_or_create(
-                        round=final_round_num,
+                        round=round_num,
                         pick=pick_num,
                         defaults={
                             'player': available_players[current_player_index],
@@ -4762,11 +4617,38 @@ def simulate_draft_view(request):
                     picks_created += 1
                     current_player_index += 1
 
-        return JsonResponse({
-            'success': True,
-            'picks_created': picks_created,
-            'players_drafted': current_player_index
-        })
+            # Handle final round if needed and we still have players
+            if draft.final_round_draft_order and current_player_index < len(available_players):
+                final_round_team_ids = [int(tid) for tid in draft.final_round_draft_order.split(',') if tid]
+                final_round_teams = Team.objects.filter(id__in=final_round_team_ids)
+                teams_dict = {team.id: team for team in final_round_teams}
+
+                total_rounds = draft.rounds_draftable + draft.rounds_nondraftable
+                final_round_num = total_rounds + 1
+
+                for pick_num, team_id in enumerate(final_round_team_ids, start=1):
+                    if current_player_index >= len(available_players):
+                        break
+
+                    team = teams_dict.get(team_id)
+                    if team:
+                        draft_pick, created = DraftPick.objects.update_or_create(
+                            round=final_round_num,
+                            pick=pick_num,
+                            defaults={
+                                'player': available_players[current_player_index],
+                                'team': team
+                            }
+                        )
+
+                        picks_created += 1
+                        current_player_index += 1
+
+            return JsonResponse({
+                'success': True,
+                'picks_created': picks_created,
+                'players_drafted': current_player_index
+            })
 
     except Exception as e:
         return JsonResponse({'success': False, 'error': str(e)})
@@ -4807,63 +4689,28 @@ def team_preferences_view(request):
 
 def player_rankings_analyze_view(request):
     """Analyze manager player rankings"""
-    from .models import PlayerRanking, Manager, Player, GeneralSetting, Team
-    from collections import defaultdict
+    from .models import PlayerRanking, Manager, Team
 
     # Calculate required number of rankings: (Number of Teams) × 2
     num_teams = Team.objects.count()
     required_rankings = num_teams * 2
 
     # Check if rankings have been released
-    rankings_released = False
-    try:
-        setting = GeneralSetting.objects.get(key='player_rankings_public')
-        rankings_released = setting.value.lower() == 'true'
-    except GeneralSetting.DoesNotExist:
-        rankings_released = False
-
-    # Get all player rankings
-    all_rankings = PlayerRanking.objects.all()
-
-    # Dictionary to accumulate scores for each player
-    # For Borda count: higher rank position = higher points
-    player_scores = defaultdict(list)
-    max_rank = 0  # Track the maximum rank seen to determine Borda points
-
-    # First pass: collect all ranks and find max rank
-    for ranking in all_rankings:
-        try:
-            rankings_data = json.loads(ranking.ranking)
-            for item in rankings_data:
-                player_id = item.get('player_id')
-                rank = item.get('rank')
-                if player_id and rank:
-                    player_scores[player_id].append(rank)
-                    max_rank = max(max_rank, rank)
-        except (json.JSONDecodeError, KeyError):
-            continue
+    rankings_released = general_settings.get_bool('player_rankings_public')
 
-    # Calculate Borda count and average rank for each player
-    player_stats = []
-    for player_id, ranks in player_scores.items():
-        # Borda count: rank 1 gets max_rank points, rank 2 gets (max_rank - 1) points, etc.
-        borda_count = sum(max_rank - rank + 1 for rank in ranks)
-        avg_rank = sum(ranks) / len(ranks)
+    # Borda count (rank 1 gets the most points) and average rank for each ranked
+    # player, in the order of the consensus method picked in general settings
+    # (by default Borda count, higher is better, then average rank as tiebreaker)
+    ranking_method = ranking_consensus.configured_method()
 
-        try:
-            player = Player.objects.get(id=player_id)
-            player_stats.append({
-                'player': player,
-                'average_rank': avg_rank,
-                'borda_count': borda_count,
-                'num_rankings': len(ranks)
-            })
-        except Player.DoesNotExist:
-            continue
+    # Optional bootstrap band of each player's position (?stability=1), only
+    # for the Borda order; cached with the aggregate after the first request
+    stability_available = ranking_method == ranking_consensus.BORDA
+    show_stability = stability_available and request.GET.get('stability') == '1'
 
-    # Sort by Borda count (higher is better), then by average rank as tiebreaker
-    player_stats.sort(key=lambda x: (-x['borda_count'], x['average_rank']))
-    top_players = player_stats[:required_rankings]
+    top_players = ranking_aggregates.get(rankings.KIND_PLAYER).top(
+        limit=required_rankings, method=ranking_method, with_bands=show_stability
+    )
 
     # Find managers who haven't submitted rankings
     all_managers = Manager.objects.all()
@@ -4877,6 +4724,10 @@ def player_rankings_analyze_view(request):
         'rankings_released': rankings_released,
         'required_rankings': required_rankings,
         'num_teams': num_teams,
+        'ranking_method': ranking_method,
+        'ranking_method_label': ranking_consensus.METHOD_LABELS[ranking_method],
+        'stability_available': stability_available,
+        'show_stability': show_stability,
     }
     return render(request, 'players/player_rankings_analyze.html', context)
 
@@ -4888,11 +4739,7 @@ def release_player_rankings_view(request):
 
     try:
         # Get current state
-        try:
-            setting = GeneralSetting.objects.get(key='player_rankings_public')
-            current_value = setting.value.lower() == 'true'
-        except GeneralSetting.DoesNotExist:
-            current_value = False
+        current_value = general_settings.get_bool('player_rankings_public')
 
         # Toggle the value
         new_value = 'false' if current_value else 'true'
@@ -4919,20 +4766,14 @@ def release_player_rankings_view(request):
 
 def player_rankings_analyze_public_view(request):
     """Public view of player rankings analysis (no login required)"""
-    from .models import PlayerRanking, Manager, Player, GeneralSetting, Team
-    from collections import defaultdict
+    from .models import Team
 
     # Calculate required number of rankings: (Number of Teams) × 2
     num_teams = Team.objects.count()
     required_rankings = num_teams * 2
 
     # Check if rankings are released
-    rankings_released = False
-    try:
-        setting = GeneralSetting.objects.get(key='player_rankings_public')
-        rankings_released = setting.value.lower() == 'true'
-    except GeneralSetting.DoesNotExist:
-        rankings_released = False
+    rankings_released = general_settings.get_bool('player_rankings_public')
 
     # If not released, show message
     if not rankings_released:
@@ -4941,48 +4782,19 @@ def player_rankings_analyze_public_view(request):
         }
         return render(request, 'players/player_rankings_analyze_public.html', context)
 
-    # Get all player rankings
-    all_rankings = PlayerRanking.objects.all()
-
-    # Dictionary to accumulate scores for each player
-    # For Borda count: higher rank position = higher points
-    player_scores = defaultdict(list)
-    max_rank = 0  # Track the maximum rank seen to determine Borda points
+    # Borda count (rank 1 gets the most points) and average rank for each ranked
+    # player, in the order of the consensus method picked in general settings
+    # (by default Borda count, higher is better, then average rank as tiebreaker)
+    ranking_method = ranking_consensus.configured_method()
 
-    # First pass: collect all ranks and find max rank
-    for ranking in all_rankings:
-        try:
-            rankings_data = json.loads(ranking.ranking)
-            for item in rankings_data:
-                player_id = item.get('player_id')
-                rank = item.get('rank')
-                if player_id and rank:
-                    player_scores[player_id].append(rank)
-                    max_rank = max(max_rank, rank)
-        except (json.JSONDecodeError, KeyError):
-            continue
-
-    # Calculate Borda count and average rank for each player
-    player_stats = []
-    for player_id, ranks in player_scores.items():
-        # Borda count: rank 1 gets max_rank points, rank 2 gets (max_rank - 1) points, etc.
-        borda_count = sum(max_rank - rank + 1 for rank in ranks)
-        avg_rank = sum(ranks) / len(ranks)
-
-        try:
-            player = Player.objects.get(id=player_id)
-            player_stats.append({
-                'player': player,
-                'average_rank': avg_rank,
-                'borda_count': borda_count,
-                'num_rankings': len(ranks)
-            })
-        except Player.DoesNotExist:
-            continue
+    # Optional bootstrap band of each player's position (?stability=1), only
+    # for the Borda order; cached with the aggregate after the first request
+    stability_available = ranking_method == ranking_consensus.BORDA
+    show_stability = stability_available and request.GET.get('stability') == '1'
 
-    # Sort by Borda count (higher is better), then by average rank as tiebreaker
-    player_stats.sort(key=lambda x: (-x['borda_count'], x['average_rank']))
-    top_players = player_stats[:required_rankings]
+    top_players = ranking_aggregates.get(rankings.KIND_PLAYER).top(
+        limit=required_rankings, method=ranking_method, with_bands=show_stability
+    )
 
     # Don't show manager submission info on public page
     context = {
@@ -4990,66 +4802,26 @@ def player_rankings_analyze_public_view(request):
         'rankings_released': True,
         'required_rankings': required_rankings,
         'num_teams': num_teams,
+        'ranking_method': ranking_method,
+        'ranking_method_label': ranking_consensus.METHOD_LABELS[ranking_method],
+        'stability_available': stability_available,
+        'show_stability': show_stability,
     }
     return render(request, 'players/player_rankings_analyze_public.html', context)
 
 
 def manager_daughter_rankings_analyze_view(request):
     """Analyze manager daughter rankings with Borda count and suggested draft rounds"""
-    from .models import ManagerDaughterRanking, Manager, Player
-    from collections import defaultdict
-    import statistics
-
-    # Get all manager daughter rankings
-    all_rankings = ManagerDaughterRanking.objects.all()
-    player_scores = defaultdict(list)
-    player_rounds = defaultdict(list)  # Track which round each manager put the player in
-    max_rank = 0
-
-    # Process all rankings to collect scores and rounds for each player
-    for ranking in all_rankings:
-        rankings_data = json.loads(ranking.ranking)
-        for item in rankings_data:
-            player_id = item.get('player_id')
-            rank = item.get('rank')
-            round_num = item.get('round')  # Get the draft round
-            if player_id and rank:
-                player_scores[player_id].append(rank)
-                max_rank = max(max_rank, rank)
-                if round_num:
-                    player_rounds[player_id].append(round_num)
-
-    # Calculate Borda count and suggested round for each player
-    player_stats = []
-    for player_id, ranks in player_scores.items():
-        # Borda count: rank 1 gets max_rank points, rank 2 gets max_rank-1 points, etc.
-        borda_count = sum(max_rank - rank + 1 for rank in ranks)
-        avg_rank = sum(ranks) / len(ranks)
-
-        # Calculate suggested draft round (median of all rounds managers assigned)
-        rounds = player_rounds.get(player_id, [])
-        if rounds:
-            suggested_round = round(statistics.median(rounds))
-        else:
-            suggested_round = None
-
-        try:
-            player = Player.objects.get(id=player_id)
-            player_stats.append({
-                'player': player,
-                'average_rank': avg_rank,
-                'borda_count': borda_count,
-                'num_rankings': len(ranks),
-                'suggested_round': suggested_round
-            })
-        except Player.DoesNotExist:
-            continue
-
-    # Sort by Borda count (higher is better), then by average rank (lower is better)
-    player_stats.sort(key=lambda x: (-x['borda_count'], x['average_rank']))
+    from .models import ManagerDaughterRanking, Manager
 
+    # Borda count, average rank and suggested draft round (median of the rounds
+    # managers assigned) for each player, in the order of the consensus method
+    # picked in general settings (by default Borda count, higher is better, then
+    # average rank, lower is better)
     # Show all manager daughters (not limited to top 20)
-    top_players = player_stats
+    top_players = ranking_aggregates.get(rankings.KIND_DAUGHTER).top(
+        with_rounds=True, method=ranking_consensus.configured_method()
+    )
 
     # Get managers who haven't submitted rankings
     all_managers = Manager.objects.all()
@@ -5064,6 +4836,178 @@ def manager_daughter_rankings_analyze_view(request):
     return render(request, 'players/manager_daughter_rankings_analyze.html', context)
 
 
+def _ranking_analysis_validators(request, kind):
+    """
+    (ETag, Last-Modified) of a ranking analysis API response: the latest
+    updated_at of the kind's submissions, plus their count (so deletions
+    change the ETag), the kind's entry count and latest tally id (entries
+    deleted with a player and rebuilt tallies change it too), the consensus
+    method and the query string.  Computed once per request for both
+    condition() callbacks; none for a request the view refuses.
+    """
+    import hashlib
+    from django.db.models import Count, Max
+    from .models import RankingEntry, RankingTally
+
+    if getattr(request, 'needs_master_password_challenge', False):
+        return None, None
+
+    validators = getattr(request, '_ranking_analysis_validators', None)
+    if validators is None:
+        stats = rankings.SUBMISSION_MODELS[kind].objects.aggregate(latest=Max('updated_at'), count=Count('id'))
+        latest = stats['latest']
+        fingerprint = '|'.join([
+            kind,
+            str(stats['count']),
+            latest.isoformat() if latest else '',
+            str(RankingEntry.objects.filter(kind=kind).count()),
+            str(RankingTally.objects.filter(kind=kind).aggregate(latest=Max('id'))['latest'] or ''),
+            ranking_consensus.configured_method(),
+            request.GET.urlencode(),
+        ])
+        validators = (hashlib.md5(fingerprint.encode()).hexdigest(), latest)
+        request._ranking_analysis_validators = validators
+    return validators
+
+
+@require_http_methods(["GET"])
+@condition(
+    etag_func=lambda request, kind: _ranking_analysis_validators(request, kind)[0],
+    last_modified_func=lambda request, kind: _ranking_analysis_validators(request, kind)[1],
+)
+def ranking_analysis_api_view(request, kind):
+    """
+    API endpoint with a ranking analysis (player, daughter or sibling rankings)
+    as compact rows, best first in the configured consensus order:
+    [player_id, score (Borda count), avg_rank, n (rankings received), suggested_round].
+    Answers 304 Not Modified to If-None-Match / If-Modified-Since while no
+    submission of the kind has changed, so dashboards can poll it cheaply.
+    Behind the master password like the analysis pages.
+    """
+    if getattr(request, 'needs_master_password_challenge', False):
+        return JsonResponse({'success': False, 'error': 'Master password required'}, status=403)
+
+    # Optional ?limit=N to return only the top N rows
+    limit = request.GET.get('limit')
+    if limit is not None:
+        if not limit.isdigit():
+            return JsonResponse({
+                'success': False,
+                'error': 'limit must be a whole number'
+            }, status=400)
+        limit = int(limit)
+
+    method = ranking_consensus.configured_method()
+    rows = ranking_aggregates.get(kind).compact_rows(
+        limit=limit, with_rounds=kind != rankings.KIND_PLAYER, method=method
+    )
+
+    response = JsonResponse({
+        'success': True,
+        'kind': kind,
+        'method': method,
+        'columns': ['player_id', 'score', 'avg_rank', 'n', 'suggested_round'],
+        'rows': rows,
+    })
+    # Let clients keep the response but always revalidate it
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+RANKING_POOL_PAGE_SIZE = 50
+RANKING_POOL_MAX_PAGE_SIZE = 200
+
+
+@require_http_methods(["GET"])
+def ranking_pool_api_view(request, kind):
+    """
+    API endpoint with one page of the players a manager can rank, in name order,
+    for the lazily loaded "available" list of the ranking entry pages.
+
+    Query parameters (all optional):
+    - q: words that must each appear in the first or last name
+    - school / history: text the player's school / history must contain
+    - exclude: comma-separated IDs of players already ranked
+    - after: the next_cursor of the previous page
+    - page_size: players per page (default 50, at most 200)
+
+    Pages are keyed on (last name, first name, id) rather than offsets, so
+    players ranked or unranked between two requests don't shift the pages.
+    """
+    import base64
+    from django.db.models import Q
+
+    players = rankings.ranking_pool(kind)
+
+    for term in request.GET.get('q', '').split():
+        players = players.filter(Q(first_name__icontains=term) | Q(last_name__icontains=term))
+    school = request.GET.get('school', '').strip()
+    if school:
+        players = players.filter(school__icontains=school)
+    history = request.GET.get('history', '').strip()
+    if history:
+        players = players.filter(history__icontains=history)
+
+    try:
+        exclude_ids = [int(player_id) for player_id in request.GET.get('exclude', '').split(',') if player_id.strip()]
+        page_size = int(request.GET.get('page_size', RANKING_POOL_PAGE_SIZE))
+    except ValueError:
+        return JsonResponse({
+            'success': False,
+            'error': 'exclude and page_size must be whole numbers'
+        }, status=400)
+    page_size = max(1, min(page_size, RANKING_POOL_MAX_PAGE_SIZE))
+    if exclude_ids:
+        players = players.exclude(id__in=exclude_ids)
+
+    # Continue after the last player of the previous page
+    cursor = request.GET.get('after')
+    if cursor:
+        try:
+            last_name, first_name, player_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            player_id = int(player_id)
+        except (ValueError, TypeError):
+            return JsonResponse({
+                'success': False,
+                'error': 'Invalid cursor'
+            }, status=400)
+        players = players.filter(
+            Q(last_name__gt=last_name)
+            | Q(last_name=last_name, first_name__gt=first_name)
+            | Q(last_name=last_name, first_name=first_name, id__gt=player_id)
+        )
+
+    # One extra row tells whether there is another page
+    page = list(players.order_by('last_name', 'first_name', 'id').values(
+        'id', 'first_name', 'last_name', 'school'
+    )[:page_size + 1])
+    has_next = len(page) > page_size
+    page = page[:page_size]
+
+    next_cursor = None
+    if has_next:
+        last = page[-1]
+        next_cursor = base64.urlsafe_b64encode(
+            json.dumps([last['last_name'], last['first_name'], last['id']]).encode()
+        ).decode()
+
+    # Managers' daughters are labelled on the player ranking page
+    daughter_ids = set(Manager.objects.filter(
+        daughter_id__in=[player['id'] for player in page]
+    ).values_list('daughter_id', flat=True))
+
+    return JsonResponse({
+        'success': True,
+        'results': [{
+            'id': player['id'],
+            'name': f"{player['first_name']} {player['last_name']}",
+            'school': player['school'] or '',
+            'is_daughter': player['id'] in daughter_ids,
+        } for player in page],
+        'next_cursor': next_cursor,
+    })
+
+
 def try_out_check_in_view(request):
     """Try out check in form"""
     from .models import Player
@@ -5365,6 +5309,8 @@ def unassign_all_managers_view(request):
     try:
         # Get all teams and remove their manager assignments
         teams_updated = Team.objects.filter(manager__isnull=False).update(manager=None)
+        # QuerySet.update() skips post_save, so tell the validation engine directly
+        validation_engine.mark_dirty(Team)
 
         return JsonResponse({
             'success': True,
@@ -5744,6 +5690,8 @@ def assign_team_to_practice_slot_view(request):
         else:
             # Unassign practice slot from any team that has it
             Team.objects.filter(practice_slot=slot).update(practice_slot=None)
+            # QuerySet.update() skips post_save, so tell the validation engine directly
+            validation_engine.mark_dirty(Team)
             message = f'Practice slot unassigned'
 
         return JsonResponse({
@@ -5893,8 +5841,7 @@ def calendar_view(request):
 
 def calendar_events_api(request):
     """API endpoint that returns events in FullCalendar JSON format"""
-    from .models import Event, GeneralSetting
-    import pytz
+    from .models import Event
     from datetime import datetime
 
     # Get display timezone
@@ -6184,10 +6131,7 @@ def create_event_view(request):
         # Parse the timestamp (format: YYYY-MM-DDTHH:MM from datetime-local input, or just YYYY-MM-DD for date-only)
         try:
             # Get display timezone
-            from .models import GeneralSetting
-            import pytz
-            display_tz_setting = GeneralSetting.objects.filter(key='display_timezone').first()
-            display_tz = pytz.timezone(display_tz_setting.value) if display_tz_setting else pytz.UTC
+            display_tz = get_display_timezone()
 
             # Check if this is date-only (no 'T' separator) or date-time
             if 'T' in timestamp_str:
@@ -6251,8 +6195,6 @@ def parse_natural_language_event_view(request):
     import dateparser
     import re
     from datetime import datetime
-    from .models import GeneralSetting
-    import pytz
 
     try:
         text = request.POST.get('text', '').strip()
@@ -6264,8 +6206,7 @@ def parse_natural_language_event_view(request):
             }, status=400)
 
         # Get display timezone for parsing
-        display_tz_setting = GeneralSetting.objects.filter(key='display_timezone').first()
-        display_tz = pytz.timezone(display_tz_setting.value) if display_tz_setting else pytz.UTC
+        display_tz = get_display_timezone()
 
         # Parse the datetime from the text
         # Use PREFER_DATES_FROM='future' to prefer future dates
@@ -6598,10 +6539,7 @@ def update_event_view(request):
         # Parse the timestamp
         try:
             # Get display timezone
-            from .models import GeneralSetting
-            import pytz
-            display_tz_setting = GeneralSetting.objects.filter(key='display_timezone').first()
-            display_tz = pytz.timezone(display_tz_setting.value) if display_tz_setting else pytz.UTC
+            display_tz = get_display_timezone()
 
             # Check if this is date-only (no 'T' separator) or date-time
             if 'T' in timestamp_str:
@@ -6744,9 +6682,8 @@ def delete_event_view(request):
 @csrf_exempt
 def move_event_date_view(request):
     """Move an event to a new date (via drag-and-drop)"""
-    from .models import Event, GeneralSetting
+    from .models import Event
     from datetime import datetime
-    import pytz
 
     try:
         event_id = request.POST.get('event_id', '').strip()
@@ -6817,15 +6754,13 @@ def move_event_date_view(request):
 def get_timezone_info_view(request):
     """Get list of available timezones and current timezone setting"""
     import pytz
-    from .models import GeneralSetting
 
     try:
         # Get all common timezones
         timezones = pytz.common_timezones
 
         # Get current timezone from database
-        current_tz_setting = GeneralSetting.objects.filter(key='display_timezone').first()
-        current_timezone = current_tz_setting.value if current_tz_setting else None
+        current_timezone = general_settings.get('display_timezone')
 
         return JsonResponse({
             'success': True,
@@ -6940,130 +6875,91 @@ def set_draft_order_and_daughters_view(request):
     """
     Calculate and set draft order based on ranking data, then create
     draft picks for all manager's daughters in their designated rounds
+
+    A daughter already drafted elsewhere moves to her designated pick; if
+    another player holds that pick, nothing is saved and the response is a
+    409 naming it.
     """
-    from .models import Draft, DraftPick, Team, Player, PlayerRanking, ManagerDaughterRanking
-    from collections import defaultdict
-    import statistics
+    from .models import Draft, DraftPick
+    from django.db import transaction
 
     try:
-        # Step 1: Get all teams with managers who have daughters
-        teams_with_daughters = Team.objects.filter(
-            manager__isnull=False,
-            manager__daughter__isnull=False
-        ).select_related('manager', 'manager__daughter').distinct()
+        # Steps 1-5: Teams with manager's daughters, in draft order by the
+        # priority formula (players/draft_priority.py)
+        team_priorities = draft_priority.team_priorities()
 
-        if not teams_with_daughters.exists():
+        if not team_priorities:
             return JsonResponse({
                 'success': False,
                 'error': 'No teams with manager\'s daughters found'
             }, status=400)
 
-        # Step 2: Calculate Borda counts for all players in player_rankings
-        all_player_rankings = PlayerRanking.objects.all()
-        player_borda_scores = defaultdict(int)
-
-        for ranking in all_player_rankings:
-            rankings_list = json.loads(ranking.ranking)
-            num_players = len(rankings_list)
-            for idx, item in enumerate(rankings_list):
-                # Extract player_id from the dict (format: {"rank": 1, "player_id": 123})
-                player_id = item['player_id']
-                # Borda count: higher rank = higher score
-                player_borda_scores[player_id] += (num_players - idx)
-
-        # Step 3: Calculate Borda counts for manager's daughters in manager_daughter_rankings
-        all_daughter_rankings = ManagerDaughterRanking.objects.all()
-        daughter_borda_scores = defaultdict(int)
-        daughter_median_rounds = defaultdict(list)
-
-        for ranking in all_daughter_rankings:
-            rankings_list = json.loads(ranking.ranking)
-            num_daughters = len(rankings_list)
-            for idx, item in enumerate(rankings_list):
-                player_id = item['player_id']
-                suggested_round = item.get('round', 1)
-
-                # Borda count for daughters
-                daughter_borda_scores[player_id] += (num_daughters - idx)
-
-                # Collect suggested rounds for median calculation
-                daughter_median_rounds[player_id].append(suggested_round)
-
-        # Step 4: Calculate draft order priority for each team
-        team_priorities = []
-
-        for team in teams_with_daughters:
-            daughter = team.manager.daughter
-            daughter_id = daughter.id
-
-            # Check if daughter is in top players (player_rankings)
-            in_top_players = daughter_id in player_borda_scores
-
-            if in_top_players:
-                # Elite daughter - picks later
-                overall_borda = player_borda_scores[daughter_id]
-                daughter_borda = daughter_borda_scores.get(daughter_id, 0)
-                # Higher score = picks later
-                priority_score = overall_borda - (daughter_borda * 0.5)
-            else:
-                # Non-elite daughter - picks earlier
-                daughter_borda = daughter_borda_scores.get(daughter_id, 0)
-                # Negative score to ensure they sort before elite daughters
-                # Lower daughter rank (worse) = more negative = picks earlier
-                priority_score = -(daughter_borda)
-
-            team_priorities.append({
-                'team': team,
-                'daughter_id': daughter_id,
-                'priority_score': priority_score,
-                'median_round': statistics.median(daughter_median_rounds.get(daughter_id, [1]))
-            })
-
-        # Step 5: Sort teams by priority score (lowest = picks first)
-        team_priorities.sort(key=lambda x: x['priority_score'])
-
         # Step 6: Create draft order (comma-separated team IDs)
         draft_order = ','.join(str(item['team'].id) for item in team_priorities)
 
-        # Step 7: Update the Draft table
-        draft = Draft.objects.first()
-        if not draft:
-            return JsonResponse({
-                'success': False,
-                'error': 'No draft configuration found'
-            }, status=400)
-
-        draft.order = draft_order
-        draft.save()
+        with transaction.atomic():
+            # Step 7: Update the Draft table, locked like the pick views
+            draft = Draft.objects.select_for_update().order_by('-created_at').first()
+            if not draft:
+                return JsonResponse({
+                    'success': False,
+                    'error': 'No draft configuration found'
+                }, status=400)
 
-        # Step 8: Create DraftPick records for each manager's daughter
-        total_teams = len(team_priorities)
+            draft.order = draft_order
+            draft.save()
 
-        for draft_position, item in enumerate(team_priorities, start=1):
-            team = item['team']
-            daughter_id = item['daughter_id']
-            median_round = int(item['median_round'])
+            # Step 8: Create DraftPick records for each manager's daughter, at
+            # the team's pick of a snake draft in her round
+            total_teams = len(team_priorities)
+            daughter_slots = {}
+            for draft_position, item in enumerate(team_priorities, start=1):
+                median_round = int(item['median_round'])
+                daughter_slots[item['daughter'].id] = (
+                    median_round, draft_priority.snake_pick(median_round, draft_position, total_teams), item
+                )
 
-            # Calculate pick number based on snake draft
-            # Odd rounds: pick = draft_position
-            # Even rounds: pick = (total_teams - draft_position + 1)
-            if median_round % 2 == 1:
-                pick_number = draft_position
-            else:
-                pick_number = total_teams - draft_position + 1
+            # A slot and a player each hold one pick: first take the daughters
+            # out of any other pick they hold
+            for draft_pick in DraftPick.objects.filter(player_id__in=daughter_slots):
+                round_num, pick_num, item = daughter_slots[draft_pick.player_id]
+                if (draft_pick.round, draft_pick.pick) != (round_num, pick_num):
+                    draft_pick.delete()
+
+            for daughter_id, (round_num, pick_num, item) in daughter_slots.items():
+                slot_pick = DraftPick.objects.select_related('player').filter(round=round_num, pick=pick_num).first()
+                if slot_pick and slot_pick.player_id not in (None, daughter_id):
+                    transaction.set_rollback(True)
+                    return JsonResponse({
+                        'success': False,
+                        'error': (
+                            f"Round {round_num}, pick {pick_num} is already taken by "
+                            f"{slot_pick.player.first_name} {slot_pick.player.last_name}; undraft that pick first"
+                        )
+                    }, status=409)
+
+                DraftPick.objects.update_or_create(
+                    round=round_num,
+                    pick=pick_num,
+                    defaults={
+                        'player_id': daughter_id,
+                        'team': item['team']
+                    }
+                )
 
-            # Create the draft pick
-            DraftPick.objects.create(
-                round=median_round,
-                pick=pick_number,
-                player_id=daughter_id,
-                team=team
-            )
+            # Log the new order and the daughters' picks, so picks based on the
+            # old board are refused, and broadcast it to all connected WebSocket clients
+            seq = draft_events.publish(draft_events.REORDER, {
+                'message': 'The draft order has been set',
+                'order': draft.order,
+                'slots': draft_events.slot_map()
+            }).seq
 
         return JsonResponse({
             'success': True,
             'message': f'Draft order set and {len(team_priorities)} manager\'s daughters assigned to their rounds',
-            'draft_order': draft_order
+            'draft_order': draft_order,
+            'seq': seq
         })
 
     except Exception as e:
@@ -7081,86 +6977,33 @@ def export_priority_scores_view(request):
     """
     Export priority scores for all teams as a CSV file
     """
-    from .models import Team, Player, PlayerRanking, ManagerDaughterRanking
-    from collections import defaultdict
     import csv
     from django.http import HttpResponse
 
     try:
-        # Step 1: Get all teams with managers who have daughters
-        teams_with_daughters = Team.objects.filter(
-            manager__isnull=False,
-            manager__daughter__isnull=False
-        ).select_related('manager', 'manager__daughter').distinct()
-
-        if not teams_with_daughters.exists():
+        # Teams with manager's daughters, in draft order by the priority formula
+        # (players/draft_priority.py)
+        team_priorities = [{
+            'team_name': item['team'].name,
+            'manager_name': f"{item['team'].manager.first_name} {item['team'].manager.last_name}",
+            'daughter_name': f"{item['daughter'].first_name} {item['daughter'].last_name}",
+            'classification': item['classification'],
+            'priority_score': item['priority_score'],
+            'overall_borda': item['overall_borda'],
+            'daughter_borda': item['daughter_borda'],
+        } for item in draft_priority.team_priorities()]
+
+        if not team_priorities:
             return HttpResponse(
                 'No teams with manager\'s daughters found',
                 status=400
             )
 
-        # Step 2: Calculate Borda counts for all players in player_rankings
-        all_player_rankings = PlayerRanking.objects.all()
-        player_borda_scores = defaultdict(int)
-
-        for ranking in all_player_rankings:
-            rankings_list = json.loads(ranking.ranking)
-            num_players = len(rankings_list)
-            for idx, item in enumerate(rankings_list):
-                player_id = item['player_id']
-                player_borda_scores[player_id] += (num_players - idx)
-
-        # Step 3: Calculate Borda counts for manager's daughters
-        all_daughter_rankings = ManagerDaughterRanking.objects.all()
-        daughter_borda_scores = defaultdict(int)
-
-        for ranking in all_daughter_rankings:
-            rankings_list = json.loads(ranking.ranking)
-            num_daughters = len(rankings_list)
-            for idx, item in enumerate(rankings_list):
-                player_id = item['player_id']
-                daughter_borda_scores[player_id] += (num_daughters - idx)
-
-        # Step 4: Calculate draft order priority for each team
-        team_priorities = []
-
-        for team in teams_with_daughters:
-            daughter = team.manager.daughter
-            daughter_id = daughter.id
-
-            # Check if daughter is in top players (player_rankings)
-            in_top_players = daughter_id in player_borda_scores
-
-            if in_top_players:
-                # Elite daughter - picks later
-                overall_borda = player_borda_scores[daughter_id]
-                daughter_borda = daughter_borda_scores.get(daughter_id, 0)
-                priority_score = overall_borda - (daughter_borda * 0.5)
-                classification = "Elite Daughter"
-            else:
-                # Non-elite daughter - picks earlier
-                daughter_borda = daughter_borda_scores.get(daughter_id, 0)
-                priority_score = -(daughter_borda)
-                classification = "Non-Elite Daughter"
-
-            team_priorities.append({
-                'team_name': team.name,
-                'manager_name': f"{team.manager.first_name} {team.manager.last_name}",
-                'daughter_name': f"{daughter.first_name} {daughter.last_name}",
-                'classification': classification,
-                'priority_score': priority_score,
-                'overall_borda': player_borda_scores.get(daughter_id, 0),
-                'daughter_borda': daughter_borda_scores.get(daughter_id, 0)
-            })
-
-        # Step 5: Sort teams by priority score (lowest = picks first)
-        team_priorities.sort(key=lambda x: x['priority_score'])
-
         # Add draft position after sorting
         for idx, item in enumerate(team_priorities, start=1):
             item['draft_position'] = idx
 
-        # Step 6: Create CSV response
+        # Create CSV response
         response = HttpResponse(content_type='text/csv')
         response['Content-Disposition'] = 'attachment; filename="draft_priority_scores.csv"'
 
@@ -7247,8 +7090,15 @@ def get_draft_order_view(request):
 @require_http_methods(["POST"])
 @csrf_exempt
 def save_draft_order_view(request):
-    """Save new draft order and recalculate empty pick positions"""
-    from .models import Draft, DraftPick, Team
+    """
+    Save new draft order and recalculate empty pick positions
+
+    Only one pick may hold a slot, so the picks that move are renumbered in
+    two steps inside one transaction: first to temporary pick numbers no
+    real pick uses, then to their new ones.
+    """
+    from .models import Draft, DraftPick
+    from django.db import IntegrityError, transaction
     import json
     
     try:
@@ -7261,50 +7111,71 @@ def save_draft_order_view(request):
                 'error': 'No team order provided'
             }, status=400)
         
-        # Update the draft order
-        draft = Draft.objects.first()
-        if not draft:
-            return JsonResponse({
-                'error': 'No draft found'
-            }, status=400)
-        
-        # Save the new order as comma-separated team IDs
-        draft.order = ','.join(str(tid) for tid in team_order)
-        draft.save()
+        with transaction.atomic():
+            # Serialize with pick writes on the draft row
+            draft = Draft.objects.select_for_update().order_by('-created_at').first()
+            if not draft:
+                return JsonResponse({
+                    'error': 'No draft found'
+                }, status=400)
 
-        # Recalculate pick numbers for ALL draft picks to match new team positions
-        # This includes both empty picks and picks with players already assigned
-        all_picks = DraftPick.objects.all().select_related('team')
+            # Save the new order as comma-separated team IDs
+            draft.order = ','.join(str(tid) for tid in team_order)
+            draft.save()
 
-        total_teams = len(team_order)
-        updated_count = 0
+            # Recalculate pick numbers for ALL draft picks to match new team positions
+            # This includes both empty picks and picks with players already assigned
+            all_picks = DraftPick.objects.filter(team__isnull=False)
 
-        for pick in all_picks:
-            # Find the team's position in the new draft order (1-indexed)
-            try:
-                draft_position = team_order.index(str(pick.team.id)) + 1
-            except ValueError:
-                # Team not in order, skip this pick
-                continue
+            total_teams = len(team_order)
+            moved_picks = []
 
-            # Calculate pick number based on snake draft logic
-            round_num = pick.round
-            if round_num % 2 == 1:  # Odd rounds
-                new_pick_number = draft_position
-            else:  # Even rounds (reversed)
-                new_pick_number = total_teams - draft_position + 1
+            for pick in all_picks:
+                # Find the team's position in the new draft order (1-indexed)
+                try:
+                    draft_position = team_order.index(str(pick.team_id)) + 1
+                except ValueError:
+                    # Team not in order, skip this pick
+                    continue
+
+                # Calculate pick number based on snake draft logic
+                new_pick_number = draft_priority.snake_pick(pick.round, draft_position, total_teams)
+
+                # Only update if pick number changed
+                if pick.pick != new_pick_number:
+                    moved_picks.append((pick, new_pick_number))
+
+            # Step 1: out of the way, to negative pick numbers unique per pick
+            for pick, new_pick_number in moved_picks:
+                pick.pick = -pick.id
+            DraftPick.objects.bulk_update([pick for pick, _ in moved_picks], ['pick'])
 
-            # Only update if pick number changed
-            if pick.pick != new_pick_number:
+            # Step 2: to the new pick numbers
+            for pick, new_pick_number in moved_picks:
                 pick.pick = new_pick_number
-                pick.save()
-                updated_count += 1
+            DraftPick.objects.bulk_update([pick for pick, _ in moved_picks], ['pick'])
+            # bulk_update sends no signals; saving the draft above already
+            # rebuilds the draft state on every worker once this commits
+
+            # Log the reorder, so picks based on the old board are refused,
+            # and broadcast it to all connected WebSocket clients
+            seq = draft_events.publish(draft_events.REORDER, {
+                'message': 'The draft order has changed',
+                'order': draft.order,
+                'slots': draft_events.slot_map()
+            }).seq
 
         return JsonResponse({
             'success': True,
-            'message': f'Draft order updated and {updated_count} picks recalculated'
+            'message': f'Draft order updated and {len(moved_picks)} picks recalculated',
+            'seq': seq
         })
 
+    except IntegrityError:
+        # A pick of a team left out of the order holds one of the new slots
+        return JsonResponse({
+            'error': 'The new order would put two picks in the same slot; include every team that has picks'
+        }, status=409)
     except Exception as e:
         return JsonResponse({
             'error': f'An error occurred: {str(e)}'
@@ -7519,7 +7390,6 @@ def delete_background_check_view(request, background_check_id):
 def get_general_setting(request):
     """Get a general setting value by key"""
     from django.http import JsonResponse
-    from .models import GeneralSetting
 
     try:
         key = request.GET.get('key', '').strip()
@@ -7530,20 +7400,11 @@ def get_general_setting(request):
                 'error': 'Please provide a setting key.'
             }, status=400)
 
-        setting = GeneralSetting.objects.filter(key=key).first()
-
-        if setting:
-            return JsonResponse({
-                'success': True,
-                'key': setting.key,
-                'value': setting.value
-            })
-        else:
-            return JsonResponse({
-                'success': True,
-                'key': key,
-                'value': None
-            })
+        return JsonResponse({
+            'success': True,
+            'key': key,
+            'value': general_settings.get(key)
+        })
 
     except Exception as e:
         return JsonResponse({
@@ -7593,8 +7454,7 @@ def save_general_setting(request):
 def shared_roster_view(request, roster_id):
     """Public read-only view of a roster for sharing with opposing team managers"""
     from django.shortcuts import render, get_object_or_404
-    from .models import Roster, GeneralSetting
-    import pytz
+    from .models import Roster
     import json
 
     # Get the roster (no team_secret needed - this is a public read-only view)
@@ -7603,8 +7463,7 @@ def shared_roster_view(request, roster_id):
     event = roster.event
 
     # Get display timezone
-    display_tz_setting = GeneralSetting.objects.filter(key='display_timezone').first()
-    display_tz = pytz.timezone(display_tz_setting.value) if display_tz_setting else pytz.UTC
+    display_tz = get_display_timezone()
 
     # Convert event timestamp to display timezone
     event_time_display = event.timestamp.astimezone(display_tz) if event else None
@@ -7620,21 +7479,13 @@ def shared_roster_view(request, roster_id):
     }
 
     # Get division settings
-    allow_four_outfielders_setting = GeneralSetting.objects.filter(key='allow_four_outfielders').first()
-    allow_four_outfielders = allow_four_outfielders_setting.value.lower() == 'true' if allow_four_outfielders_setting else False
-
-    allow_rover_position_setting = GeneralSetting.objects.filter(key='allow_rover_position').first()
-    allow_rover_position = allow_rover_position_setting.value.lower() == 'true' if allow_rover_position_setting else False
-
-    innings_per_game_setting = GeneralSetting.objects.filter(key='innings_per_game').first()
-    innings_per_game = int(innings_per_game_setting.value) if innings_per_game_setting else 6
-
-    allow_benched_players_setting = GeneralSetting.objects.filter(key='allow_benched_players').first()
-    allow_benched_players = allow_benched_players_setting.value.lower() == 'true' if allow_benched_players_setting else False
+    allow_four_outfielders = general_settings.get_bool('allow_four_outfielders')
+    allow_rover_position = general_settings.get_bool('allow_rover_position')
+    innings_per_game = general_settings.get_int('innings_per_game', 6)
+    allow_benched_players = general_settings.get_bool('allow_benched_players')
 
     # Get infield positions setting
-    infield_positions_setting = GeneralSetting.objects.filter(key='infield_positions').first()
-    infield_positions = json.loads(infield_positions_setting.value) if infield_positions_setting and infield_positions_setting.value else ['C', '1B', '2B', '3B', 'SS', 'P']
+    infield_positions = general_settings.get_json('infield_positions', ['C', '1B', '2B', '3B', 'SS', 'P'])
 
     # Calculate if team has enough players to show 4 outfielders
     base_positions = 9
@@ -7714,10 +7565,7 @@ def send_share_roster_email(request, roster_id):
     shared_roster_url = request.build_absolute_uri(f'/shared_roster/{roster.id}/')
 
     # Get display timezone for event date formatting
-    from .models import GeneralSetting
-    import pytz
-    display_tz_setting = GeneralSetting.objects.filter(key='display_timezone').first()
-    display_tz = pytz.timezone(display_tz_setting.value) if display_tz_setting else pytz.UTC
+    display_tz = get_display_timezone()
     event_date_display = event.timestamp.astimezone(display_tz).strftime('%B %d, %Y at %I:%M %p') if event.timestamp else 'TBD'
 
     # Prepare context for email templates